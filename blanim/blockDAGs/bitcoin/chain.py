@@ -23,11 +23,16 @@ Key Design Principles:
 Block Lifecycle:
 ---------------
 1. **Creation**: add_block() creates a BitcoinLogicalBlock and plays its
-   create_with_lines() animation, which handles block, label, and parent line creation
+   create_with_lines() animation, which handles block, label, and parent line creation,
+   together with the camera follow in the same play
 2. **Movement**: move() delegates to visual block's create_movement_animation(), which
    automatically updates connected parent and child lines
 3. **Highlighting**: Highlighting methods use visual block's animation methods for
    consistent fade/highlight/pulse effects
+4. **Level of detail**: with lod_enabled, blocks far behind the camera are removed from
+   the scene after each add_block() and drawn as one HistorySummary, styling only
+   touches visible_blocks; rehydrate_history() brings them all back. Blocks are kept
+   ordered by x, so each update only visits the history left of the cutoff
 
 Highlighting System:
 -------------------
@@ -42,15 +47,13 @@ return to their defined neutral state without needing to store temporary state.
 
 TODO / Future Improvements:
 ---------------------------
-1. **Refactor highlighting to use visual block methods**: Currently, _highlight_with_context()
-   manually constructs fade/highlight animations. Should use:
-   - BaseVisualBlock.create_fade_animation() for fading blocks
-   - BaseVisualBlock.create_reset_animation() for resetting to neutral state
-   - BaseVisualBlock.create_pulsing_highlight() instead of _create_pulse_updater()
-   This requires adding these methods to BaseVisualBlock first.
+1. **Refactor highlighting to use visual block methods**: Fades, highlights and resets are
+   built from the visual block style targets (get_fade_targets(), get_highlight_targets(),
+   get_reset_targets(), get_line_fade_targets()) and played as one BatchStyleAnimation.
+   Still to do: BaseVisualBlock.create_pulsing_highlight() instead of _create_pulse_updater().
 
-2. **Add line fade methods to visual block**: Parent line fading logic should move to
-   visual block layer with a create_line_fade_animation() method.
+2. **Add line fade methods to visual block**: Done, see get_line_fade_targets() and
+   get_line_reset_targets().
 
 3. **Fit everything better to the proxy pattern instead of accessing _visual_block directly(see 1)
 
@@ -69,24 +72,54 @@ from __future__ import annotations
 from typing import Optional, List, TYPE_CHECKING
 
 import numpy as np
-from manim import ShowPassingFlash, cycle_animation, Wait, UP, RIGHT, config
+from manim import Wait, UP, RIGHT
 
 from .logical_block import BitcoinLogicalBlock
 from .config import BitcoinConfig, DEFAULT_BITCOIN_CONFIG
+from ...core.block_hash import BlockHasher
+from ...core.batch_style import BatchStyleAnimation
+from ...core.parent_line import batch_line_updates
+from ...core.flash_pool import FlashLinePool
+from ...core.lod import HistorySummary, XOrderedHistory, history_cutoff_x
+from ...core.sprite import SpriteLayer
+from ...core.line_layer import DAGLineLayer
 
 if TYPE_CHECKING:
     from ...core.hud_2d_scene import HUD2DScene
 
 # noinspection PyProtectedMember
 class BitcoinDAG:
-    def __init__(self, scene: HUD2DScene, chain_config: BitcoinConfig = DEFAULT_BITCOIN_CONFIG):
+    def __init__(self, scene: HUD2DScene, chain_config: BitcoinConfig = DEFAULT_BITCOIN_CONFIG, seed: Optional[int] = None):
         self.scene = scene
         self.config = chain_config
+        self.hasher = BlockHasher(seed)
         self.blocks: dict[str, BitcoinLogicalBlock] = {}
         self.all_blocks: List[BitcoinLogicalBlock] = []
         self.genesis: Optional[BitcoinLogicalBlock] = None
         self.currently_highlighted_block: Optional[BitcoinLogicalBlock] = None
         self.flash_lines: List = []
+        self.flash_pool = FlashLinePool(scene)
+        # Rightmost block x, updated on creation (repositioning is vertical) and after move()
+        self.rightmost_x: Optional[float] = None
+        # Blocks collapsed into the history summary (kept in the DAG, removed from the scene)
+        self.collapsed: set[BitcoinLogicalBlock] = set()
+        # Visible and collapsed blocks ordered by x, so the LOD walks history from the left
+        self._visible_by_x: XOrderedHistory[BitcoinLogicalBlock] = XOrderedHistory()
+        self._collapsed_by_x: XOrderedHistory[BitcoinLogicalBlock] = XOrderedHistory()
+        self._collapsed_mobject_ids: set[int] = set()
+        self.history_summary: Optional[HistorySummary] = None
+        # Idle blocks drawn as raster sprites when sprite_mode is on
+        self.sprites = SpriteLayer(
+            scene,
+            blocks=lambda: [block._visual for block in self.visible_blocks],
+            enabled=lambda: self.config.sprite_mode,
+        )
+        # Idle parent lines drawn as one mobject per style when merge_idle_lines is on
+        self.line_layer = DAGLineLayer(
+            scene,
+            lines=lambda: [line for block in self.visible_blocks for line in block._visual.parent_lines],
+            enabled=lambda: self.config.merge_idle_lines,
+        )
 
     ########################################
     # Block Handling
@@ -111,20 +144,25 @@ class BitcoinDAG:
             parent=parent,
             position=position,
             bitcoin_config=self.config,
+            hash_value=self.hasher.hash_block(name, (parent.hash,) if parent else ()),
         )
 
         # Register and add to scene
         self.blocks[name] = block
         self.all_blocks.append(block)
+        self._visible_by_x.add(block, block._visual.square.get_right()[0])
 
         if parent is None:
             self.genesis = block
 
-        # NEW: Shift camera AFTER block object exists but BEFORE Create() animation
-        self.shift_camera_to_follow_blocks()
+        self.rightmost_x = position[0] if self.rightmost_x is None else max(self.rightmost_x, position[0])
 
-        # Play the creation animation
-        self.scene.play(block._visual.create_with_lines())
+        # Camera follows in the same play as the Create() animation
+        animations = [block._visual.create_with_lines()]
+        camera_animation = self.create_camera_follow_animation()
+        if camera_animation is not None:
+            animations.append(camera_animation)
+        self.scene.play(*animations)
 
         # Collect all repositioning animations
         all_animations = []
@@ -143,20 +181,33 @@ class BitcoinDAG:
 
         # Play all animations together in one unified animation
         if all_animations:
-            self.scene.play(*all_animations)
+            self.scene.play(*batch_line_updates(*all_animations))
 
         # NEW: Apply chain-length-based opacity after repositioning
         self._apply_chain_length_opacity()
 
+        self.update_history_lod()
+
         return block
 
+    @property
+    def visible_blocks(self) -> List[BitcoinLogicalBlock]:
+        """Blocks that are drawn in the scene (all blocks except collapsed history)."""
+        if not self.collapsed:
+            return self.all_blocks
+        return [block for block in self.all_blocks if block not in self.collapsed]
+
     def shift_camera_to_follow_blocks(self):
         """Shift camera to keep the rightmost blocks in view using Frame2DWrapper."""
-        if not self.all_blocks:
-            return
-
-            # Find the rightmost block position
-        rightmost_x = max(block._visual.square.get_center()[0] for block in self.all_blocks)
+        camera_animation = self.create_camera_follow_animation()
+        if camera_animation is not None:
+            self.scene.play(camera_animation, run_time=self.config.camera_follow_time)
+            self.update_history_lod()
+
+    def create_camera_follow_animation(self):
+        """Camera shift keeping the rightmost block in view, or None if no shift is needed."""
+        if self.rightmost_x is None:
+            return None
 
         # Calculate desired frame center (keep some margin on the right)
         margin = self.config.horizontal_spacing * 2
@@ -164,26 +215,27 @@ class BitcoinDAG:
         # Get current frame center using Frame2DWrapper's get_center()
         current_center = self.scene.camera.frame.get_center()
 
-        # Calculate how much we need to shift
-        frame_width = config["frame_width"]
+        # Calculate how much we need to shift (the frame's width, which follows zoom)
+        frame_width = self.scene.camera.frame.get_width()
         right_edge = current_center[0] + (frame_width / 2)
 
-        if rightmost_x > right_edge - margin:
+        if self.rightmost_x > right_edge - margin:
             # Calculate the shift needed
-            shift_amount = rightmost_x - (right_edge - margin)
+            shift_amount = self.rightmost_x - (right_edge - margin)
 
             # Use Frame2DWrapper's animate API
             # This creates a Frame2DAnimateWrapper, which HUD2DScene.play() handles
-            self.scene.play(
-                self.scene.camera.frame.animate.shift(RIGHT * shift_amount),
-                run_time=self.config.camera_follow_time
-            )
+            return self.scene.camera.frame.animate.shift(RIGHT * shift_amount)
+        return None
 
     def _apply_chain_length_opacity(self):
         """Apply opacity based on tip heights - only fade shorter forks."""
         if not self.all_blocks:
             return
 
+        # Collapsed history is not drawn, it is restyled when it is rehydrated
+        visible_blocks = self.visible_blocks
+
         # Find all tip blocks (blocks with no children)
         tips = [block for block in self.all_blocks if len(block.children) == 0]
 
@@ -198,19 +250,17 @@ class BitcoinDAG:
 
         # If all tips are at the same height, no fork exists - keep everything at full opacity
         if len(tips) == len(longest_tips):
-            opacity_animations = []
-            for block in self.all_blocks:
-                opacity_animations.extend([
-                    block._visual.square.animate.set_fill(opacity=block._visual.config.fill_opacity),
-                    block._visual.square.animate.set_stroke(opacity=block._visual.config.stroke_opacity),
-                    block._visual.label.animate.set_fill(opacity=block._visual.config.label_opacity)
+            opacity_targets = []
+            for block in visible_blocks:
+                opacity_targets.extend([
+                    (block._visual.square, {"fill_opacity": block._visual.config.fill_opacity,
+                                            "stroke_opacity": block._visual.config.stroke_opacity}),
+                    (block._visual.label, {"fill_opacity": block._visual.config.label_opacity}),
                 ])
                 for line in block._visual.parent_lines:
-                    opacity_animations.append(
-                        line.animate.set_stroke(opacity=block._visual.config.line_stroke_opacity)
-                    )
-            if opacity_animations:
-                self.scene.play(*opacity_animations)
+                    opacity_targets.append((line, {"stroke_opacity": block._visual.config.line_stroke_opacity}))
+            if opacity_targets:
+                self.scene.play(BatchStyleAnimation(opacity_targets))
             return
 
         # Collect all blocks on longest chains by walking back from longest tips
@@ -222,8 +272,8 @@ class BitcoinDAG:
                 current = current.parent
 
         # Apply opacity: full for longest chains, faded for shorter forks
-        opacity_animations = []
-        for block in self.all_blocks:
+        opacity_targets = []
+        for block in visible_blocks:
             if block in longest_chain_blocks:
                 # On longest chain - full opacity
                 target_fill_opacity = block._visual.config.fill_opacity
@@ -237,19 +287,16 @@ class BitcoinDAG:
                 target_label_opacity = block._visual.config.fade_opacity
                 target_line_opacity = block._visual.config.fade_opacity
 
-            opacity_animations.extend([
-                block._visual.square.animate.set_fill(opacity=target_fill_opacity),
-                block._visual.square.animate.set_stroke(opacity=target_stroke_opacity),
-                block._visual.label.animate.set_fill(opacity=target_label_opacity)
+            opacity_targets.extend([
+                (block._visual.square, {"fill_opacity": target_fill_opacity, "stroke_opacity": target_stroke_opacity}),
+                (block._visual.label, {"fill_opacity": target_label_opacity}),
             ])
 
             for line in block._visual.parent_lines:
-                opacity_animations.append(
-                    line.animate.set_stroke(opacity=target_line_opacity)
-                )
+                opacity_targets.append((line, {"stroke_opacity": target_line_opacity}))
 
-        if opacity_animations:
-            self.scene.play(*opacity_animations)
+        if opacity_targets:
+            self.scene.play(BatchStyleAnimation(opacity_targets))
 
     def _calculate_position(self, parent: Optional[BitcoinLogicalBlock]) -> tuple[float, float]:
         """Calculate position for a block based on parent and siblings.
@@ -525,7 +572,83 @@ class BitcoinDAG:
             )
 
         if animations:
-            self.scene.play(*animations)
+            self.scene.play(*batch_line_updates(*animations))
+            self.rightmost_x = max(b._visual.square.get_center()[0] for b in self.all_blocks)
+            for block in blocks:
+                history = self._collapsed_by_x if block in self.collapsed else self._visible_by_x
+                history.add(block, block._visual.square.get_right()[0])
+
+    ########################################
+    # Level of Detail
+    ########################################
+
+    def update_history_lod(self) -> None:
+        """Collapse blocks far behind the camera into a summary, rehydrate blocks back in range."""
+        if not self.config.lod_enabled:
+            return
+        cutoff = history_cutoff_x(self.scene.camera.frame, self.config.lod_frames_behind)
+        highlighted = self.currently_highlighted_block
+        behind = [block for block in self._visible_by_x.before(cutoff) if block is not highlighted]
+        back = self._collapsed_by_x.from_x(cutoff)
+        if highlighted in self.collapsed and highlighted not in back:
+            back.append(highlighted)
+        self._update_collapsed(behind, back)
+
+    def rehydrate_history(self) -> None:
+        """Bring every collapsed block back into the scene."""
+        self._update_collapsed([], list(self._collapsed_by_x))
+
+    def _update_collapsed(
+            self,
+            newly_collapsed: List[BitcoinLogicalBlock],
+            rehydrated: List[BitcoinLogicalBlock]
+    ) -> None:
+        self.collapsed.update(newly_collapsed)
+        self.collapsed.difference_update(rehydrated)
+        self._visible_by_x.remove_many(newly_collapsed)
+        self._collapsed_by_x.remove_many(rehydrated)
+        self._collapsed_by_x.add_many((block, block._visual.square.get_right()[0]) for block in newly_collapsed)
+        self._visible_by_x.add_many((block, block._visual.square.get_right()[0]) for block in rehydrated)
+        for block in rehydrated:
+            self._collapsed_mobject_ids.difference_update(id(mob) for mob in (block._visual, *block._visual.parent_lines))
+
+        # Repositioning plays may have put collapsed blocks back into the scene
+        removed = [mob for mob in self.scene.mobjects if id(mob) in self._collapsed_mobject_ids]
+        for block in newly_collapsed:
+            self.sprites.forget(block._visual)
+            mobjects = (block._visual, *block._visual.parent_lines)
+            self._collapsed_mobject_ids.update(id(mob) for mob in mobjects)
+            removed.extend(mobjects)
+        if removed:
+            self.scene.remove(*removed)
+
+        if rehydrated:
+            # Styling skipped collapsed blocks, bring them back in the neutral style
+            reset_targets = []
+            for block in rehydrated:
+                reset_targets.extend(block._visual.get_reset_targets())
+                reset_targets.extend(block._visual.get_line_reset_targets())
+            BatchStyleAnimation.apply(reset_targets)
+            self.scene.add(*[mob for block in rehydrated for mob in (block._visual, *block._visual.parent_lines)])
+
+        if not self.collapsed:
+            if self.history_summary is not None:
+                self.scene.remove(self.history_summary)
+            return
+        if not newly_collapsed and not rehydrated:
+            return
+
+        squares = [block._visual.square for block in self.collapsed]
+        if self.history_summary is None:
+            self.history_summary = HistorySummary(color=self.config.block_color)
+        self.history_summary.set_range(
+            min(square.get_left()[0] for square in squares),
+            self._collapsed_by_x.last_x(),
+            min(square.get_bottom()[1] for square in squares),
+            max(square.get_top()[1] for square in squares),
+            len(self.collapsed),
+        )
+        self.scene.add(self.history_summary)
 
     ########################################
     # Get Past/Future/Anticone Blocks
@@ -640,74 +763,55 @@ class BitcoinDAG:
             context_blocks = []
 
         # Fade non-context blocks (always fade unrelated blocks)
-        fade_animations = []
-        for block in self.all_blocks:
+        fade_targets = []
+        for block in self.visible_blocks:
             if block not in context_blocks and block != focused_block:
-                fade_animations.extend([
-                    block._visual.square.animate.set_fill(opacity=fade_opacity),
-                    block._visual.square.animate.set_stroke(opacity=fade_opacity),
-                    block._visual.label.animate.set_fill(opacity=fade_opacity)
-                ])
-                for line in block._visual.parent_lines:
-                    fade_animations.append(line.animate.set_stroke(opacity=fade_opacity))
+                fade_targets.extend(block._visual.get_fade_targets())
+                fade_targets.extend(block._visual.get_line_fade_targets())
 
         # Fade focused block's parent line if parent is not in context
         if focused_block._visual.parent_lines:
             parent_block = focused_block.parent
             if parent_block and parent_block not in context_blocks:
-                fade_animations.append(
-                    focused_block._visual.parent_lines[0].animate.set_stroke(opacity=fade_opacity)
-                )
+                fade_targets.append((focused_block._visual.parent_lines[0], {"stroke_opacity": fade_opacity}))
 
-        if fade_animations:
-            self.scene.play(*fade_animations)
+        if fade_targets:
+            self.scene.play(BatchStyleAnimation(fade_targets))
 
         # Add pulsing white stroke to focused block (using updater)
         pulse_updater = self._create_pulse_updater()
         focused_block._visual.square.add_updater(pulse_updater)
 
         # Highlight context blocks with yellow stroke and increased width(highlight_stroke_width)
-        context_animations = []
+        highlight_targets = []
         for block in context_blocks:
-            context_animations.extend([
-                block._visual.square.animate.set_stroke(
-                    highlight_color,
-                    width=self.config.highlight_stroke_width
-                )
-            ])
+            if block not in self.collapsed:
+                highlight_targets.extend(block._visual.get_highlight_targets(highlight_color))
 
-        if context_animations:
-            self.scene.play(*context_animations)
+        if highlight_targets:
+            self.scene.play(BatchStyleAnimation(highlight_targets))
         else:
             # Play a minimal wait to commit the fade state
             self.scene.play(Wait(0.01))
 
-        # Flash connections using cycle_animation (non-blocking)
-        flash_lines = []
+        # Flash connections with pooled overlays (non-blocking, no line copies)
+        flash_sources = []
         if flash_connections:
             for block in context_blocks:
-                if block._visual.parent_lines:
-                    # Create a copy of the line with highlight color
-                    flash_line = block._visual.parent_lines[0].copy().set_color(highlight_color)
-                    self.scene.add(flash_line)
-                    flash_lines.append(flash_line)
-
-                    # Apply cycle_animation to make it flash
-                    cycle_animation(
-                        ShowPassingFlash(flash_line, time_width=0.5, run_time=line_cycle_time)#run_time sets cycle time
-                    )
+                if block not in self.collapsed:
+                    flash_sources.extend(block._visual.parent_lines)
 
             # Flash focused block's parent line only if parent is in context
             if focused_block._visual.parent_lines and focused_block.parent in context_blocks:
-                flash_line = focused_block._visual.parent_lines[0].copy().set_color(highlight_color)
-                self.scene.add(flash_line)
-                flash_lines.append(flash_line)
-                cycle_animation(
-                    ShowPassingFlash(flash_line, time_width=0.5, run_time=line_cycle_time)
-                )
-
-        # Return the flash line copies (not originals) for cleanup
-        return flash_lines
+                flash_sources.extend(focused_block._visual.parent_lines)
+
+        # Return the flash overlays (not originals) for cleanup
+        return self.flash_pool.flash(
+            flash_sources,
+            color=highlight_color,
+            width=self.config.line_stroke_width,
+            cycle_time=line_cycle_time#sets cycle time
+        )
 
     def reset_highlighting(self):
         """Reset all blocks to neutral state from config."""
@@ -717,34 +821,18 @@ class BitcoinDAG:
                 self.currently_highlighted_block._visual.square.updaters[-1]
             )
 
-        # Remove flash line copies from scene
-        for flash_line in self.flash_lines:
-            self.scene.remove(flash_line)
+        # Remove flash overlays from scene, the pool keeps them for reuse
+        self.flash_pool.release_all()
         self.flash_lines = []
 
         # Reset ALL blocks to original styling from config
-        reset_animations = []
-        for block in self.all_blocks:
-            reset_animations.extend([
-                block._visual.square.animate.set_fill(opacity=self.config.fill_opacity),
-                block._visual.square.animate.set_stroke(
-                    self.config.stroke_color,
-                    width=self.config.stroke_width,
-                    opacity=self.config.stroke_opacity
-                ),
-                block._visual.label.animate.set_fill(opacity=self.config.label_opacity)
-            ])
-            for line in block._visual.parent_lines:
-                reset_animations.append(
-                    line.animate.set_stroke(
-                        self.config.line_color,
-                        width=self.config.line_stroke_width,
-                        opacity=self.config.line_stroke_opacity
-                    )
-                )
+        reset_targets = []
+        for block in self.visible_blocks:
+            reset_targets.extend(block._visual.get_reset_targets())
+            reset_targets.extend(block._visual.get_line_reset_targets())
 
         # Clear the tracked state
         self.currently_highlighted_block = None
 
-        if reset_animations:
-            self.scene.play(*reset_animations)
\ No newline at end of file
+        if reset_targets:
+            self.scene.play(BatchStyleAnimation(reset_targets))
\ No newline at end of file
@@ -34,6 +34,7 @@ class BitcoinConfig(BaseBlockConfig):
     label_font_size: int = 24
     label_color: ParsableManimColor = WHITE
     label_opacity: float = 1.0
+    label_font: str = ""  # Font family for labels, "" uses Manim's default
 
     # ========================================
     # VISUAL STYLING - Line Appearance
@@ -79,5 +80,13 @@ class BitcoinConfig(BaseBlockConfig):
     horizontal_spacing: float = 2.0
     vertical_spacing: float = 1.0  # For parallel blocks during forks
 
+    # ========================================
+    # LEVEL OF DETAIL
+    # ========================================
+    lod_enabled: bool = False  # Collapse blocks far behind the camera into a single summary mobject
+    lod_frames_behind: float = 1.0  # Frame widths left of the camera before blocks are collapsed
+    sprite_mode: bool = False  # Draw blocks that are not animated as cached raster sprites
+    merge_idle_lines: bool = False  # Draw lines that are not animated as one multi-path mobject per line style
+
 # Default configuration instance
 DEFAULT_BITCOIN_CONFIG = BitcoinConfig()
\ No newline at end of file
@@ -17,11 +17,12 @@ class BitcoinLogicalBlock:
             name: str,
             parent: Optional[BitcoinLogicalBlock] = None,
             position: tuple[float, float] = (0, 0),
-            bitcoin_config: BitcoinConfig = DEFAULT_BITCOIN_CONFIG
+            bitcoin_config: BitcoinConfig = DEFAULT_BITCOIN_CONFIG,
+            hash_value: Optional[int] = None
     ):
         # Identity
         self.name = name
-        self.hash = id(self)
+        self.hash = hash_value if hash_value is not None else id(self)
 
         # DAG structure (single source of truth)
         self.parent = parent
@@ -14,6 +14,7 @@ from ... import BaseVisualBlock, ParentLine
 
 if TYPE_CHECKING:
     from .logical_block import BitcoinLogicalBlock
+    from ...core.batch_style import StyleTarget
 
 # noinspection PyProtectedMember
 class BitcoinVisualBlock(BaseVisualBlock):
@@ -123,6 +124,7 @@ class BitcoinVisualBlock(BaseVisualBlock):
             )
             parent_line.set_z_index(1)
             self.parent_lines.append(parent_line)
+            parent.child_lines.append(parent_line)
         else:
             self.parent_lines = []
 
@@ -248,9 +250,14 @@ class BitcoinVisualBlock(BaseVisualBlock):
             animations.append(self.parent_lines[0].create_update_animation())  # Fixed: access first element
 
         # Update child lines (lines from children pointing to this block)
-        for logical_child in self.logical_block.children:
-            if logical_child._visual.parent_lines:  # Fixed: check if list is non-empty
-                animations.append(
-                    logical_child._visual.parent_lines[0].create_update_animation())  # Fixed: access first element
+        animations.extend([line.create_update_animation() for line in self.child_lines])
 
         return AnimationGroup(*animations) if len(animations) > 1 else animation
+
+    def get_line_reset_targets(self) -> list[StyleTarget]:
+        """Style targets resetting the parent line to its config style."""
+        return [(line, {
+            "stroke_color": self.bitcoin_config.line_color,
+            "stroke_width": self.bitcoin_config.line_stroke_width,
+            "stroke_opacity": self.bitcoin_config.line_stroke_opacity,
+        }) for line in self.parent_lines]
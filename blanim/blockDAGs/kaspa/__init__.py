@@ -4,11 +4,15 @@ from .logical_block import KaspaLogicalBlock
 from .visual_block import KaspaVisualBlock
 from .config import KaspaConfig, DEFAULT_KASPA_CONFIG, _KaspaConfigInternal
 from .dag import KaspaDAG
+from .dag_io import BlockRecord, read_dag_file, write_binary
 __all__ = [
     "KaspaVisualBlock",
     "KaspaConfig",
     "_KaspaConfigInternal",
     "DEFAULT_KASPA_CONFIG",
     "KaspaLogicalBlock",
-    "KaspaDAG"
+    "KaspaDAG",
+    "BlockRecord",
+    "read_dag_file",
+    "write_binary"
 ]
@@ -27,6 +27,7 @@ class KaspaConfig(TypedDict, total=False):
     label_font_size: int
     label_color: ParsableManimColor
     label_opacity: float
+    label_font: str
 
     # Visual Styling - Line Appearance
     selected_parent_line_color: ParsableManimColor
@@ -36,9 +37,11 @@ class KaspaConfig(TypedDict, total=False):
 
     # Animation Timing
     create_run_time: float
+    batch_lag_ratio: float
     label_change_run_time: float
     movement_run_time: float
     camera_follow_time: float
+    predictive_camera_follow: bool
 
     # Highlighting Behavior
     context_block_color: ParsableManimColor
@@ -48,8 +51,15 @@ class KaspaConfig(TypedDict, total=False):
     highlight_line_color: ParsableManimColor
     highlight_stroke_width: float
     fade_opacity: float
+    viewport_culling: bool
+    viewport_margin: float
+    lod_enabled: bool
+    lod_frames_behind: float
+    sprite_mode: bool
+    merge_idle_lines: bool
     flash_connections: bool
     highlight_line_cycle_time: float
+    combined_flash_overlay: bool
 
     # Spatial Layout
     genesis_x: float
@@ -131,6 +141,7 @@ class _KaspaConfigInternal(BaseBlockConfig):
     label_font_size: int = 24
     label_color: ParsableManimColor = WHITE
     label_opacity: float = 1.0
+    label_font: str = "" # Font family for labels, "" uses Manim's default
 
     # ========================================
     # VISUAL STYLING - Line Appearance
@@ -144,9 +155,11 @@ class _KaspaConfigInternal(BaseBlockConfig):
     # ANIMATION TIMING
     # ========================================
     create_run_time: float = 2.0
+    batch_lag_ratio: float = 0.1  # Stagger between block creations when several blocks share one play
     label_change_run_time: float = 1.0
     movement_run_time: float = 1.0
     camera_follow_time: float = 1.0
+    predictive_camera_follow: bool = True  # Camera tracks each block of a batched creation instead of one straight move
 
     # ========================================
     # HIGHLIGHTING BEHAVIOR
@@ -163,8 +176,16 @@ class _KaspaConfigInternal(BaseBlockConfig):
 
     fade_opacity: float = 0.1 # Opacity to fade unrelated blocks(and lines) to during a highlight animation
 
+    viewport_culling: bool = True # Only animate style changes on screen, apply them instantly off screen
+    viewport_margin: float = 1.0 # Extra distance around the camera frame still treated as on screen
+    lod_enabled: bool = False # Collapse blocks far behind the camera into a single summary mobject
+    lod_frames_behind: float = 1.0 # Frame widths left of the camera before blocks are collapsed
+    sprite_mode: bool = False # Draw blocks that are not animated as cached raster sprites (large overview scenes)
+    merge_idle_lines: bool = False # Draw lines that are not animated as one multi-path mobject per line style
+
     flash_connections: bool = True # Directional flash animation cycling on lines
     highlight_line_cycle_time = 1 # Time for a single flash to pass on lines
+    combined_flash_overlay: bool = False # Draw all flashing lines as one mobject (single style for every flash)
 
     # ========================================
     # SPATIAL LAYOUT - Genesis Position
@@ -34,21 +34,54 @@ The system supports three workflow patterns:
    - `add_block(parents=[...])` creates and animates a block immediately
    - `add_blocks([(parents, name), ...])` batch-creates and animates multiple blocks
 
-#TODO get rid of this functionality, blocks should be creaded and drwan and others shift and camera shift all within the same animation
 2. **Step-by-step (fine-grained control)**:
    - `create_block(parents=[...])` creates logical block without animation
-   - `next_step()` animates the next pending step (block creation or repositioning)
+   - `next_step()` animates the next pending step (block creation, column shift and camera
+     follow share one play)
    - Allows inserting custom animations/narration between steps at scene level
 
 3. **Batch with catch-up**:
    - Create multiple blocks with `create_block()`
-   - `catch_up()` completes all pending animations at once
+   - `catch_up()` completes all pending animations at once, merging consecutive compatible
+     steps (creations without parents in the same run, moves of disjoint blocks) into one play
 
 4. **Simulation-based generation**:
    - `simulate_blocks(duration, bps, delay)` generates block structure
    - `create_blocks_from_simulator_list()` converts to visual blocks
+   - `create_blocks_from_simulator_list(blocks, batch_size=..., batch_time_ms=...)` creates
+     each group of blocks in a single play (dozens of plays instead of hundreds)
    - Models realistic network conditions with propagation delays
 
+5. **Importing node dumps**:
+   - `load_dag_file(path, window=(start, stop))` bulk-loads a JSONL/binary dump
+     (see dag_io) without visuals, then builds visuals only for the window
+   - `get_block_by_hash(hash)` maps a node hash to the imported block
+
+6. **Snapshots**:
+   - `save_snapshot(path)` stores the computed DAG; `load_snapshot(path)` restores it
+     without re-simulating, recomputing GHOSTDAG or re-laying out blocks
+   - `KaspaDAG(scene, seed=...)` seeds the simulator and the block hashes (tie-breakers),
+     so identical scene code renders identical animations and reuses Manim's cache
+
+7. **Streaming (long-running simulations)**:
+   - `stream_blocks(bps, delay, duration=None)` lazily yields simulator blocks
+   - `create_blocks_from_stream(stream, window_seconds)` computes GHOSTDAG as each
+     block arrives and only keeps blocks inside a sliding time window on screen
+   - Blocks leaving the window are retired: removed from the scene and detached
+     from the DAG, so memory and per-block cost stay flat for any stream length
+
+8. **Level of detail (long scrolling scenes)**:
+   - With `lod_enabled`, blocks more than `lod_frames_behind` frame widths behind the
+     camera are collapsed after each creation: removed from the scene (still part of
+     the DAG) and drawn as one HistorySummary strip with a block count
+   - Collapsed blocks are rehydrated when they come back in range, when they are parents
+     of new blocks, or before operations walking the history (GHOSTDAG, parent chain
+     scroll); `rehydrate_history()` brings all of them back
+   - With `sprite_mode`, blocks that are not animated are drawn as cached raster sprites
+     (SpriteLayer) and switch back to vectors whenever a play animates them
+   - With `merge_idle_lines`, lines that are not animated are drawn as one multi-path
+     mobject per line style (DAGLineLayer)
+
 Block Positioning:
 -----------------
 - Blocks are positioned right (x+) of their rightmost parent
@@ -87,6 +120,8 @@ Block Simulation:
 BlockSimulator handles realistic DAG generation using network parameters:
 
 - simulate_blocks(duration, bps, delay): Generate blocks with network delay simulation
+- stream_blocks(bps, delay, duration=None): Generator variant that tracks tips
+  incrementally and holds only blocks still inside the network delay window
 - Exponential mining intervals model real Kaspa block arrival times
 - Network delay determines parent visibility for realistic DAG structures
 - create_blocks_from_simulator_list(): Convert simulator output to actual blocks
@@ -99,9 +134,8 @@ updating all connected parent and child lines to maintain DAG visual connectivit
 State Tracking:
 --------------
 - `pending_blocks`: Blocks created but not yet animated
-- `workflow_steps`: Queue of animation functions to execute
-- `pending_repositioning`: Set of x-positions needing column recentering
-- `next_step()` auto-detects when to queue repositioning after all block creations
+- `workflow_steps`: Queue of declarative WorkflowStep entries (create / move / camera)
+- `catch_up()` coalesces compatible steps and drops no-op steps
 
 TODO / Future Improvements:
 ---------------------------
@@ -114,22 +148,38 @@ from __future__ import annotations
 
 __all__ = ["KaspaDAG"]
 
+import json
 import math
-from typing import Optional, List, TYPE_CHECKING, Set, Callable
+import zlib
+from dataclasses import dataclass, field, fields
+from collections import deque
+from typing import Optional, List, TYPE_CHECKING, Set, Callable, Iterable, Iterator
 
 import numpy as np
-from manim import Wait, RIGHT, config, AnimationGroup, Animation, UpdateFromFunc, Indicate, RED, ORANGE, YELLOW, logger, \
+from manim import ManimColor, ParsableManimColor, LaggedStart, Wait, RIGHT, AnimationGroup, Animation, UpdateFromAlphaFunc, Indicate, RED, ORANGE, YELLOW, logger, \
     linear
 
 from .logical_block import KaspaLogicalBlock
+from .dag_io import read_dag_file
 from .config import KaspaConfig, DEFAULT_KASPA_CONFIG, _KaspaConfigInternal
+from ...core.block_hash import BlockHasher
+from ...core.batch_style import BatchStyleAnimation
+from ...core.parent_line import batch_line_updates
+from ...core.flash_pool import FlashLinePool
+from ...core.lod import HistorySummary, XOrderedHistory, history_cutoff_x
+from ...core.sprite import SpriteLayer
+from ...core.line_layer import DAGLineLayer
 
 if TYPE_CHECKING:
     from ...core.hud_2d_scene import HUD2DScene
+    from ...core.parent_line import ParentLine
+    from ...core.batch_style import StyleTarget
+    from .visual_block import KaspaVisualBlock
 
 class KaspaDAG:
-    def __init__(self, scene: HUD2DScene):
+    def __init__(self, scene: HUD2DScene, seed: Optional[int] = None):
         self.scene = scene
+        self.seed = seed
         self.config_manager = KaspaConfigManager(_KaspaConfigInternal(**DEFAULT_KASPA_CONFIG.__dict__))
 
         # Initialize components
@@ -139,15 +189,32 @@ class KaspaDAG:
         self.retrieval = BlockRetrieval(self)
         self.relationship_highlighter = RelationshipHighlighter(self)
         self.ghostdag_highlighter = GhostDAGHighlighter(self)
-        self.simulator = BlockSimulator(self)
-
+        self.simulator = BlockSimulator(self, seed)
+        self.hasher = BlockHasher(seed)
+        self.streamer = BlockStreamer(self)
+        self.importer = DAGImporter(self)
+        self.snapshots = SnapshotManager(self)
+        self.lod = HistoryLOD(self)
+        self.sprites = SpriteLayer(
+            scene,
+            blocks=lambda: [block.visual_block for block in self.rendered_blocks],
+            enabled=lambda: self.config.sprite_mode,
+        )
+        self.line_layer = DAGLineLayer(
+            scene,
+            lines=lambda: [
+                line for block in self.rendered_blocks for line in block.visual_block.parent_lines
+                if line not in self.lod.hidden_lines
+            ],
+            enabled=lambda: self.config.merge_idle_lines,
+        )
 
         self.blocks: dict[str, KaspaLogicalBlock] = {}
         self.all_blocks: List[KaspaLogicalBlock] = []
         self.genesis: Optional[KaspaLogicalBlock] = None
 
         # NEW: State tracking for step-by-step workflow
-        self.workflow_steps: List[Callable] = []
+        self.workflow_steps: deque[WorkflowStep | Callable] = deque()
 
         # CRITICAL: Enable z-index rendering
         self.scene.renderer.camera.use_z_index = True
@@ -171,6 +238,43 @@ class KaspaDAG:
         self.config_manager.apply_config(user_config, len(self.all_blocks) > 0)
         return self
 
+    def set_seed(self, seed: Optional[int]) -> 'KaspaDAG':
+        """Seed the block simulator and block hashes so DAGs render identically between runs."""
+        self.seed = seed
+        self.simulator.set_seed(seed)
+        self.hasher.set_seed(seed)
+        return self
+
+    ########################################
+    # Snapshots
+    ########################################
+
+    def save_snapshot(self, path: str) -> None:
+        """Save the fully computed logical DAG (structure, GHOSTDAG, layout, config)."""
+        self.snapshots.save(path)
+
+    def load_snapshot(self, path: str) -> 'KaspaDAG':
+        """Restore a saved DAG into this (empty) DAG, rebuilding only the visuals."""
+        self.snapshots.load(path)
+        return self
+
+    @property
+    def rendered_blocks(self) -> List[KaspaLogicalBlock]:
+        """Blocks that currently have a visual block (all blocks unless imported with a window or collapsed)."""
+        return [block for block in self.all_blocks if block.visual_block is not None]
+
+    ########################################
+    # Level of Detail
+    ########################################
+
+    def collapse_history(self) -> None:
+        """Collapse blocks far behind the camera into a summary now (needs lod_enabled)."""
+        self.lod.update()
+
+    def rehydrate_history(self) -> None:
+        """Bring every collapsed block back into the scene."""
+        self.lod.rehydrate()
+
     ########################################
     # Block Retrieval #Complete
     ########################################
@@ -223,6 +327,14 @@ class KaspaDAG:
         """Queue a block that will be created later."""
         return self.block_manager.queue_block(timestamp, parents, name)
 
+    def queue_move(self, blocks: List[BlockPlaceholder | KaspaLogicalBlock], positions: List[tuple[float, float]]) -> None:
+        """Queue a move that runs on next_step/catch_up (merged with adjacent disjoint moves)."""
+        self.block_manager.queue_move(blocks, positions)
+
+    def queue_camera_follow(self) -> None:
+        """Queue a camera follow (absorbed into a preceding creation play when possible)."""
+        self.block_manager.queue_camera_follow()
+
     def next_step(self)-> None:
         """Play next pending block creation/shift animation"""
         self.block_manager.next_step()
@@ -239,6 +351,10 @@ class KaspaDAG:
         """Add multiple blocks and complete all animations automatically."""
         return self.block_manager.add_blocks(blocks_data)
 
+    def create_blocks_batch(self, blocks_data: List[tuple[Optional[List[KaspaLogicalBlock]], Optional[float]]]) -> List[KaspaLogicalBlock]:
+        """Create several blocks in a single play. Entries are (parents, timestamp)."""
+        return self.block_manager.create_blocks_batch(blocks_data)
+
     ########################################
     # Highlighting Relationships
     ########################################
@@ -288,15 +404,57 @@ class KaspaDAG:
         """
         return self.simulator.simulate_blocks(duration_seconds, blocks_per_second, network_delay_ms)
 
+    def stream_blocks(self, blocks_per_second: float, network_delay_ms: float, duration_seconds: Optional[float] = None) -> Iterator[dict]:
+        """
+        Lazily simulate blocks, yielding each block dictionary as it is mined.
+
+        Unlike simulate_blocks, nothing is materialized up front, so the stream
+        may be unbounded (duration_seconds=None).
+
+        Args:
+            blocks_per_second: Network block rate
+            network_delay_ms: Propagation delay in milliseconds
+            duration_seconds: Optional simulation duration in seconds
+
+        Returns:
+            Iterator of simulated block dictionaries ready for DAG integration
+        """
+        return self.simulator.stream_blocks(blocks_per_second, network_delay_ms, duration_seconds)
+
+    def create_blocks_from_stream(self, block_stream: Iterable[dict], window_seconds: float) -> int:
+        """
+        Consume a block stream, keeping only a sliding time window of blocks alive.
+
+        Args:
+            block_stream: Iterable of simulator block dictionaries (see stream_blocks)
+            window_seconds: Blocks older than this (relative to the newest block) are retired
+
+        Returns:
+            Number of blocks created from the stream
+        """
+        return self.streamer.create_blocks_from_stream(block_stream, window_seconds)
+
     #TODO finish refactoring
     def create_blocks_from_simulator_list(
             self,
-            simulator_blocks: List[dict]
+            simulator_blocks: List[dict],
+            batch_size: Optional[int] = None,
+            batch_time_ms: Optional[float] = None
     ) -> List[KaspaLogicalBlock]:
         """
         Convert simulator block dictionaries to actual KaspaLogicalBlock objects.
         The simulator list is already ordered by creation time.
+
+        By default every block gets its own play. Passing batch_size and/or
+        batch_time_ms groups consecutive blocks (at most batch_size blocks, or
+        blocks within batch_time_ms of the first block in the group) and creates
+        each group in a single play, see BlockManager.create_blocks_batch.
         """
+        if batch_size is not None or batch_time_ms is not None:
+            return self.block_manager.create_blocks_from_simulator_list_batched(
+                simulator_blocks, batch_size, batch_time_ms
+            )
+
         # Get tips once at the start (before any blocks are created)
         initial_tips = self.get_current_tips()
 
@@ -332,6 +490,36 @@ class KaspaDAG:
 
         return created_blocks
 
+    ########################################
+    # Import Node Dumps
+    ########################################
+
+    def load_dag_file(
+            self,
+            path: str,
+            window: Optional[tuple[int, int]] = None,
+            verify_blue_scores: bool = False,
+            animate: bool = False
+    ) -> int:
+        """
+        Bulk-load a block DAG dump (JSONL or compact binary) into the DAG.
+
+        Args:
+            path: File to load (see dag_io for the formats)
+            window: (start, stop) record indices within the file that get visuals,
+                None for no visuals at all
+            verify_blue_scores: Recompute GHOSTDAG and warn where it disagrees with the file
+            animate: Animate window creation instead of adding it instantly
+
+        Returns:
+            Number of blocks loaded
+        """
+        return self.importer.load(path, window, verify_blue_scores, animate)
+
+    def get_block_by_hash(self, block_hash: str) -> Optional[KaspaLogicalBlock]:
+        """Get an imported block by its external (node) hash."""
+        return self.importer.get_block(block_hash)
+
     ########################################
     # Highlight Parent Chain
     ########################################
@@ -377,45 +565,51 @@ class KaspaDAG:
             if start_block is None:
                 return
 
+        # Scrolling back to genesis passes through collapsed history
+        self.lod.rehydrate()
+
                 # Get the selected parent chain
         parent_chain = []
         current = start_block
         while current is not None:
             parent_chain.append(current)
             current = current.selected_parent
+            if current is not None and self.blocks.get(current.name) is not current:
+                break  # Selected parent was retired by a BlockStreamer
             if current and current.name == "Gen":
                 parent_chain.append(current)
                 break
 
                 # Fade all blocks except parent chain
         parent_chain_set = set(parent_chain)
-        fade_animations = []
+        fade_targets = []
+        faded_blocks = []
+        restyled_lines = []
 
-        for block in self.all_blocks:
+        for block in self.rendered_blocks:
             if block not in parent_chain_set:
-                fade_animations.extend(block.visual_block.create_fade_animation())
+                fade_targets.extend(block.visual_block.get_fade_targets())
                 # Fade ALL lines from non-chain blocks
-                for line in block.visual_block.parent_lines:
-                    fade_animations.append(
-                        line.animate.set_stroke(opacity=self.config.fade_opacity)
-                    )
+                fade_targets.extend(block.visual_block.get_line_fade_targets())
+                faded_blocks.append(block)
+                restyled_lines.extend(block.visual_block.parent_lines)
 
-                    # Handle lines for parent chain blocks - fade all except selected parent (index 0)
+                    # Handle lines for parent chain blocks - fade all except selected parent line
         for block in parent_chain:
-            for i, line in enumerate(block.visual_block.parent_lines):
-                if i == 0:
-                    # Keep selected parent line at full opacity
-                    fade_animations.append(
-                        line.animate.set_stroke(opacity=1.0)
-                    )
-                else:
-                    # Fade all other parent lines from this block
-                    fade_animations.append(
-                        line.animate.set_stroke(opacity=self.config.fade_opacity)
-                    )
+            if block.visual_block is None:
+                continue
+            for line in block.visual_block.parent_lines:
+                # Keep selected parent line at full opacity, fade all other parent lines from this block
+                opacity = 1.0 if line.is_selected else self.config.fade_opacity
+                fade_targets.append((line, {"stroke_opacity": opacity}))
+                restyled_lines.append(line)
 
-        if fade_animations:
-            self.scene.play(*fade_animations)
+        # Styles changed here are restored by the next reset_highlighting
+        self.relationship_highlighter.mark_dirty(faded_blocks, restyled_lines)
+
+        fade_animation = self.movement.create_style_animation(fade_targets)
+        if fade_animation is not None:
+            self.scene.play(fade_animation)
 
             # Calculate scroll to genesis position (x-axis only)
         if parent_chain:
@@ -608,7 +802,22 @@ class BlockPlaceholder:
             raise ValueError(f"Block {self.name} hasn't been created yet - call next_step() first")
         return getattr(self.actual_block, attr)
 
-# TODO modify so camera movement is part of same animation as create and move
+@dataclass
+class WorkflowStep:
+    """Declarative description of one queued workflow step.
+
+    kind is "create" (placeholder, timestamp, parents, name), "move" (blocks,
+    positions) or "camera". BlockManager decides at run time how many steps
+    share a play and drops steps with nothing left to do.
+    """
+    kind: str
+    placeholder: Optional[BlockPlaceholder] = None
+    timestamp: Optional[float] = None
+    parents: List = field(default_factory=list)
+    name: Optional[str] = None
+    blocks: List = field(default_factory=list)
+    positions: List[tuple[float, float]] = field(default_factory=list)
+
 class BlockManager:
     """Handles block creation, queuing, and workflow management."""
 
@@ -616,158 +825,291 @@ class BlockManager:
         self.dag = dag
 
     def queue_block(self, timestamp, parents=None, name=None) -> BlockPlaceholder:
-        """Queue block creation with mirroring positioning animation."""
-
+        """Queue block creation, laid out with the column mirroring used by create_blocks_batch."""
         placeholder = BlockPlaceholder(self, timestamp, parents, name)
+        self.dag.workflow_steps.append(
+            WorkflowStep(kind="create", placeholder=placeholder, timestamp=timestamp, parents=parents or [], name=name)
+        )
+        return placeholder
 
-        def create_and_reposition_together():
-            # Resolve parent placeholders to actual blocks
-            resolved_parents = []
-            if parents:
-                for p in parents:
-                    if isinstance(p, BlockPlaceholder):
-                        if p.actual_block is None:
-                            raise ValueError(f"Parent block hasn't been created yet")
-                        resolved_parents.append(p.actual_block)
-                    else:
-                        resolved_parents.append(p)
+    def queue_move(self, blocks, positions) -> None:
+        """Queue a move of blocks (or placeholders) to (x, y) positions."""
+        self.dag.workflow_steps.append(WorkflowStep(kind="move", blocks=list(blocks), positions=list(positions)))
 
-                        # Calculate x-position based on parents
-            block_name = name if name else self.dag.retrieval.generate_block_name(resolved_parents)
+    def queue_camera_follow(self) -> None:
+        """Queue a camera shift that keeps the rightmost blocks in view."""
+        self.dag.workflow_steps.append(WorkflowStep(kind="camera"))
 
-            # Initialize variables that will be used later
-            column_blocks = []
-            shift_y = 0
+    def add_block(self, parents=None, name=None) -> KaspaLogicalBlock:
+        """Create and animate a block immediately."""
+        placeholder = self.queue_block(parents=parents, name=name, timestamp=0)
+        self.catch_up()  # Runs any pending steps first, then this block's creation
+        return placeholder.actual_block  # Return actual block, not placeholder
 
-            if not resolved_parents:
-                # Genesis block - use standard position
-                x_position = self.dag.config.genesis_x
-                y_position = self.dag.config.genesis_y
-            else:
-                # Use rightmost parent for x-position
-                rightmost_parent = max(resolved_parents, key=lambda p: p.visual_block.square.get_center()[0])
-                parent_pos = rightmost_parent.visual_block.square.get_center()
-                x_position = parent_pos[0] + self.dag.config.horizontal_spacing
-
-                # Find existing blocks at this x-position
-                column_blocks = [
-                    b for b in self.dag.all_blocks
-                    if abs(b.visual_block.square.get_center()[0] - x_position) < 0.01
-                ]
-
-                if not column_blocks:
-                    # First block at this x-position
-                    y_position = self.dag.config.genesis_y
-                    shift_y = 0
-                else:
-                    # Calculate shift and new position with mirroring logic
-                    shift_y = -self.dag.config.vertical_spacing / 2  # Always shift down by half spacing
+    def add_blocks(self, blocks_data: List[tuple[Optional[List[BlockPlaceholder | KaspaLogicalBlock]], Optional[str]]]) -> List[KaspaLogicalBlock]:
+        """Add multiple blocks and complete all animations automatically."""
+        placeholders = []
 
-                    # Find the lowest block (minimum y)
-                    lowest_block = min(column_blocks, key=lambda b: b.visual_block.square.get_center()[1])
-                    lowest_y = lowest_block.visual_block.square.get_center()[1]
+        # Queue all blocks
+        for parents, name in blocks_data:
+            placeholder = self.queue_block(timestamp=None, parents=parents, name=name)
+            placeholders.append(placeholder)
 
-                    # New block goes at mirror position of lowest block after shift
-                    y_position = -(lowest_y + shift_y)  # Mirror around genesis_y (0)
+            # Execute all queued steps
+        self.catch_up()
 
-            # Create the new block
-            block = KaspaLogicalBlock(
-                name=block_name,
-                timestamp=timestamp,
-                parents=resolved_parents if resolved_parents else [],
-                position=(x_position, y_position),
-                config=self.dag.config,
-            )
+        # Return actual blocks
+        return [p.actual_block for p in placeholders]
 
-            self.dag.blocks[block_name] = block
-            self.dag.all_blocks.append(block)
+    def next_step(self) -> None:
+        """Execute the next queued step on its own (one play, camera follow included)."""
+        if self.dag.workflow_steps:
+            self._run_steps([self.dag.workflow_steps.popleft()])
 
-            if not resolved_parents:
-                self.genesis = block
+    def catch_up(self):
+        """Execute all queued steps, coalescing compatible consecutive steps into one play."""
+        while self.dag.workflow_steps:
+            self._run_steps(self._take_compatible_steps())
 
-            placeholder.actual_block = block
+    def _take_compatible_steps(self) -> List[WorkflowStep]:
+        """Pop the longest run of queued steps that can share a single play.
 
-            # Create combined animations
-            animations = []
+        - consecutive creates merge unless a block's parent is created in the same run
+        - camera follows after creates are absorbed (creation plays follow the camera)
+        - consecutive moves merge while they touch disjoint blocks
+        - plain callables always run alone
+        """
+        steps = self.dag.workflow_steps
+        group = [steps.popleft()]
+        kind = group[0].kind if isinstance(group[0], WorkflowStep) else None
+
+        if kind == "create":
+            in_group = {id(group[0].placeholder)}
+            while steps and isinstance(steps[0], WorkflowStep):
+                step = steps[0]
+                if step.kind == "camera":
+                    steps.popleft()
+                    continue
+                if step.kind != "create" or any(id(p) in in_group for p in step.parents):
+                    break
+                in_group.add(id(step.placeholder))
+                group.append(steps.popleft())
+        elif kind == "move":
+            touched = {id(b) for b in group[0].blocks}
+            while steps and isinstance(steps[0], WorkflowStep) and steps[0].kind == "move":
+                ids = {id(b) for b in steps[0].blocks}
+                if ids & touched:
+                    break
+                touched |= ids
+                group.append(steps.popleft())
+
+        return group
+
+    def _run_steps(self, group: List[WorkflowStep]) -> None:
+        """Run one group of compatible steps, skipping steps that turn out to be no-ops."""
+        first = group[0]
+        if not isinstance(first, WorkflowStep):
+            first()
+            return
 
-            # Add block creation animation
+        if first.kind == "create":
+            entries = []
+            for step in group:
+                resolved = []
+                for p in step.parents:
+                    if isinstance(p, BlockPlaceholder):
+                        if p.actual_block is None:
+                            raise ValueError(f"Parent block hasn't been created yet")
+                        resolved.append(p.actual_block)
+                    else:
+                        resolved.append(p)
+                entries.append((resolved, step.timestamp, step.name))
+            for step, block in zip(group, self._create_group(entries)):
+                step.placeholder.actual_block = block
+
+        elif first.kind == "move":
+            blocks, positions = [], []
+            for step in group:
+                for block, pos in zip(step.blocks, step.positions):
+                    block = block.actual_block if isinstance(block, BlockPlaceholder) else block
+                    center = block.visual_block.square.get_center()
+                    if abs(center[0] - pos[0]) > 0.01 or abs(center[1] - pos[1]) > 0.01:
+                        blocks.append(block)
+                        positions.append(pos)
+            if blocks:
+                self.dag.movement.move(blocks, positions)
+
+        elif first.kind == "camera":
             self.dag.shift_camera_to_follow_blocks()
-            animations.append(block.visual_block.create_with_lines())
-
-            # Add shift animations for existing blocks if needed
-            if column_blocks and abs(shift_y) > 0.01:
-                for existing_block in column_blocks:
-                    animations.append(
-                        existing_block.visual_block.create_movement_animation(
-                            existing_block.visual_block.animate.shift(np.array([0, shift_y, 0]))
-                        )
-                    )
 
-                    # Play all animations together
-            self.dag.scene.play(*animations)
+    def create_blocks_from_simulator_list_batched(
+            self,
+            simulator_blocks: List[dict],
+            batch_size: Optional[int] = None,
+            batch_time_ms: Optional[float] = None
+    ) -> List[KaspaLogicalBlock]:
+        """Group simulator blocks by count and/or time slice, one play per group."""
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if batch_time_ms is not None and batch_time_ms <= 0:
+            raise ValueError(f"batch_time_ms must be > 0, got {batch_time_ms}")
 
-            return block
+        initial_tips = self.dag.get_current_tips()
+        block_map = {}
+        created_blocks = []
+        batch = []
 
-            # Queue only the combined function
+        def flush():
+            if not batch:
+                return
+            blocks = self.create_blocks_batch([(parents, timestamp) for _, parents, timestamp in batch])
+            for (block_hash, _, _), block in zip(batch, blocks):
+                block_map[block_hash] = block
+            created_blocks.extend(blocks)
+            batch.clear()
 
-        self.dag.workflow_steps.append(create_and_reposition_together)
+        for block_dict in simulator_blocks:
+            block_hash = block_dict['hash']
+            timestamp = block_dict['timestamp']
+            parent_hashes = block_dict.get('parents', [])
 
-        return placeholder
+            if batch and (
+                    (batch_size is not None and len(batch) >= batch_size) or
+                    (batch_time_ms is not None and timestamp - batch[0][2] >= batch_time_ms)
+            ):
+                flush()
 
-    def add_block(self, parents=None, name=None) -> KaspaLogicalBlock:
-        """Create and animate a block immediately."""
-        placeholder = self.queue_block(parents=parents, name=name, timestamp=0)
-        self.next_step()  # Execute block creation TODO does this break IF there is a pending queue of blocks when this is called
-        self.next_step()  # Execute repositioning
-        return placeholder.actual_block  # Return actual block, not placeholder
+            # Parents may be blocks of earlier groups or (still unbuilt) members of this group
+            pending = {h: i for i, (h, _, _) in enumerate(batch)}
+            parents = []
+            for parent_hash in parent_hashes:
+                if parent_hash in block_map:
+                    parents.append(block_map[parent_hash])
+                elif parent_hash in pending:
+                    parents.append(pending[parent_hash])
+                else:
+                    raise ValueError(f"Parent block {parent_hash} not found for block {block_hash}")
+            if not parent_hashes:
+                parents = list(initial_tips)
 
-    def add_blocks(self, blocks_data: List[tuple[Optional[List[BlockPlaceholder | KaspaLogicalBlock]], Optional[str]]]) -> List[KaspaLogicalBlock]:
-        """Add multiple blocks and complete all animations automatically."""
-        placeholders = []
+            batch.append((block_hash, parents, timestamp))
 
-        # Queue all blocks
-        for parents, name in blocks_data:
-            placeholder = self.queue_block(parents, name)
-            placeholders.append(placeholder)
+        flush()
+        return created_blocks
 
-            # Execute all queued steps
-        self.catch_up()
+    def create_blocks_batch(self, blocks_data: List[tuple[Optional[List[KaspaLogicalBlock | int]], Optional[float]]]) -> List[KaspaLogicalBlock]:
+        """Create several blocks with one play (two if a parent must move first).
 
-        # Return actual blocks
-        return [p.actual_block for p in placeholders]
+        Entries are (parents, timestamp) in creation order. A parent may be an
+        existing block or the index of an earlier entry in the same batch.
 
-    def next_step(self) -> None:
-        """Execute the next queued function, skipping empty repositioning."""
-        if not self.dag.workflow_steps:
-            return None
+        The final layout is computed up front instead of block by block: every
+        affected column ends up centered on genesis_y with new blocks stacked on
+        top, which matches the mirroring layout of queue_block. New blocks are
+        then created directly at their final positions with a LaggedStart, while
+        existing blocks in those columns slide into place and the camera follows,
+        all in the same play.
+        """
+        self.catch_up()
+        return self._create_group([(parents, timestamp, None) for parents, timestamp in blocks_data])
 
-        func = self.dag.workflow_steps.pop(0)
+    def _create_group(self, entries: List[tuple[List[KaspaLogicalBlock | int], Optional[float], Optional[str]]]) -> List[KaspaLogicalBlock]:
+        """Lay out and create (parents, timestamp, name) entries in one play, see create_blocks_batch."""
+        if not entries:
+            return []
 
-        # Check if this is a marked repositioning function
-        if getattr(func, 'is_repositioning', False):
-            if self.dag.all_blocks:
-                x_pos = self.dag.all_blocks[-1].visual_block.get_center()[0]
-                column_blocks = [
-                    b for b in self.dag.all_blocks
-                    if abs(b.visual_block.get_center()[0] - x_pos) < 0.01
-                ]
+        cfg = self.dag.config
 
-                if column_blocks:
-                    current_ys = [b.visual_block.get_center()[1] for b in column_blocks]
-                    current_center_y = (max(current_ys) + min(current_ys)) / 2
-                    shift_y = self.dag.config.genesis_y - current_center_y
+        # Parents need their visuals (and lines) to place and link new blocks
+        self.dag.lod.rehydrate(p for parents, _, _ in entries for p in (parents or []) if not isinstance(p, int))
 
-                    # Skip if negligible shift
-                    if abs(shift_y) < 0.01:
-                        return self.next_step()
+        def column_key(x: float) -> int:
+            return round(x / 0.01)
 
-        func()
-        return None
+        # Plan x positions, parents may point at earlier entries of this batch
+        planned_x: List[float] = []
+        columns: dict[int, list] = {}
+        for parents, _, _ in entries:
+            parents = parents or []
+            if not parents:
+                x = cfg.genesis_x
+            else:
+                x = max(
+                    planned_x[p] if isinstance(p, int) else p.visual_block.square.get_center()[0]
+                    for p in parents
+                ) + cfg.horizontal_spacing
+            planned_x.append(x)
+
+            key = column_key(x)
+            if key not in columns:
+                # Existing blocks keep their bottom-to-top order
+                columns[key] = sorted(
+                    (b for b in self.dag.rendered_blocks
+                     if abs(b.visual_block.square.get_center()[0] - x) < 0.01),
+                    key=lambda b: b.visual_block.square.get_center()[1]
+                )
+            columns[key].append(len(planned_x) - 1)
+
+        # Final column layout centered on genesis_y
+        planned_y: dict[int, float] = {}
+        moves = []
+        moving_blocks = set()
+        for members in columns.values():
+            n = len(members)
+            for i, member in enumerate(members):
+                y = cfg.genesis_y + (i - (n - 1) / 2) * cfg.vertical_spacing
+                if isinstance(member, int):
+                    planned_y[member] = y
+                else:
+                    center = member.visual_block.square.get_center()
+                    if abs(center[1] - y) > 0.01:
+                        move = member.visual_block.animate_move_to(center[0], y)
+                        moves.append(move if isinstance(move, AnimationGroup) else AnimationGroup(move))
+                        moving_blocks.add(member)
+
+        # Lines are built against current parent positions, so parents that move
+        # must be in place before their children are created
+        move_animations = self.dag.movement.deduplicate_line_animations(*moves)
+        if move_animations and any(
+                p in moving_blocks for parents, _, _ in entries for p in (parents or []) if not isinstance(p, int)
+        ):
+            self.dag.scene.play(*move_animations)
+            move_animations = []
+
+        created: List[KaspaLogicalBlock] = []
+        for i, (parents, timestamp, name) in enumerate(entries):
+            resolved = [created[p] if isinstance(p, int) else p for p in (parents or [])]
+            block_name = name if name else self.dag.retrieval.generate_block_name(resolved)
+            block = KaspaLogicalBlock(
+                name=block_name,
+                timestamp=timestamp,
+                parents=resolved,
+                position=(planned_x[i], planned_y[i]),
+                config=cfg,
+                hash_value=self.dag.hasher.hash_block(block_name, (p.hash for p in resolved)),
+            )
+            self.dag.blocks[block_name] = block
+            self.dag.all_blocks.append(block)
+            if not resolved and self.dag.genesis is None:
+                self.dag.genesis = block
+            created.append(block)
+
+        creation = LaggedStart(*[block.visual_block.create_with_lines() for block in created], lag_ratio=cfg.batch_lag_ratio)
+        animations = [creation, *move_animations]
+        if cfg.predictive_camera_follow and len(created) > 1:
+            # Each block is in view by the time its creation finishes
+            camera_animation = self.dag.movement.create_camera_trajectory_animation(
+                planned_x, list(creation.anims_with_timings["end"] / creation.run_time), creation.run_time
+            )
+        else:
+            camera_animation = self.dag.movement.create_camera_follow_animation(max(planned_x))
+        if camera_animation is not None:
+            animations.append(camera_animation)
 
-    def catch_up(self):
-        """Execute all queued functions in sequence."""
-        while self.dag.workflow_steps:
-            self.next_step()
+        self.dag.scene.play(*animations)
+        self.dag.movement.track_rightmost_x(max(planned_x))
+        self.dag.lod.update()
+        return created
 
     def _calculate_dag_position(self, parents: Optional[List[KaspaLogicalBlock]]) -> tuple[float, float]:
         """Calculate position based on rightmost parent and topmost neighbor."""
@@ -781,7 +1123,7 @@ class BlockManager:
 
         # Find blocks at same x-position
         same_x_blocks = [
-            b for b in self.dag.all_blocks
+            b for b in self.dag.rendered_blocks
             if abs(b.visual_block.square.get_center()[0] - x_position) < 0.01
         ]
 
@@ -806,7 +1148,7 @@ class BlockManager:
         for x_pos in x_positions:
             # Find all blocks at this x-position
             column_blocks = [
-                b for b in self.dag.all_blocks
+                b for b in self.dag.rendered_blocks
                 if abs(b.visual_block.get_center()[0] - x_pos) < 0.01
             ]
 
@@ -828,12 +1170,17 @@ class BlockManager:
                 )
 
         if animations:
-            self.dag.scene.play(*animations)
+            self.dag.scene.play(*self.dag.movement.deduplicate_line_animations(*animations))
 
     def _animate_block_creation(self, block: KaspaLogicalBlock):
-        """Animate the creation of a block and its lines."""
-        self.dag.shift_camera_to_follow_blocks()
-        self.dag.scene.play(block.visual_block.create_with_lines())
+        """Animate the creation of a block and its lines, with the camera follow in the same play."""
+        animations = [block.visual_block.create_with_lines()]
+        camera_animation = self.dag.movement.create_camera_follow_animation(block.visual_block.square.get_center()[0])
+        if camera_animation is not None:
+            animations.append(camera_animation)
+        self.dag.scene.play(*animations)
+        self.dag.movement.track_rightmost_x(block.visual_block.square.get_center()[0])
+        self.dag.lod.update()
 
 class DAGGenerator:
     """Handles all DAG generation methods and network parameter calculations."""
@@ -876,6 +1223,24 @@ class Movement:
 
     def __init__(self, dag):
         self.dag = dag
+        # Rightmost block x, kept up to date as blocks are created (None = recompute on next use)
+        self._rightmost_x: Optional[float] = None
+
+    def get_rightmost_x(self) -> Optional[float]:
+        """Rightmost rendered block center x (None without rendered blocks)."""
+        if self._rightmost_x is None:
+            xs = [block.visual_block.square.get_center()[0] for block in self.dag.rendered_blocks]
+            self._rightmost_x = max(xs) if xs else None
+        return self._rightmost_x
+
+    def track_rightmost_x(self, x: float) -> None:
+        """Record a block rendered at x."""
+        if self._rightmost_x is not None:
+            self._rightmost_x = max(self._rightmost_x, x)
+
+    def invalidate_rightmost_x(self) -> None:
+        """Recompute the rightmost x on next use (blocks moved horizontally or were removed)."""
+        self._rightmost_x = None
 
     def move(self, blocks, positions):
         """Move blocks to new positions with synchronized line updates.
@@ -952,13 +1317,18 @@ class Movement:
         never manually create movement animations outside of this method.
         """
         animation_groups = []
+        moved_x = []
         for block, pos in zip(blocks, positions):
+            if abs(block.visual_block.square.get_center()[0] - pos[0]) > 0.01:
+                self.invalidate_rightmost_x()
+                moved_x.append(block)
             # Pass x, y coordinates to the new method
             animation_groups.append(block.visual_block.animate_move_to(pos[0], pos[1]))
 
         # Deduplicate and order animations
         animations = self.deduplicate_line_animations(*animation_groups)
         self.dag.scene.play(*animations)
+        self.dag.lod.reindex(moved_x)
 
     @staticmethod
     def deduplicate_line_animations(*animation_groups: AnimationGroup) -> list[Animation]:
@@ -985,8 +1355,10 @@ class Movement:
 
         1. **Separation**: Separate block animations (Transform, etc.) from line
            updates (UpdateFromFunc)
-        2. **Deduplication**: Track seen mobjects by ID to ensure each line only
-           gets one UpdateFromFunc animation, even if multiple blocks reference it
+        2. **Deduplication**: Collect every distinct ParentLine once, even if
+           multiple blocks reference it, and replace all of their UpdateFromFunc
+           animations with a single ParentLineBatchUpdate that rewrites every
+           line's endpoints per frame from one NumPy computation
         3. **Ordering**: Return block animations first, then line updates, ensuring
            blocks move before lines update in each frame
 
@@ -1024,10 +1396,10 @@ class Movement:
         -------
         list[Animation]
             Flat list of animations in the correct order:
-            [block_animation_1, block_animation_2, ..., line_update_1, line_update_2, ...]
+            [block_animation_1, block_animation_2, ..., line_batch_update]
 
             Block animations are all Transform/movement animations.
-            Line updates are all deduplicated UpdateFromFunc animations.
+            Line updates are one ParentLineBatchUpdate covering every distinct line.
 
         Examples
         --------
@@ -1039,14 +1411,15 @@ class Movement:
                 block2.visual_block.animate_move_to(4, 3),  # Contains block move + line updates
             ]
             animations = self.deduplicate_line_animations(*animation_groups)
-            # Result: [block1_move, block2_move, line1_update, line2_update]
-            # (with duplicates removed if block1 and block2 share a line)
+            # Result: [block1_move, block2_move, line_batch_update]
+            # (a line shared by block1 and block2 is updated once)
 
         See Also
         --------
         move : Public API that uses this deduplication
         KaspaVisualBlock.create_movement_animation : Creates AnimationGroups with line updates
         ParentLine.create_update_animation : Creates the UpdateFromFunc animations
+        batch_line_updates : Merges the line updates into one ParentLineBatchUpdate
 
         Notes
         -----
@@ -1058,42 +1431,97 @@ class Movement:
         safe because mobject instances are unique and persistent throughout the
         animation lifecycle.
         """
-        block_animations = []
-        line_updates = []
-        seen_mobjects = {}
-
-        for group in animation_groups:
-            for anim in group.animations:
-                if isinstance(anim, UpdateFromFunc):
-                    mob_id = id(anim.mobject)
-                    if mob_id not in seen_mobjects:
-                        seen_mobjects[mob_id] = anim
-                        line_updates.append(anim)
-                else:
-                    block_animations.append(anim)
-
-        # Return block animations first, then line updates
-        return block_animations + line_updates
+        # Block animations first, then one ParentLineBatchUpdate for all distinct lines
+        return batch_line_updates(*animation_groups)
 
     def shift_camera_to_follow_blocks(self):
         """Shift camera to keep rightmost blocks in view."""
-        if not self.dag.all_blocks:
-            return
+        camera_animation = self.create_camera_follow_animation()
+        if camera_animation is not None:
+            self.dag.scene.play(camera_animation, run_time=self.dag.config.camera_follow_time)
+            self.dag.lod.update()
+
+    def get_viewport_bounds(self) -> Optional[tuple[float, float, float, float]]:
+        """Camera frame bounds (x_min, x_max, y_min, y_max) plus viewport_margin, None if culling is off."""
+        if not self.dag.config.viewport_culling:
+            return None
+        frame = self.dag.scene.camera.frame
+        center = frame.get_center()
+        half_width = frame.get_width() / 2 + self.dag.config.viewport_margin
+        half_height = frame.get_height() / 2 + self.dag.config.viewport_margin
+        return center[0] - half_width, center[0] + half_width, center[1] - half_height, center[1] + half_height
 
-            # Use visual_block property instead of _visual
-        rightmost_x = max(block.visual_block.get_center()[0] for block in self.dag.all_blocks)
+    @staticmethod
+    def is_in_view(mobject, bounds: Optional[tuple[float, float, float, float]]) -> bool:
+        """Whether the mobject's bounding box overlaps the viewport bounds (always True without bounds)."""
+        if bounds is None:
+            return True
+        x_min, x_max, y_min, y_max = bounds
+        return (mobject.get_left()[0] <= x_max and mobject.get_right()[0] >= x_min and
+                mobject.get_bottom()[1] <= y_max and mobject.get_top()[1] >= y_min)
+
+    def create_style_animation(self, targets: List[StyleTarget]) -> Optional[BatchStyleAnimation]:
+        """One BatchStyleAnimation for the on-screen targets, off-screen targets are applied instantly.
+
+        Returns None when no target is on screen.
+        """
+        view = self.get_viewport_bounds()
+        animated = [target for target in targets if self.is_in_view(target[0], view)]
+        if len(animated) < len(targets):
+            BatchStyleAnimation.apply(target for target in targets if not self.is_in_view(target[0], view))
+        return BatchStyleAnimation(animated) if animated else None
+
+    def create_camera_follow_animation(self, rightmost_x: Optional[float] = None):
+        """Camera shift keeping rightmost_x in view, or None if no shift is needed.
+
+        rightmost_x defaults to the rightmost rendered block. Callers that already
+        know where blocks will end up (batched creation) pass it in, so the camera
+        move can be played together with the creation animations.
+        """
+        if rightmost_x is None:
+            rightmost_x = self.get_rightmost_x()
+            if rightmost_x is None:
+                return None
+
+        shift_amount = self._required_camera_x(rightmost_x) - self.dag.scene.camera.frame.get_center()[0]
+        if shift_amount > 0:
+            return self.dag.scene.camera.frame.animate.shift(RIGHT * shift_amount)
+        return None
 
-        margin = self.dag.config.horizontal_spacing * 2
-        current_center = self.dag.scene.camera.frame.get_center()
-        frame_width = config["frame_width"]
-        right_edge = current_center[0] + (frame_width / 2)
+    def create_camera_trajectory_animation(self, xs: List[float], times: List[float], run_time: float) -> Optional[Animation]:
+        """Camera move that keeps each x in view by its time, for one play of staggered creations.
 
-        if rightmost_x > right_edge - margin:
-            shift_amount = rightmost_x - (right_edge - margin)
-            self.dag.scene.play(
-                self.dag.scene.camera.frame.animate.shift(RIGHT * shift_amount),
-                run_time=self.dag.config.camera_follow_time
-            )
+        The camera center follows a piecewise-linear path through the positions
+        required by each (x, time) pair, times being fractions of run_time. It
+        never moves left. Returns None if no shift is needed.
+
+        Parameters
+        ----------
+        xs : List[float]
+            Block x positions in creation order.
+        times : List[float]
+            For each x, the fraction of run_time by which it must be in view.
+        run_time : float
+            Duration of the play the camera move is part of.
+        """
+        frame_center = self.dag.scene.get_frame_center_mobject()
+        start = frame_center.get_center()
+        centers = np.maximum.accumulate([start[0]] + [self._required_camera_x(x) for x in xs])
+        if centers[-1] <= start[0]:
+            return None
+        keyframes = np.concatenate([[0.0], np.clip(times, 0.0, 1.0)])
+
+        def follow(mobject, alpha):
+            mobject.move_to([np.interp(alpha, keyframes, centers), start[1], start[2]])
+
+        return UpdateFromAlphaFunc(frame_center, follow, run_time=run_time, rate_func=linear)
+
+    def _required_camera_x(self, x: float) -> float:
+        """Camera center x that keeps x one margin (two horizontal spacings) inside the right edge."""
+        margin = self.dag.config.horizontal_spacing * 2
+        frame = self.dag.scene.camera.frame
+        current_x = frame.get_center()[0]
+        return max(current_x, x - (frame.get_width() / 2 - margin))
 
 #Complete
 class BlockRetrieval:
@@ -1101,18 +1529,28 @@ class BlockRetrieval:
 
     def __init__(self, dag):
         self.dag = dag
+        # Round numbers never change once a block exists, so they are memoized.
+        # This also keeps rounds correct for blocks whose history was retired.
+        self._round_cache: dict[KaspaLogicalBlock, int] = {}
 
-    @staticmethod
-    def get_round(block: KaspaLogicalBlock) -> int:
+    def get_round(self, block: KaspaLogicalBlock) -> int:
         """Helper to get round number for a block."""
-        if not block.parents:
-            return 0
-        round_num = 1
-        current = block.parents[0]
-        while current.parents:
+        chain = []
+        current = block
+        while current not in self._round_cache and current.parents:
+            chain.append(current)
             current = current.parents[0]
+
+        round_num = self._round_cache.get(current, 0)
+        self._round_cache[current] = round_num
+        for chained in reversed(chain):
             round_num += 1
-        return round_num
+            self._round_cache[chained] = round_num
+        return self._round_cache[block]
+
+    def forget_round(self, block: KaspaLogicalBlock) -> None:
+        """Drop a retired block from the round cache."""
+        self._round_cache.pop(block, None)
 
     def get_block(self, name: str) -> Optional[KaspaLogicalBlock]:
         """Retrieve a block by name with fuzzy matching support."""
@@ -1227,14 +1665,8 @@ class BlockRetrieval:
         if not parents:
             return "Gen"
 
-        # Calculate round by following selected parent chain back to genesis
-        selected_parent = parents[0]
-        round_number = 1
-        current = selected_parent
-
-        while current.parents:  # Traverse back to genesis
-            current = current.parents[0]  # Follow selected parent chain
-            round_number += 1
+        # Round is one past the selected parent's round (memoized chain walk back to genesis)
+        round_number = self.get_round(parents[0]) + 1
 
         # Count parallel blocks at this round (blocks already in all_blocks)
         blocks_at_round = [
@@ -1244,23 +1676,57 @@ class BlockRetrieval:
 
         # Generate name
         if len(blocks_at_round) == 0:
-            return f"B{round_number}"
+            name = f"B{round_number}"
         else:
             # Subtract 1 to get correct suffix: 1 existing block → 'a', 2 → 'b', etc.
             suffix = chr(ord('a') + len(blocks_at_round) - 1)
-            return f"B{round_number}{suffix}"
+            name = f"B{round_number}{suffix}"
+
+        # Retired blocks leave gaps in a round, so skip suffixes still held by live blocks
+        count = len(blocks_at_round)
+        while name in self.dag.blocks:
+            count += 1
+            name = f"B{round_number}{chr(ord('a') + count - 1)}"
+        return name
 
 #Complete
 class RelationshipHighlighter:
+    """Relationship highlighting with dirty-state tracking.
+
+    block_styles / line_styles record every block and line whose style is not the
+    neutral default ("faded", "highlighted", "pulsing" or "custom" for styles set
+    elsewhere, e.g. GHOSTDAG coloring). Highlights and resets only animate the
+    difference between that recorded state and the target state, so repeated
+    highlight/reset cycles on a large DAG touch a handful of mobjects.
+    """
+
     def __init__(self, dag):
         self.dag = dag
         self.currently_highlighted_block: Optional[KaspaLogicalBlock] = None
         self.flash_lines: List = []
+        self.flash_pool = FlashLinePool(dag.scene)
+        self.block_styles: dict[KaspaLogicalBlock, str] = {}
+        self.line_styles: dict[ParentLine, str] = {}
+
+    def mark_dirty(self, blocks: Iterable[KaspaLogicalBlock] = (), lines: Iterable[ParentLine] = ()) -> None:
+        """Record blocks and lines restyled outside this highlighter (a block's lines are not implied)."""
+        for block in blocks:
+            if block.visual_block is not None:
+                self.block_styles[block] = "custom"
+        for line in lines:
+            self.line_styles[line] = "custom"
+
+    def forget(self, block: KaspaLogicalBlock) -> None:
+        """Drop tracked state for a block that is leaving the scene."""
+        self.block_styles.pop(block, None)
+        if block.visual_block is not None:
+            for line in block.visual_block.parent_lines:
+                self.line_styles.pop(line, None)
 
 
     def highlight_past(self, focused_block: KaspaLogicalBlock) -> None:
         """Highlight a block's past cone with child-to-parent line animations."""
-        self.reset_highlighting()
+        self._clear_overlays()
 
         context_blocks = self.dag.get_past_cone(focused_block)
         self.flash_lines = self._highlight_with_context(
@@ -1269,7 +1735,7 @@ class RelationshipHighlighter:
 
     def highlight_future(self, focused_block: KaspaLogicalBlock) -> None:
         """Highlight a block's future cone with child-to-parent line animations."""
-        self.reset_highlighting()
+        self._clear_overlays()
 
         context_blocks = self.dag.get_future_cone(focused_block)
         self.flash_lines = self._highlight_with_context(
@@ -1278,7 +1744,7 @@ class RelationshipHighlighter:
 
     def highlight_anticone(self, focused_block: KaspaLogicalBlock) -> None:
         """Highlight a block's anticone with child-to-parent line animations."""
-        self.reset_highlighting()
+        self._clear_overlays()
 
         context_blocks = self.dag.get_anticone(focused_block)
         self.flash_lines = self._highlight_with_context(
@@ -1297,14 +1763,14 @@ class RelationshipHighlighter:
         if relationship_type == "past":
             # RULE: Highlight lines where BOTH child and parent are in past cone
             for block in context_blocks:
-                for parent_line, parent in zip(block.visual_block.parent_lines, block.parents):
+                for parent_line, parent in block.get_parent_line_pairs():
                     if parent in context_set or parent == focused_block:
                         lines_to_keep.add(id(parent_line))
 
         elif relationship_type == "future":
             # RULE: Highlight lines where BOTH child and parent are in future cone
             for block in context_blocks:
-                for parent_line, parent in zip(block.visual_block.parent_lines, block.parents):
+                for parent_line, parent in block.get_parent_line_pairs():
                     if parent in context_set or parent == focused_block:
                         lines_to_keep.add(id(parent_line))
 
@@ -1315,22 +1781,26 @@ class RelationshipHighlighter:
                     lines_to_keep.add(id(parent_line))
 
             # RULE 2: Highlight lines FROM non-anticone TO anticone
+            anticone_squares = {id(block.visual_block.square) for block in context_blocks}
+            if focused_block.visual_block is not None:
+                anticone_squares.add(id(focused_block.visual_block.square))
             for anticone_block in context_blocks:
-                for child in anticone_block.children:
-                    if child not in context_set and child != focused_block:
-                        for parent_line, parent in zip(child.visual_block.parent_lines, child.parents):
-                            if parent == anticone_block:
-                                lines_to_keep.add(id(parent_line))
+                for child_line in anticone_block.visual_block.child_lines:
+                    if id(child_line.this_block) not in anticone_squares:
+                        lines_to_keep.add(id(child_line))
 
         return lines_to_keep
 
     def _highlight_with_context(self, focused_block: KaspaLogicalBlock, context_blocks: Optional[List[KaspaLogicalBlock]] = None, relationship_type: str = "anticone") -> List:
         """Highlight a block and its context with directional line animations."""
         self.currently_highlighted_block = focused_block
+        self.dag.lod.rehydrate([focused_block])
 
         if context_blocks is None:
             context_blocks = []
 
+        # Blocks without visuals (outside an imported window) take no part in highlighting
+        context_blocks = [b for b in context_blocks if b.visual_block is not None]
         context_set = set(context_blocks)
 
         # Get set of line IDs that should remain highlighted
@@ -1338,136 +1808,160 @@ class RelationshipHighlighter:
             focused_block, context_blocks, relationship_type
         )
 
-        # Fade non-context blocks and selectively fade their lines
-        fade_animations = []
-        for block in self.dag.all_blocks:
-            if block not in context_set and block != focused_block:
+        # Target style of every block/line, anything not listed returns to default
+        block_targets: dict[KaspaLogicalBlock, str] = {focused_block: "pulsing"}
+        line_targets: dict[ParentLine, str] = {}
+        for block in self.dag.rendered_blocks:
+            if block in context_set:
+                block_targets[block] = "highlighted"
+            elif block != focused_block:
                 # Fade the block itself
-                fade_animations.extend(block.visual_block.create_fade_animation())
+                block_targets[block] = "faded"
 
                 # Selectively fade lines NOT in lines_to_keep
                 for parent_line in block.visual_block.parent_lines:
                     if id(parent_line) not in lines_to_keep:
-                        fade_animations.append(
-                            parent_line.animate.set_stroke(opacity=self.dag.config.fade_opacity)
-                        )
+                        line_targets[parent_line] = "faded"
 
         # Fade focused block's parent lines if parents not in context
         if focused_block.visual_block.parent_lines:
-            for parent_line, parent in zip(focused_block.visual_block.parent_lines, focused_block.parents):
+            for parent_line, parent in focused_block.get_parent_line_pairs():
                 if parent not in context_set:
-                    fade_animations.append(
-                        parent_line.animate.set_stroke(opacity=self.dag.config.fade_opacity)
-                    )
+                    line_targets[parent_line] = "faded"
 
         # Also fade lines within context blocks that should not be highlighted
         for block in context_blocks:
             for parent_line in block.visual_block.parent_lines:
                 if id(parent_line) not in lines_to_keep:
-                    fade_animations.append(
-                        parent_line.animate.set_stroke(opacity=self.dag.config.fade_opacity)
-                    )
-
-        if fade_animations:
-            self.dag.scene.play(*fade_animations)
+                    line_targets[parent_line] = "faded"
+
+        # Return tracked styles that differ from their target to default (the diff from the last highlight)
+        # Only on-screen mobjects are animated, off-screen ones get their final style instantly
+        reset_animation = self._reset_changed(block_targets, line_targets)
+        if reset_animation is not None:
+            self.dag.scene.play(reset_animation)
+
+        # Fade blocks and lines that are not faded yet
+        fade_targets = []
+        for block, target in block_targets.items():
+            if target == "faded" and block not in self.block_styles:
+                fade_targets.extend(block.visual_block.get_fade_targets())
+                self.block_styles[block] = "faded"
+
+        for parent_line, target in line_targets.items():
+            if parent_line not in self.line_styles:
+                fade_targets.append((parent_line, {"stroke_opacity": self.dag.config.fade_opacity}))
+                self.line_styles[parent_line] = target
+
+        fade_animation = self.dag.movement.create_style_animation(fade_targets)
+        if fade_animation is not None:
+            self.dag.scene.play(fade_animation)
 
         # Add pulsing highlight to focused block
         pulse_updater = focused_block.visual_block.create_pulsing_highlight()
         focused_block.visual_block.square.add_updater(pulse_updater)
+        self.block_styles[focused_block] = "pulsing"
 
-        # Highlight context blocks
-        context_animations = []
+        # Highlight context blocks that are not highlighted yet
+        highlight_targets = []
         for block in context_blocks:
-            context_animations.append(block.visual_block.create_highlight_animation())
+            if self.block_styles.get(block) == "highlighted":
+                continue
+            highlight_targets.extend(block.visual_block.get_highlight_targets())
+            self.block_styles[block] = "highlighted"
 
-        if context_animations:
-            self.dag.scene.play(*context_animations)
+        context_animation = self.dag.movement.create_style_animation(highlight_targets)
+        if context_animation is not None:
+            self.dag.scene.play(context_animation)
         else:
             self.dag.scene.play(Wait(0.01))
 
         # Flash lines that are in lines_to_keep
-        flash_lines = []
+        flash_sources = []
         if self.dag.config.flash_connections:
             # Flash lines within context blocks (only those in lines_to_keep)
             for block in context_blocks:
                 for parent_line in block.visual_block.parent_lines:
                     if id(parent_line) in lines_to_keep:
-                        # Create flash animation for this specific line
-                        flash_copy = parent_line.copy()
-                        flash_copy.set_stroke(
-                            color=self.dag.config.highlight_line_color,
-                            width=self.dag.config.line_stroke_width
-                        )
-                        from manim import ShowPassingFlash, cycle_animation
-                        cycle_animation(
-                            ShowPassingFlash(
-                                flash_copy,
-                                time_width=0.5,
-                                run_time=self.dag.config.highlight_line_cycle_time
-                            )
-                        )
-                        self.dag.scene.add(flash_copy)
-                        flash_lines.append(flash_copy)
+                        flash_sources.append(parent_line)
 
             # Flash focused block's lines if parents in context
-            if focused_block.visual_block.parent_lines:
-                for parent in focused_block.parents:
-                    if parent in context_set:
-                        block_flash_lines = focused_block.visual_block.create_directional_line_flash()
-                        for flash_line in block_flash_lines:
-                            self.dag.scene.add(flash_line)
-                            flash_lines.append(flash_line)
-                        break
+            if any(parent in context_set for parent in focused_block.parents):
+                flash_sources.extend(focused_block.visual_block.parent_lines)
 
             # Flash lines FROM non-context blocks TO context blocks (for anticone)
             if relationship_type in "anticone":
-                for block in self.dag.all_blocks:
+                for block in self.dag.rendered_blocks:
                     if block not in context_set and block != focused_block:
-                        for parent_line, parent in zip(block.visual_block.parent_lines, block.parents):
+                        for parent_line in block.visual_block.parent_lines:
                             if id(parent_line) in lines_to_keep:
-                                # Create flash animation
-                                flash_copy = parent_line.copy()
-                                flash_copy.set_stroke(
-                                    color=self.dag.config.highlight_line_color,
-                                    width=self.dag.config.line_stroke_width
-                                )
-                                from manim import ShowPassingFlash, cycle_animation
-                                cycle_animation(
-                                    ShowPassingFlash(
-                                        flash_copy,
-                                        time_width=0.5,
-                                        run_time=self.dag.config.highlight_line_cycle_time
-                                    )
-                                )
-                                self.dag.scene.add(flash_copy)
-                                flash_lines.append(flash_copy)
-
-        return flash_lines
+                                flash_sources.append(parent_line)
+
+        if not flash_sources:
+            return []
+        # Overlays are pooled and reused, no line copies are made
+        self.flash_pool.combined = self.dag.config.combined_flash_overlay
+        return self.flash_pool.flash(
+            flash_sources,
+            color=self.dag.config.highlight_line_color,
+            width=self.dag.config.line_stroke_width,
+            cycle_time=self.dag.config.highlight_line_cycle_time
+        )
 
     def reset_highlighting(self) -> None:
-        """Reset all blocks to neutral state using visual block methods."""
+        """Reset all non-default blocks and lines to neutral state using visual block methods."""
+        self._clear_overlays()
+        self.currently_highlighted_block = None
+
+        reset_animation = self._reset_changed({}, {})
+        if reset_animation is not None:
+            self.dag.scene.play(reset_animation)
+
+    def _clear_overlays(self) -> None:
+        """Remove the focused block's pulse updater and the flash line overlays."""
         # Remove pulse updater from focused block
-        if self.currently_highlighted_block:
+        if self.currently_highlighted_block and self.currently_highlighted_block.visual_block is not None:
             if self.currently_highlighted_block.visual_block.square.updaters:
                 self.currently_highlighted_block.visual_block.square.remove_updater(
                     self.currently_highlighted_block.visual_block.square.updaters[-1]
                 )
 
-        # Remove flash line copies
-        for flash_line in self.flash_lines:
-            self.dag.scene.remove(flash_line)
+        # Remove flash overlays, the pool keeps them for the next highlight
+        self.flash_pool.release_all()
         self.flash_lines = []
 
-        # Reset all blocks using visual block methods
-        reset_animations = []
-        for block in self.dag.all_blocks:
-            reset_animations.extend(block.visual_block.create_reset_animation())
-            reset_animations.extend(block.visual_block.create_line_reset_animations())
+    def _reset_changed(self, block_targets: dict, line_targets: dict) -> Optional[BatchStyleAnimation]:
+        """Reset tracked blocks/lines whose style differs from their target and return the animation.
 
-        self.currently_highlighted_block = None
+        Off-screen mobjects are reset instantly (None is returned when nothing
+        on screen changes). Reset entries leave the tracked state, so callers
+        restyle them from default afterwards.
+        """
+        reset_targets = []
+
+        for block, style in list(self.block_styles.items()):
+            if block_targets.get(block) == style and style != "custom":
+                continue
+            del self.block_styles[block]
+            if block.visual_block is not None:
+                reset_targets.extend(block.visual_block.get_reset_targets())
 
-        if reset_animations:
-            self.dag.scene.play(*reset_animations)
+        for line, style in list(self.line_styles.items()):
+            if line_targets.get(line) == style and style != "custom":
+                continue
+            del self.line_styles[line]
+            reset_targets.append((line, self._line_reset_style(line)))
+
+        return self.dag.movement.create_style_animation(reset_targets)
+
+    def _line_reset_style(self, line: ParentLine) -> dict:
+        """Neutral style for a parent line (selected parent color if it points at the SP)."""
+        config = self.dag.config
+        return dict(
+            stroke_color=config.selected_parent_line_color if line.is_selected else config.other_parent_line_color,
+            stroke_width=config.line_stroke_width,
+            stroke_opacity=config.line_stroke_opacity
+        )
 
 class GhostDAGHighlighter:
     def __init__(self, dag):
@@ -1484,6 +1978,14 @@ class GhostDAGHighlighter:
             context_block = self.dag.get_block(context_block)
             if context_block is None:
                 return
+        if not context_block.ghostdag.complete:
+            raise ValueError(
+                f"GHOSTDAG data of {context_block.name} is incomplete (trusted blue scores from an import), "
+                f"load the DAG with verify_blue_scores=True to walk through it"
+            )
+
+        # The walk reaches arbitrarily old blocks, show the full history
+        self.dag.lod.rehydrate()
 
         try:
             # Step 1: Fade to context inclusive past cone
@@ -1530,62 +2032,63 @@ class GhostDAGHighlighter:
             self.dag.reset_highlighting()
 
 
+    def _mark_dirty(self, blocks: Iterable[KaspaLogicalBlock], with_lines: bool = False) -> None:
+        """Let the final reset know which blocks (and their parent lines if with_lines) were restyled."""
+        blocks = [block for block in blocks if block.visual_block is not None]
+        lines = [line for block in blocks for line in block.visual_block.parent_lines] if with_lines else ()
+        self.dag.relationship_highlighter.mark_dirty(blocks, lines)
+
     def _ghostdag_fade_to_past(self, context_block: KaspaLogicalBlock):
         """Fade everything not in context block's past cone."""
         context_inclusive_past_blocks = set(context_block.get_past_cone())
         context_inclusive_past_blocks.add(context_block)
 
-        fade_animations = []
-        for block in self.dag.all_blocks:
+        fade_targets = []
+        faded_blocks = []
+        for block in self.dag.rendered_blocks:
             if block not in context_inclusive_past_blocks:
-                fade_animations.extend(block.visual_block.create_fade_animation())
+                fade_targets.extend(block.visual_block.get_fade_targets())
                 # Also fade lines from these blocks
-                for line in block.visual_block.parent_lines:
-                    fade_animations.append(
-                        line.animate.set_stroke(opacity=self.dag.config.fade_opacity)
-                    )
+                fade_targets.extend(block.visual_block.get_line_fade_targets())
+                faded_blocks.append(block)
 
-        if fade_animations:
-            self.dag.scene.play(*fade_animations)
+        if fade_targets:
+            self._mark_dirty(faded_blocks, with_lines=True)
+            self.dag.scene.play(BatchStyleAnimation(fade_targets))
 
     def _ghostdag_highlight_parents(self, context_block: KaspaLogicalBlock):
         """Highlight all parents of context block."""
         if not context_block.parents:
             return
 
-        parent_animations = []
+        parent_targets = []
 
         # Highlight all parent blocks
         for parent in context_block.parents:
-            parent_animations.append(
-                parent.visual_block.square.animate.set_style(
-                    stroke_color=self.dag.config.ghostdag_parent_stroke_highlight_color,
-                    stroke_width=self.dag.config.ghostdag_parent_stroke_highlight_width
-                )
-            )
+            parent_targets.append((parent.visual_block.square, {
+                "stroke_color": self.dag.config.ghostdag_parent_stroke_highlight_color,
+                "stroke_width": self.dag.config.ghostdag_parent_stroke_highlight_width,
+            }))
 
         # Highlight all parent lines (they always connect to parents)
         for line in context_block.visual_block.parent_lines:
-            parent_animations.append(
-                line.animate.set_stroke(
-                    color=self.dag.config.ghostdag_parent_line_highlight_color
-                )
-            )
+            parent_targets.append((line, {"stroke_color": self.dag.config.ghostdag_parent_line_highlight_color}))
 
-        self.dag.scene.play(*parent_animations)
+        # Lines are reset right after, only the parents stay restyled
+        self._mark_dirty(context_block.parents)
+        self.dag.scene.play(BatchStyleAnimation(parent_targets))
 
         #Change lines back to normal
-        return_lines_animations = context_block.visual_block.create_line_reset_animations()
-        self.dag.scene.play(*return_lines_animations)
+        self.dag.scene.play(context_block.visual_block.create_line_reset_animations())
 
     def _ghostdag_show_selected_parent(self, context_block: KaspaLogicalBlock):
         """Highlight selected parent and fade its past cone."""
-        if not context_block.selected_parent:
-            return
-
         selected = context_block.selected_parent
+        if selected is None or self.dag.blocks.get(selected.name) is not selected:
+            return
 
         # Highlight selected parent with unique style
+        self._mark_dirty([selected])
         self.dag.scene.play(
             selected.visual_block.square.animate.set_style(
                 fill_color=self.dag.config.ghostdag_selected_parent_fill_color,
@@ -1597,19 +2100,15 @@ class GhostDAGHighlighter:
 
         # Fade selected parent's past cone
         selected_past = set(selected.get_past_cone())
-        fade_animations = []
+        fade_targets = []
         for block in selected_past:
-            fade_animations.extend(block.visual_block.create_fade_animation())
-            for line in block.visual_block.parent_lines:
-                fade_animations.append(
-                    line.animate.set_stroke(opacity=self.dag.config.fade_opacity)
-                )
+            fade_targets.extend(block.visual_block.get_fade_targets())
+            fade_targets.extend(block.visual_block.get_line_fade_targets())
         # Fade selected parents parent lines as well
-        for line in context_block.selected_parent.parent_lines:
-            fade_animations.append(
-                line.animate.set_stroke(opacity=self.dag.config.fade_opacity)
-            )
-        self.dag.scene.play(*fade_animations)
+        fade_targets.extend(selected.visual_block.get_line_fade_targets())
+        self._mark_dirty(selected_past, with_lines=True)
+        self.dag.relationship_highlighter.mark_dirty(lines=selected.visual_block.parent_lines)
+        self.dag.scene.play(BatchStyleAnimation(fade_targets))
 
     def _ghostdag_show_mergeset(self, context_block: KaspaLogicalBlock):
         """Visualize mergeset creation."""
@@ -1629,6 +2128,7 @@ class GhostDAGHighlighter:
                 )
             )
 
+        self._mark_dirty(mergeset)
         self.dag.scene.play(*mergeset_animations)
 
     def _ghostdag_show_ordering(self, context_block: KaspaLogicalBlock):
@@ -1685,6 +2185,7 @@ class GhostDAGHighlighter:
                 )
 
             if anticone_animations:
+                self._mark_dirty(blue_in_anticone)
                 self.dag.scene.play(*anticone_animations)
                 self.dag.scene.wait(0.5)
                 # Reset first check highlighting
@@ -1701,6 +2202,7 @@ class GhostDAGHighlighter:
                 blue_anticone = context_block.get_anticone(blue_block, total_view)
                 if candidate in blue_anticone:
                     # Highlight the blue block being checked
+                    self._mark_dirty([blue_block, candidate, *(blue_anticone & blue_blocks)])
                     self.dag.scene.play(
                         blue_block.visual_block.square.animate.set_style(
                             stroke_color=YELLOW,
@@ -1786,6 +2288,7 @@ class GhostDAGHighlighter:
                 candidate, local_blue_status, context_block.kaspa_config.k, total_view
             )
 
+            self._mark_dirty([candidate])
             if can_be_blue:
                 local_blue_status[candidate] = True
                 self.dag.scene.caption(f"Block {candidate.name}: BLUE (accepted)")
@@ -1823,15 +2326,20 @@ class BlockSimulator:
 
     Attributes:
         dag: The KaspaDAG instance this simulator is attached to
+        rng: Seedable NumPy Generator used for mining intervals
     """
 
-    def __init__(self, dag:KaspaDAG):
-        """Initialize simulator with reference to parent DAG."""
+    def __init__(self, dag:KaspaDAG, seed: Optional[int] = None):
+        """Initialize simulator with reference to parent DAG and a seedable RNG."""
         self.dag = dag
+        self.rng = np.random.default_rng(seed)
+
+    def set_seed(self, seed: Optional[int]) -> None:
+        """Reseed the simulator RNG (None draws fresh OS entropy)."""
+        self.rng = np.random.default_rng(seed)
 
     # Tested
-    @staticmethod
-    def _sample_mining_interval(blocks_per_second: float) -> float:
+    def _sample_mining_interval(self, blocks_per_second: float) -> float:
         """
         Sample time between blocks using exponential distribution.
 
@@ -1844,7 +2352,7 @@ class BlockSimulator:
         Returns:
             Time interval in milliseconds (minimum 1ms to prevent zero intervals)
         """
-        interval = np.random.exponential(1.0 / blocks_per_second)
+        interval = self.rng.exponential(1.0 / blocks_per_second)
         return max(interval * 1000, 1)  # Convert to ms, enforce minimum
 
     def _generate_timestamps(self, duration_seconds: float, blocks_per_second: float) -> List[float]:
@@ -1872,6 +2380,51 @@ class BlockSimulator:
 
         return block_timestamps
 
+    def stream_blocks(self, blocks_per_second: float, network_delay_ms: float, duration_seconds: Optional[float] = None) -> Iterator[dict]:
+        """
+        Lazily generate blocks under specified network conditions.
+
+        Produces the same DAG structure as simulate_blocks, but one block at a time.
+        Instead of rescanning every earlier block for visibility and children, only
+        blocks still inside the network delay window are held in a FIFO queue, and
+        the set of visible tips is updated incrementally as blocks become visible.
+        Memory therefore depends on the delay window, not on the stream length.
+
+        Args:
+            blocks_per_second: Network block rate (hashrate indicator)
+            network_delay_ms: Propagation delay in milliseconds
+            duration_seconds: Simulation duration in seconds, None for an endless stream
+
+        Yields:
+            Block dictionaries with hash, timestamp, and parents
+        """
+        end_time = None if duration_seconds is None else duration_seconds * 1000
+        in_flight = deque()  # Mined but not yet visible, ordered by timestamp
+        visible_tips: dict[str, None] = {}  # Insertion-ordered set of visible tip hashes
+        current_time = 0
+        index = 0
+
+        while True:
+            current_time += self._sample_mining_interval(blocks_per_second)
+            if end_time is not None and current_time >= end_time:
+                return
+
+            # Blocks become visible in timestamp order; their parents stop being tips
+            while in_flight and in_flight[0]['timestamp'] <= current_time - network_delay_ms:
+                visible = in_flight.popleft()
+                for parent_hash in visible['parents']:
+                    visible_tips.pop(parent_hash, None)
+                visible_tips[visible['hash']] = None
+
+            new_block = {
+                'hash': f"block_{index}",
+                'timestamp': current_time,
+                'parents': list(visible_tips)
+            }
+            in_flight.append(new_block)
+            index += 1
+            yield new_block
+
     def simulate_blocks(self, duration_seconds: float, blocks_per_second: float, network_delay_ms: float) -> List[dict]:
         """
         Simulate block creation under specified network conditions.
@@ -1936,7 +2489,7 @@ class BlockSimulator:
 
             # Parent Selection (ALL tips visible as of block.timestamp - delay)
             if tips:
-                parents = list(tips)
+                parents = sorted(tips)  # Stable order so seeded runs are reproducible
                 print(f"Selected tips as parents: {parents}")
             else:
                 # No tips available - create block with empty parents
@@ -1957,4 +2510,654 @@ class BlockSimulator:
         print(f"Total blocks: {len(blocks)}")
         print(f"Average parents per block: {avg_parents:.2f}")
 
-        return blocks
\ No newline at end of file
+        return blocks
+
+class BlockStreamer:
+    """
+    Feeds an unbounded block stream into the DAG under a sliding time window.
+
+    Each streamed block is created (and its GHOSTDAG data computed) the moment it
+    arrives, using the regular queue/catch_up path so it animates like any other
+    block. Once a block falls further than the window behind the newest block it
+    is retired: its visuals leave the scene and every reference live blocks hold
+    to it is cut, so the retired history can be garbage collected.
+
+    GHOSTDAG stays correct across retirement as long as the window is much wider
+    than the network delay, since mergesets never reach that far back. Blue scores
+    are cumulative and stored per block, so they are unaffected.
+
+    Attributes:
+        dag: The KaspaDAG instance this streamer is attached to
+    """
+
+    def __init__(self, dag: KaspaDAG):
+        """Initialize streamer with reference to parent DAG."""
+        self.dag = dag
+
+    def create_blocks_from_stream(self, block_stream: Iterable[dict], window_seconds: float) -> int:
+        """
+        Create blocks from a stream, retiring those that leave the time window.
+
+        Args:
+            block_stream: Iterable of block dictionaries (hash, timestamp, parents)
+            window_seconds: Width of the live window in seconds
+
+        Returns:
+            Number of blocks created from the stream
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be > 0")
+        window_ms = window_seconds * 1000
+
+        initial_tips = self.dag.get_current_tips()
+
+        # Blocks that existed before streaming started sit at stream time 0
+        live = deque((0, block) for block in self.dag.all_blocks)
+        hash_to_block: dict[str, KaspaLogicalBlock] = {}
+        block_hashes: dict[KaspaLogicalBlock, str] = {}
+        created = 0
+
+        for block_dict in block_stream:
+            timestamp = block_dict['timestamp']
+            parent_hashes = block_dict.get('parents', [])
+
+            if parent_hashes:
+                # Parents already retired are dropped, like any block outside the window
+                parents = [hash_to_block[h] for h in parent_hashes if h in hash_to_block]
+                if not parents:
+                    parents = self.dag.get_current_tips()
+            else:
+                parents = [tip for tip in initial_tips if self.dag.blocks.get(tip.name) is tip]
+                if not parents:
+                    parents = self.dag.get_current_tips()
+
+            placeholder = self.dag.queue_block(timestamp=timestamp, parents=parents)
+            self.dag.catch_up()
+
+            block = placeholder.actual_block
+            hash_to_block[block_dict['hash']] = block
+            block_hashes[block] = block_dict['hash']
+            live.append((timestamp, block))
+            created += 1
+
+            while live and live[0][0] < timestamp - window_ms:
+                _, retired = live.popleft()
+                self._retire_block(retired)
+                retired_hash = block_hashes.pop(retired, None)
+                if retired_hash is not None:
+                    del hash_to_block[retired_hash]
+
+        return created
+
+    def _retire_block(self, block: KaspaLogicalBlock) -> None:
+        """Remove a block from the scene and cut all references live blocks hold to it."""
+        # Children keep their round (and thus naming) once their history is gone
+        for child in block.children:
+            self.dag.retrieval.get_round(child)
+
+        self.dag.lod.release(block)
+        visual = block.visual_block
+        if visual is not None:
+            self.dag.relationship_highlighter.forget(block)
+            self.dag.sprites.forget(visual)
+            self.dag.scene.remove(visual, *visual.parent_lines)
+            for parent in block.parents:
+                if parent.visual_block is not None:
+                    parent.visual_block.child_lines = [
+                        line for line in parent.visual_block.child_lines if line not in visual.parent_lines
+                    ]
+
+        for child in block.children:
+            self._detach_parent(child, block)
+        for parent in block.parents:
+            if block in parent.children:
+                parent.children.remove(block)
+        block.children = []
+
+        for live_block in self.dag.all_blocks:
+            ghostdag = live_block.ghostdag
+            ghostdag.local_blue_pov.pop(block, None)
+            if block in ghostdag.unordered_mergeset:
+                ghostdag.unordered_mergeset.remove(block)
+            ghostdag.blue_anticone.discard(block)
+
+        self.dag.blocks.pop(block.name, None)
+        self.dag.all_blocks.remove(block)
+        self.dag.retrieval.forget_round(block)
+        self.dag.movement.invalidate_rightmost_x()
+
+    def _detach_parent(self, child: KaspaLogicalBlock, parent: KaspaLogicalBlock) -> None:
+        """Remove a retired parent (and its line) from a live child.
+
+        selected_parent is left pointing at a retired parent: it is fixed once
+        GHOSTDAG ran, and re-selecting among the remaining parents would change
+        the child's consensus data and line styles.
+        """
+        for line, line_parent in child.get_parent_line_pairs():
+            if line_parent is parent:
+                child.visual_block.parent_lines.remove(line)
+                parent.visual_block.child_lines.remove(line)
+                self.dag.scene.remove(line)
+                self.dag.relationship_highlighter.line_styles.pop(line, None)
+        child.parents.remove(parent)
+
+
+class DAGImporter:
+    """
+    Bulk-loads block DAG dumps exported from a node into the logical DAG.
+
+    Records are read one at a time and turned into logical blocks directly,
+    bypassing the queue, naming and layout machinery used for animated creation.
+    Blue scores from the file are trusted by default, so no GHOSTDAG traversal
+    runs and ingest is linear in the number of blocks. Visuals are only built for
+    a requested window of records, laid out by column like animated blocks.
+
+    Limitation: a trusted block only has its blue score. Its mergeset, local blue
+    POV and blue anticone stay empty and its GhostDAGData is marked trusted and
+    incomplete. Blocks added on top of it get approximate GHOSTDAG data (a warning
+    is logged), and animate_ghostdag_process refuses incomplete blocks. Loading
+    with verify_blue_scores=True computes full GHOSTDAG data for every block whose
+    past is complete; blocks descending from a segment root remain trusted.
+
+    Attributes:
+        dag: The KaspaDAG instance this importer is attached to
+        hash_to_id: External hash -> internal id (import order)
+        imported_blocks: Internal id -> block
+        complete_past: Internal id -> whether the block's whole past is in the imported data
+        blue_score_mismatches: (hash, file_blue_score, computed_blue_score) from the last verified load
+    """
+
+    def __init__(self, dag: KaspaDAG):
+        """Initialize importer with reference to parent DAG."""
+        self.dag = dag
+        self.hash_to_id: dict[str, int] = {}
+        self.imported_blocks: List[KaspaLogicalBlock] = []
+        self.complete_past: List[bool] = []
+        self.blue_score_mismatches: List[tuple[str, int, int]] = []
+
+    def get_block(self, block_hash: str) -> Optional[KaspaLogicalBlock]:
+        """Get an imported block by external hash."""
+        block_id = self.hash_to_id.get(block_hash)
+        return None if block_id is None else self.imported_blocks[block_id]
+
+    def load(
+            self,
+            path: str,
+            window: Optional[tuple[int, int]] = None,
+            verify_blue_scores: bool = False,
+            animate: bool = False
+    ) -> int:
+        """
+        Ingest every record of a DAG dump, then build visuals for the window.
+
+        Parents missing from the file mark a segment root. A block's past is
+        complete when it is not a root and every parent's past is complete; only
+        those blocks are recomputed when verifying, all others (roots and their
+        descendants) keep the file's blue score. On a mismatch the file's score
+        is kept and the difference is recorded in blue_score_mismatches.
+
+        Returns:
+            Number of blocks loaded
+        """
+        first_id = len(self.imported_blocks)
+        self.blue_score_mismatches = []
+
+        for record in read_dag_file(path):
+            if record.hash in self.hash_to_id:
+                logger.warning(f"Skipping duplicate block {record.hash} in {path}")
+                continue
+
+            parents = [
+                self.imported_blocks[self.hash_to_id[h]]
+                for h in record.parents
+                if h is not None and h in self.hash_to_id
+            ]
+            is_root = len(parents) < len(record.parents)
+            complete_past = not is_root and all(self.complete_past[self.hash_to_id[h]] for h in record.parents)
+
+            # Trust the file unless verifying a block whose full past is known
+            trusted_score = record.blue_score
+            if verify_blue_scores and parents and complete_past:
+                trusted_score = None
+
+            block = KaspaLogicalBlock(
+                name=self._block_name(record.hash),
+                timestamp=record.timestamp,
+                parents=parents,
+                config=self.dag.config,
+                hash_value=self._tie_breaker(record.hash),
+                blue_score=trusted_score,
+                with_visual=False
+            )
+
+            if not record.parents:
+                # Genesis has nothing to compute, its (empty) GHOSTDAG data is complete
+                block.ghostdag.trusted = False
+                block.ghostdag.complete = True
+
+            if trusted_score is None and record.blue_score is not None \
+                    and block.ghostdag.blue_score != record.blue_score:
+                self.blue_score_mismatches.append((record.hash, record.blue_score, block.ghostdag.blue_score))
+                block.ghostdag.blue_score = record.blue_score
+
+            self.hash_to_id[record.hash] = len(self.imported_blocks)
+            self.imported_blocks.append(block)
+            self.complete_past.append(complete_past)
+            self.dag.blocks[block.name] = block
+            self.dag.all_blocks.append(block)
+            if not record.parents and self.dag.genesis is None:
+                self.dag.genesis = block
+
+        loaded = len(self.imported_blocks) - first_id
+
+        if self.blue_score_mismatches:
+            shown = ", ".join(
+                f"{h[:12]} (file {expected}, computed {actual})"
+                for h, expected, actual in self.blue_score_mismatches[:5]
+            )
+            logger.warning(
+                f"{len(self.blue_score_mismatches)} of {loaded} blue scores differ from {path}: {shown}"
+            )
+
+        if window is not None:
+            start, stop = window
+            start = max(0, start)
+            stop = min(loaded, stop)
+            self._create_window_visuals(self.imported_blocks[first_id + start:first_id + stop], animate)
+
+        return loaded
+
+    def _block_name(self, block_hash: str) -> str:
+        """Short, unique display name derived from the external hash."""
+        name = block_hash[:12]
+        return block_hash if name in self.dag.blocks else name
+
+    @staticmethod
+    def _tie_breaker(block_hash: str) -> int:
+        """32-bit tie-breaker that keeps the node's hash ordering where possible."""
+        try:
+            return int(block_hash[:8], 16)
+        except ValueError:
+            return zlib.crc32(block_hash.encode())
+
+    def _create_window_visuals(self, blocks: List[KaspaLogicalBlock], animate: bool) -> None:
+        """Lay out and show visuals for a topologically ordered window of blocks."""
+        if not blocks:
+            return
+
+        config = self.dag.config
+
+        # Columns follow the usual rule: one step right of the rightmost (windowed) parent
+        x_positions: dict[KaspaLogicalBlock, float] = {}
+        columns: dict[float, List[KaspaLogicalBlock]] = {}
+        for block in blocks:
+            parent_xs = [x_positions[p] for p in block.parents if p in x_positions]
+            x = max(parent_xs) + config.horizontal_spacing if parent_xs else config.genesis_x
+            x_positions[block] = x
+            columns.setdefault(round(x, 6), []).append(block)
+
+        # Each column is centered around genesis_y, oldest at the bottom
+        positions: dict[KaspaLogicalBlock, tuple[float, float]] = {}
+        for column in columns.values():
+            offset = (len(column) - 1) / 2
+            for i, block in enumerate(column):
+                positions[block] = (x_positions[block], config.genesis_y + (i - offset) * config.vertical_spacing)
+
+        # Parents precede children, so parent visuals exist when lines are drawn
+        for block in blocks:
+            block.create_visual(positions[block])
+        self.dag.movement.invalidate_rightmost_x()
+
+        if animate:
+            self.dag.scene.play(*[block.visual_block.create_with_lines() for block in blocks])
+        else:
+            mobjects = []
+            for block in blocks:
+                mobjects.extend(block.visual_block.create_instantly())
+            self.dag.scene.add(*mobjects)
+
+
+class SnapshotManager:
+    """
+    Saves and restores a fully computed KaspaDAG.
+
+    Manim re-runs construct() on every render, so simulation, GHOSTDAG and layout
+    are normally recomputed each time. A snapshot stores the logical state as flat
+    NumPy arrays in an uncompressed .npz file (arrays are read lazily on load):
+
+    - structure: parents in CSR form (offsets + indices), selected parent first
+    - GHOSTDAG: blue scores, mergesets with per-member blue flags, blue anticones, trusted flags
+    - identity: names, hashes, timestamps
+    - layout: block positions and label texts
+    - config and simulator RNG state as JSON
+
+    On load every block is rebuilt from the arrays without any graph traversal
+    (local blue POVs are replayed from mergeset colors), and only the visuals are
+    constructed and added to the scene.
+
+    Attributes:
+        dag: The KaspaDAG instance this manager is attached to
+    """
+
+    VERSION = 3
+
+    def __init__(self, dag: KaspaDAG):
+        """Initialize snapshot manager with reference to parent DAG."""
+        self.dag = dag
+
+    def save(self, path: str) -> None:
+        """Write the DAG's logical state to a versioned snapshot file."""
+        blocks = self.dag.all_blocks
+        index_of = {block: i for i, block in enumerate(blocks)}
+
+        parent_offsets = [0]
+        parent_indices = []
+        mergeset_offsets = [0]
+        mergeset_indices = []
+        mergeset_blue = []
+        anticone_offsets = [0]
+        anticone_indices = []
+        positions = np.full((len(blocks), 2), np.nan)
+        labels = []
+
+        for i, block in enumerate(blocks):
+            parent_indices.extend(index_of[p] for p in block.parents)
+            parent_offsets.append(len(parent_indices))
+
+            pov = block.ghostdag.local_blue_pov
+            for member in block.ghostdag.unordered_mergeset:
+                if member in index_of:
+                    mergeset_indices.append(index_of[member])
+                    mergeset_blue.append(pov.get(member, False))
+            mergeset_offsets.append(len(mergeset_indices))
+
+            anticone_indices.extend(index_of[b] for b in block.ghostdag.blue_anticone if b in index_of)
+            anticone_offsets.append(len(anticone_indices))
+
+            visual = block.visual_block or self.dag.lod.collapsed.get(block)
+            if visual is not None:
+                positions[i] = visual.square.get_center()[:2]
+                labels.append(visual._label_text)
+            else:
+                labels.append("")
+
+        config_values = {
+            key: value.to_hex() if isinstance(value, ManimColor) else value
+            for key, value in vars(self.dag.config).items()
+        }
+
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                version=np.array(self.VERSION),
+                names=np.array([block.name for block in blocks], dtype=str),
+                labels=np.array(labels, dtype=str),
+                hashes=np.array([block.hash for block in blocks], dtype=np.uint64),
+                timestamps=np.array(
+                    [np.nan if block.timestamp is None else block.timestamp for block in blocks],
+                    dtype=np.float64
+                ),
+                blue_scores=np.array([block.ghostdag.blue_score for block in blocks], dtype=np.int64),
+                trusted=np.array([block.ghostdag.trusted for block in blocks], dtype=bool),
+                positions=positions,
+                parent_offsets=np.array(parent_offsets, dtype=np.int64),
+                parent_indices=np.array(parent_indices, dtype=np.int64),
+                mergeset_offsets=np.array(mergeset_offsets, dtype=np.int64),
+                mergeset_indices=np.array(mergeset_indices, dtype=np.int64),
+                mergeset_blue=np.array(mergeset_blue, dtype=bool),
+                anticone_offsets=np.array(anticone_offsets, dtype=np.int64),
+                anticone_indices=np.array(anticone_indices, dtype=np.int64),
+                config=np.array(json.dumps(config_values)),
+                rng_state=np.array(json.dumps(self.dag.simulator.rng.bit_generator.state)),
+            )
+
+    def load(self, path: str) -> None:
+        """Rebuild the DAG from a snapshot file. The DAG must not contain blocks yet."""
+        if self.dag.all_blocks:
+            raise ValueError("load_snapshot requires an empty DAG")
+
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != self.VERSION:
+                raise ValueError(f"Unsupported snapshot version {version} (expected {self.VERSION})")
+
+            self._restore_config(json.loads(str(data["config"])))
+            self.dag.simulator.rng.bit_generator.state = json.loads(str(data["rng_state"]))
+
+            names = data["names"]
+            labels = data["labels"]
+            hashes = data["hashes"]
+            timestamps = data["timestamps"]
+            blue_scores = data["blue_scores"]
+            trusted = data["trusted"]
+            positions = data["positions"]
+            parent_offsets = data["parent_offsets"]
+            parent_indices = data["parent_indices"]
+            mergeset_offsets = data["mergeset_offsets"]
+            mergeset_indices = data["mergeset_indices"]
+            mergeset_blue = data["mergeset_blue"]
+            anticone_offsets = data["anticone_offsets"]
+            anticone_indices = data["anticone_indices"]
+
+        blocks: List[KaspaLogicalBlock] = []
+        mobjects = []
+        for i in range(len(names)):
+            parents = [blocks[j] for j in parent_indices[parent_offsets[i]:parent_offsets[i + 1]]]
+            has_visual = not np.isnan(positions[i, 0])
+
+            # Visual is built after the GHOSTDAG replay, with the saved label
+            block = KaspaLogicalBlock(
+                name=str(names[i]),
+                timestamp=None if np.isnan(timestamps[i]) else float(timestamps[i]),
+                parents=parents,
+                config=self.dag.config,
+                hash_value=int(hashes[i]),
+                blue_score=int(blue_scores[i]),
+                with_visual=False
+            )
+
+            # Replay GHOSTDAG data: POV inherits the selected parent's, then mergeset colors
+            members = mergeset_indices[mergeset_offsets[i]:mergeset_offsets[i + 1]]
+            colors = mergeset_blue[mergeset_offsets[i]:mergeset_offsets[i + 1]]
+            block.ghostdag.unordered_mergeset = [blocks[j] for j in members]
+            if block.selected_parent is not None:
+                pov = block.selected_parent.ghostdag.local_blue_pov.copy()
+                pov[block.selected_parent] = True
+                for j, is_blue in zip(members, colors):
+                    if blocks[j] is not block.selected_parent:
+                        pov[blocks[j]] = bool(is_blue)
+                block.ghostdag.local_blue_pov = pov
+            block.ghostdag.blue_anticone = {
+                blocks[j] for j in anticone_indices[anticone_offsets[i]:anticone_offsets[i + 1]]
+            }
+            block.ghostdag.trusted = bool(trusted[i])
+            block.ghostdag.complete = not block.ghostdag.trusted and (
+                block.selected_parent is None or block.selected_parent.ghostdag.complete
+            )
+
+            if has_visual:
+                block.create_visual((float(positions[i, 0]), float(positions[i, 1])), label_text=str(labels[i]) or None)
+                mobjects.extend(block.visual_block.create_instantly())
+
+            blocks.append(block)
+            self.dag.blocks[block.name] = block
+            self.dag.all_blocks.append(block)
+            if not parents and self.dag.genesis is None:
+                self.dag.genesis = block
+
+        if mobjects:
+            self.dag.scene.add(*mobjects)
+        self.dag.movement.invalidate_rightmost_x()
+
+    def _restore_config(self, values: dict) -> None:
+        """Apply saved config values directly (the DAG is empty, so nothing is locked).
+
+        Colors were saved as hex strings and are turned back into ManimColor.
+        """
+        field_names = {f.name for f in fields(self.dag.config)}
+        color_keys = {key for key, hint in KaspaConfig.__annotations__.items() if hint is ParsableManimColor}
+        for key, value in values.items():
+            if isinstance(value, str) and (key in color_keys or isinstance(getattr(self.dag.config, key, None), ManimColor)):
+                value = ManimColor(value)
+            if key in field_names or hasattr(self.dag.config, key):
+                setattr(self.dag.config, key, value)
+        self.dag.config.__post_init__()
+
+
+class HistoryLOD:
+    """
+    Level of detail for history far behind the camera.
+
+    Blocks whose square lies more than lod_frames_behind frame widths left of the
+    camera are collapsed: their visual block and parent lines leave the scene and
+    the visual is detached from the logical block, so they also drop out of
+    rendered_blocks (and every highlight/fade scan). Lines from rendered children
+    to a collapsed block leave the scene with it. One HistorySummary strip with
+    a block count is drawn over the collapsed range instead. Collapsed blocks are
+    rehydrated (the same visual objects re-added) when the camera comes back.
+
+    Rendered and collapsed blocks are kept ordered by x, so an update walks from
+    the left up to the cutoff instead of scanning every block.
+
+    Blocks with a highlight style are never collapsed, so resets stay correct.
+
+    Attributes:
+        dag: The KaspaDAG instance this manager is attached to
+        collapsed: Detached visual block of every collapsed block
+        hidden_lines: Lines of rendered children to a collapsed parent, out of the scene until it is rehydrated
+        summary: Mobject standing in for the collapsed blocks (None while nothing is collapsed)
+    """
+
+    def __init__(self, dag: KaspaDAG):
+        self.dag = dag
+        self.collapsed: dict[KaspaLogicalBlock, KaspaVisualBlock] = {}
+        self.hidden_lines: set[ParentLine] = set()
+        self.summary: Optional[HistorySummary] = None
+        self._rendered: XOrderedHistory[KaspaLogicalBlock] = XOrderedHistory()
+        self._collapsed_order: XOrderedHistory[KaspaLogicalBlock] = XOrderedHistory()
+        # all_blocks before this index are indexed (or had no visual when they were reached)
+        self._synced = 0
+
+    def update(self) -> None:
+        """Collapse blocks that fell behind the camera and rehydrate those back in range."""
+        if not self.dag.config.lod_enabled:
+            return
+        cutoff = history_cutoff_x(self.dag.scene.camera.frame, self.dag.config.lod_frames_behind)
+        self._sync()
+
+        if self._collapsed_order and cutoff <= self._collapsed_order.last_x():
+            self.rehydrate(self._collapsed_order.from_x(cutoff))
+
+        styled = self.dag.relationship_highlighter.block_styles
+        self.collapse([block for block in self._rendered.before(cutoff) if block not in styled])
+
+    def collapse(self, blocks: Iterable[KaspaLogicalBlock]) -> None:
+        """Replace blocks' visuals in the scene with the history summary."""
+        mobjects = []
+        collapsed = []
+        for block in blocks:
+            visual = block.detach_visual()
+            if visual is None:
+                continue
+            self.dag.sprites.forget(visual)
+            self.collapsed[block] = visual
+            collapsed.append((block, visual.square.get_right()[0]))
+
+            # Own lines go with the block, lines of rendered children wait for it to come back
+            child_lines = self._rendered_child_lines(block, visual)
+            self.hidden_lines.difference_update(visual.parent_lines)
+            self.hidden_lines.update(child_lines)
+            mobjects.extend([visual, *visual.parent_lines, *child_lines])
+        if mobjects:
+            self._rendered.remove_many(block for block, _ in collapsed)
+            self._collapsed_order.add_many(collapsed)
+            self.dag.scene.remove(*mobjects)
+            self._update_summary()
+
+    def rehydrate(self, blocks: Optional[Iterable[KaspaLogicalBlock]] = None) -> None:
+        """Bring collapsed blocks (all if None) back into the scene as full visual blocks."""
+        blocks = list(self.collapsed) if blocks is None else [b for b in blocks if b in self.collapsed]
+        if not blocks:
+            return
+        restored = []
+        for block in blocks:
+            visual = self.collapsed.pop(block)
+            block.attach_visual(visual)
+            restored.append((block, visual.square.get_right()[0]))
+        self._collapsed_order.remove_many(block for block, _ in restored)
+        self._rendered.add_many(restored)
+
+        # Attach everything first, so lines between blocks of this batch are shown
+        mobjects = []
+        for block in blocks:
+            visual = block.visual_block
+            collapsed_squares = {id(self.collapsed[p].square) for p in block.parents if p in self.collapsed}
+            mobjects.append(visual)
+            for line in visual.parent_lines:
+                if id(line.parent_block) in collapsed_squares:
+                    self.hidden_lines.add(line)
+                else:
+                    mobjects.append(line)
+            child_lines = self._rendered_child_lines(block, visual)
+            self.hidden_lines.difference_update(child_lines)
+            mobjects.extend(child_lines)
+        self.dag.scene.add(*dict.fromkeys(mobjects))
+        self._update_summary()
+
+    def release(self, block: KaspaLogicalBlock) -> None:
+        """Reattach a collapsed block's visual without showing it (before the block is retired)."""
+        if block in self.dag.all_blocks[:self._synced]:
+            self._synced -= 1
+        self._rendered.remove(block)
+        self._collapsed_order.remove(block)
+        visual = self.collapsed.pop(block, None)
+        if visual is not None:
+            block.attach_visual(visual)
+            self._update_summary()
+        visual = block.visual_block
+        if visual is not None:
+            self.hidden_lines.difference_update(visual.parent_lines)
+            self.hidden_lines.difference_update(visual.child_lines)
+
+    def reindex(self, blocks: Iterable[KaspaLogicalBlock]) -> None:
+        """Re-sort rendered blocks after they moved horizontally."""
+        for block in blocks:
+            if block in self._rendered:
+                self._rendered.add(block, block.visual_block.square.get_right()[0])
+
+    def _sync(self) -> None:
+        """Index blocks created (or imported) since the last update."""
+        blocks = self.dag.all_blocks
+        if self._synced < len(blocks):
+            self._rendered.add_many(
+                (block, block.visual_block.square.get_right()[0])
+                for block in blocks[self._synced:]
+                if block.visual_block is not None
+            )
+            self._synced = len(blocks)
+
+    @staticmethod
+    def _rendered_child_lines(block: KaspaLogicalBlock, visual: KaspaVisualBlock) -> List[ParentLine]:
+        """Lines from children that have a visual to the given (possibly detached) visual of block."""
+        return [
+            line
+            for child in block.children if child.visual_block is not None
+            for line in child.visual_block.parent_lines if line.parent_block is visual.square
+        ]
+
+    def _update_summary(self) -> None:
+        if not self.collapsed:
+            if self.summary is not None:
+                self.dag.scene.remove(self.summary)
+            return
+
+        squares = [visual.square for visual in self.collapsed.values()]
+        x_min = min(square.get_left()[0] for square in squares)
+        x_max = self._collapsed_order.last_x()
+        y_min = min(square.get_bottom()[1] for square in squares)
+        y_max = max(square.get_top()[1] for square in squares)
+
+        if self.summary is None:
+            self.summary = HistorySummary(color=self.dag.config.block_color)
+        self.summary.set_range(x_min, x_max, y_min, y_max, len(self.collapsed))
+        self.dag.scene.add(self.summary)
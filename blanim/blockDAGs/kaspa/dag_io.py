@@ -0,0 +1,177 @@
+# blanim\blanim\blockDAGs\kaspa\dag_io.py
+"""
+Streaming readers/writers for block DAG dumps exported from a Kaspa node.
+
+Two formats are supported:
+
+- **JSONL**: one JSON object per line with ``hash``, ``parents``, ``timestamp`` and
+  ``blue_score`` (camelCase ``blueScore``/``parentHashes`` are accepted as well).
+  A plain ``.json`` file holding a list of such objects is also accepted.
+- **Binary** (``.bldag``): a compact fixed-layout format. Parents are stored as
+  indices of earlier records instead of repeating 32-byte hashes.
+
+Records must be in topological order (parents before children), which is how
+nodes export headers. Readers are generators, so files of any size are processed
+one record at a time.
+
+Binary layout (little-endian)::
+
+    header:  magic b"BLDAG\\0" | uint16 version | uint32 record_count
+    record:  32s hash | float64 timestamp (NaN if unknown) | int64 blue_score (-1 if unknown)
+             | uint16 parent_count | parent_count * uint32 parent_index
+             (parent_index 0xFFFFFFFF marks a parent outside the file)
+"""
+
+from __future__ import annotations
+
+__all__ = ["BlockRecord", "read_dag_file", "read_jsonl", "read_binary", "write_binary"]
+
+import json
+import math
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+BINARY_MAGIC = b"BLDAG\0"
+BINARY_VERSION = 1
+EXTERNAL_PARENT = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<6sHI")
+_RECORD = struct.Struct("<32sdqH")
+_PARENT = struct.Struct("<I")
+
+
+@dataclass
+class BlockRecord:
+    """A single block read from a DAG dump.
+
+    Parents that are not part of the file (segment roots) may appear as unknown
+    hashes, or as None when the binary format only knows they exist.
+    """
+    hash: str
+    parents: List[Optional[str]] = field(default_factory=list)
+    timestamp: Optional[float] = None
+    blue_score: Optional[int] = None
+
+
+def _first_key(entry: dict, *keys, default=None):
+    for key in keys:
+        if key in entry:
+            return entry[key]
+    return default
+
+
+def _record_from_dict(entry: dict) -> BlockRecord:
+    blue_score = _first_key(entry, "blue_score", "blueScore")
+    timestamp = _first_key(entry, "timestamp", "timeInMilliseconds")
+    return BlockRecord(
+        hash=str(entry["hash"]),
+        parents=[str(p) for p in _first_key(entry, "parents", "parentHashes", "parent_hashes", default=[])],
+        timestamp=None if timestamp is None else float(timestamp),
+        blue_score=None if blue_score is None else int(blue_score),
+    )
+
+
+def read_jsonl(path: str | Path) -> Iterator[BlockRecord]:
+    """Yield records from a JSONL file (or a JSON list file), one at a time."""
+    path = Path(path)
+    if path.suffix == ".json":
+        with path.open("r", encoding="utf-8") as f:
+            for entry in json.load(f):
+                yield _record_from_dict(entry)
+        return
+
+    with path.open("r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e.msg})") from e
+            yield _record_from_dict(entry)
+
+
+def read_binary(path: str | Path) -> Iterator[BlockRecord]:
+    """Yield records from a compact binary DAG file, one at a time."""
+    path = Path(path)
+    with path.open("rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{path}: truncated header")
+        magic, version, count = _HEADER.unpack(header)
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"{path}: not a blanim binary DAG file")
+        if version != BINARY_VERSION:
+            raise ValueError(f"{path}: unsupported binary DAG version {version} (expected {BINARY_VERSION})")
+
+        hashes: List[str] = []
+        for _ in range(count):
+            raw = f.read(_RECORD.size)
+            if len(raw) < _RECORD.size:
+                raise ValueError(f"{path}: truncated record {len(hashes)}")
+            block_hash, timestamp, blue_score, parent_count = _RECORD.unpack(raw)
+
+            parent_data = f.read(_PARENT.size * parent_count)
+            parents: List[Optional[str]] = []
+            for (index,) in _PARENT.iter_unpack(parent_data):
+                parents.append(None if index == EXTERNAL_PARENT else hashes[index])
+
+            hex_hash = block_hash.hex()
+            hashes.append(hex_hash)
+            yield BlockRecord(
+                hash=hex_hash,
+                parents=parents,
+                timestamp=None if math.isnan(timestamp) else timestamp,
+                blue_score=None if blue_score < 0 else blue_score,
+            )
+
+
+def read_dag_file(path: str | Path) -> Iterator[BlockRecord]:
+    """Yield records from a DAG dump, picking the reader from the file contents."""
+    path = Path(path)
+    with path.open("rb") as f:
+        is_binary = f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    return read_binary(path) if is_binary else read_jsonl(path)
+
+
+def write_binary(records: Iterable[BlockRecord], path: str | Path) -> int:
+    """Write records (in topological order) to the compact binary format.
+
+    Hashes must be 32-byte hex strings, as produced by Kaspa nodes.
+
+    Returns:
+        Number of records written
+    """
+    path = Path(path)
+    index_of: dict[str, int] = {}
+
+    with path.open("wb") as f:
+        f.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0))
+
+        for record in records:
+            try:
+                raw_hash = bytes.fromhex(record.hash)
+            except ValueError:
+                raw_hash = b""
+            if len(raw_hash) != 32:
+                raise ValueError(f"Block hash {record.hash!r} is not a 32-byte hex string")
+
+            parent_indices = [index_of.get(p, EXTERNAL_PARENT) if p is not None else EXTERNAL_PARENT
+                              for p in record.parents]
+            f.write(_RECORD.pack(
+                raw_hash,
+                math.nan if record.timestamp is None else record.timestamp,
+                -1 if record.blue_score is None else record.blue_score,
+                len(parent_indices),
+            ))
+            f.write(b"".join(_PARENT.pack(i) for i in parent_indices))
+            index_of[record.hash] = len(index_of)
+
+        # Record count is only known at the end
+        f.seek(0)
+        f.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(index_of)))
+
+    return len(index_of)
@@ -7,6 +7,8 @@ __all__ = ["KaspaLogicalBlock"]
 import secrets
 from dataclasses import dataclass, field
 
+from manim import logger
+
 from .visual_block import KaspaVisualBlock
 from typing import Optional, List, Set, Any, Dict
 
@@ -14,6 +16,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ... import _KaspaConfigInternal
+    from ...core.parent_line import ParentLine
 
 @dataclass
 class GhostDAGData:
@@ -25,6 +28,11 @@ class GhostDAGData:
     # NEW: Store local POV - blue status of all blocks evaluated from this block's perspective
     local_blue_pov: Dict['KaspaLogicalBlock', bool] = field(default_factory=dict)
 
+    # Blue score given from outside (e.g. a node dump), mergeset and blue sets were not computed
+    trusted: bool = False
+    # False if this block or any block on its selected parent chain is trusted
+    complete: bool = True
+
 class KaspaLogicalBlock:
     """Kaspa logical block with GHOSTDAG consensus."""
 
@@ -34,7 +42,10 @@ class KaspaLogicalBlock:
             timestamp: Optional[float] = None,
             parents: Optional[List[KaspaLogicalBlock]] = None,
             position: tuple[float, float] = (0, 0),
-            config: _KaspaConfigInternal = None
+            config: _KaspaConfigInternal = None,
+            hash_value: Optional[int] = None,
+            blue_score: Optional[int] = None,
+            with_visual: bool = True
     ):
         if config is None:
             raise ValueError("config parameter is required")
@@ -45,7 +56,7 @@ class KaspaLogicalBlock:
         # Time Created
         self.timestamp = timestamp
         # Tie-breaker (instead of actually hashing, just use a random number like a cryptographic hash)
-        self.hash = secrets.randbits(32)  # 32-bit random integer to keep prob(collision) = low
+        self.hash = hash_value if hash_value is not None else secrets.randbits(32)  # 32-bit random integer to keep prob(collision) = low
 
         # DAG structure (single source of truth)
         self.parents = parents if parents else []
@@ -59,22 +70,62 @@ class KaspaLogicalBlock:
         if self.parents:
             self.selected_parent = self._select_parent()
             self.parents.sort(key=lambda p: p != self.selected_parent) #move SP to the index 0 before sending to visual
-            self._create_unordered_mergeset()
-            self._compute_ghostdag(self.config.k)
+            if blue_score is None:
+                self._create_unordered_mergeset()
+                self._compute_ghostdag(self.config.k)
+        if blue_score is not None:
+            # Trusted blue score (e.g. bulk import from a node dump), GHOSTDAG is skipped
+            self.ghostdag.blue_score = blue_score
+            self.ghostdag.trusted = True
+            self.ghostdag.complete = False
 
         # Create visual after GHOSTDAG computation
-        parent_visuals = [p.visual_block for p in self.parents]
+        self._visual: Optional[KaspaVisualBlock] = None
+        if with_visual:
+            self.create_visual(position)
+
+        # Register as child in parents
+        for parent in self.parents:
+            parent.children.append(self)
+
+    def create_visual(self, position: tuple[float, float], label_text: Optional[str] = None) -> KaspaVisualBlock:
+        """Create the visual block, drawing lines only to parents that have visuals.
+
+        The label defaults to the blue score.
+        """
+        parent_visuals = [p.visual_block for p in self.parents if p.visual_block is not None]
         self._visual = KaspaVisualBlock(
-            label_text=str(self.ghostdag.blue_score),#TODO update this  NOTE: when passing an empty string, positioning breaks (fixed moving blocks by overriding move_to with only visual.square)
+            label_text=str(self.ghostdag.blue_score) if label_text is None else label_text,#TODO update this  NOTE: when passing an empty string, positioning breaks (fixed moving blocks by overriding move_to with only visual.square)
             position=position,
             parents=parent_visuals,
             config=self.config
         )
         self._visual.logical_block = self  # Bidirectional link
+        return self._visual
 
-        # Register as child in parents
-        for parent in self.parents:
-            parent.children.append(self)
+    def detach_visual(self) -> Optional[KaspaVisualBlock]:
+        """Detach and return the visual block, the caller keeps it (e.g. collapsed history)."""
+        visual, self._visual = self._visual, None
+        return visual
+
+    def attach_visual(self, visual: KaspaVisualBlock) -> None:
+        """Reattach a visual block returned by detach_visual."""
+        self._visual = visual
+
+    def get_parent_line_pairs(self) -> List[tuple[ParentLine, KaspaLogicalBlock]]:
+        """Pair each parent line with the parent it points to.
+
+        Lines are matched by their parent square rather than list position, since
+        parents without visuals (or detached parents) have no line.
+        """
+        if self._visual is None:
+            return []
+        by_square = {id(p.visual_block.square): p for p in self.parents if p.visual_block is not None}
+        return [
+            (line, by_square[id(line.parent_block)])
+            for line in self._visual.parent_lines
+            if id(line.parent_block) in by_square
+        ]
 
     @staticmethod
     def _get_sort_key(block: 'KaspaLogicalBlock') -> tuple:
@@ -130,6 +181,15 @@ class KaspaLogicalBlock:
         if not self.selected_parent:
             return
 
+        if not self.selected_parent.ghostdag.complete:
+            # The baseline POV below is empty or partial, so blue sets and blue score are approximate
+            self.ghostdag.complete = False
+            if self.selected_parent.ghostdag.trusted:
+                logger.warning(
+                    f"GHOSTDAG data of {self.name} is approximate: selected parent {self.selected_parent.name} "
+                    f"only has a trusted blue score (import with verify_blue_scores=True)"
+                )
+
         total_view = set(self.get_past_cone())
         selected_parent_blue_score = self.selected_parent.ghostdag.blue_score
 
@@ -246,8 +306,8 @@ class KaspaLogicalBlock:
     ########################################
 
     @property
-    def visual_block(self) -> KaspaVisualBlock:
-        """Public accessor for the visual block."""
+    def visual_block(self) -> Optional[KaspaVisualBlock]:
+        """Public accessor for the visual block (None until create_visual is called)."""
         return self._visual
 
     def __getattr__(self, attr: str) -> Any:
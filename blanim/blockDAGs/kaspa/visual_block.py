@@ -5,15 +5,15 @@ from __future__ import annotations
 __all__ = ["KaspaVisualBlock"]
 
 import copy
-from typing import TYPE_CHECKING, Callable, Any
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
-from manim import AnimationGroup, Create, BackgroundRectangle, ShowPassingFlash, cycle_animation, Animation, \
-    UpdateFromAlphaFunc
+from manim import AnimationGroup, Create, BackgroundRectangle, ShowPassingFlash, cycle_animation, Animation
 
-from ... import BaseVisualBlock, ParentLine
+from ... import BaseVisualBlock, ParentLine, BatchStyleAnimation
 
 if TYPE_CHECKING:
+    from ...core.batch_style import StyleTarget
     from .config import _KaspaConfigInternal
     from .logical_block import KaspaLogicalBlock
 
@@ -146,6 +146,7 @@ class KaspaVisualBlock(BaseVisualBlock):
                     is_selected_parent_line=is_selected
                 )
                 self.parent_lines.append(parent_line)
+                parent.child_lines.append(parent_line)
         else:
             self.parent_lines = []
 
@@ -290,7 +291,7 @@ class KaspaVisualBlock(BaseVisualBlock):
 
         This method updates:
         - All of the block's own parent lines (if they exist)
-        - All lines from children pointing to this block
+        - All lines from children pointing to this block (registered in child_lines)
 
         This is critical for DAG structures where blocks may have complex
         parent-child relationships with multiple connections. The method
@@ -308,10 +309,7 @@ class KaspaVisualBlock(BaseVisualBlock):
         animations.extend([line.create_update_animation() for line in self.parent_lines])
 
         # Update child lines (lines from children pointing to this block)
-        for logical_child in self.logical_block.children:
-            for line in logical_child.visual_block.parent_lines:
-                if line.parent_block == self.square:
-                    animations.append(line.create_update_animation())
+        animations.extend([line.create_update_animation() for line in self.child_lines])
 
         return AnimationGroup(*animations) if len(animations) > 1 else animation
 
@@ -348,38 +346,12 @@ class KaspaVisualBlock(BaseVisualBlock):
         # Wrap with line updates using existing method
         return self.create_movement_animation(base_animation)
 
-    def create_fade_animation(self) -> list[Any]:
-        """Create animations to fade this block using config opacity."""
-
-        # Special handling required for labels due to use of Transform
-        def fade_label(mob, alpha):
-            # Get current opacity values for all submobjects
-            start_opacities = {}
-            for submob in mob.submobjects:
-                start_opacities[submob] = submob.get_fill_opacity()
-
-                # Only animate submobjects that are currently visible
-            for submob in mob.submobjects:
-                if start_opacities[submob] > 0:  # Only affect visible submobjects
-                    # Interpolate from current opacity to target opacity
-                    current_opacity = start_opacities[submob]
-                    target_opacity = self.kaspa_config.fade_opacity
-                    new_opacity = current_opacity + alpha * (target_opacity - current_opacity)
-                    submob.set_fill(opacity=new_opacity, family=False)
-            return mob
-
-        return [
-            self.square.animate.set_fill(opacity=self.kaspa_config.fade_opacity),
-            self.square.animate.set_stroke(opacity=self.kaspa_config.fade_opacity),
-            UpdateFromAlphaFunc(self.label, fade_label) # type: ignore
-        ]
-
-    def create_highlight_animation(self, color=None, stroke_width=None) -> Any:
-        """Create animation to highlight this block's stroke using config."""
-        return self.square.animate.set_stroke(
-            self.kaspa_config.highlight_block_color,
-            width=self.kaspa_config.highlight_stroke_width
-        )
+    def get_highlight_targets(self, color=None, stroke_width=None) -> list[StyleTarget]:
+        """Style targets highlighting this block's stroke using config."""
+        return [(self.square, {
+            "stroke_color": color if color is not None else self.kaspa_config.highlight_block_color,
+            "stroke_width": stroke_width if stroke_width is not None else self.kaspa_config.highlight_stroke_width,
+        })]
 
     def create_pulsing_highlight(self, color=None, min_width=None, max_width=None) -> Callable:
         """Create updater function for pulsing stroke effect using config values."""
@@ -398,62 +370,31 @@ class KaspaVisualBlock(BaseVisualBlock):
 
         return pulse_stroke
 
-    def create_reset_animation(self) -> list[Any]:
-        """Create animations to reset block to neutral state from config."""
-
-        # Special handling required for labels due to use of Transform
-        def reset_label(mob, alpha):
-            # Get current opacity values for all submobjects
-            start_opacities = {}
-            for submob in mob.submobjects:
-                start_opacities[submob] = submob.get_fill_opacity()
-
-                # Only animate submobjects that are currently visible
-            for submob in mob.submobjects:
-                if start_opacities[submob] > 0:  # Only affect visible submobjects
-                    # Interpolate from current opacity to target opacity
-                    current_opacity = start_opacities[submob]
-                    target_opacity = self.kaspa_config.label_opacity
-                    new_opacity = current_opacity + alpha * (target_opacity - current_opacity)
-                    submob.set_fill(opacity=new_opacity, family=False)
-            return mob
-
-        return [
-            self.square.animate.set_style(
-                fill_color=self.kaspa_config.block_color,
-                fill_opacity=self.kaspa_config.fill_opacity,
-                stroke_color=self.kaspa_config.stroke_color,
-                stroke_width=self.kaspa_config.stroke_width,
-                stroke_opacity=self.kaspa_config.stroke_opacity
-            ),
-            UpdateFromAlphaFunc(self.label, reset_label) # type: ignore
-        ]
-
-    def create_line_fade_animations(self) -> list[Any]:
-        """Create animations to fade all parent lines."""
-        return [
-            line.animate.set_stroke(opacity=self.kaspa_config.fade_opacity)
-            for line in self.parent_lines
-        ]
-
-    def create_line_reset_animations(self) -> list[Any]:
-        """Create animations to reset all parent lines, respecting selected parent color."""
-        animations = []
-        for i, line in enumerate(self.parent_lines):
-            # First parent line is the selected parent
-            if i == 0:
-                color = self.kaspa_config.selected_parent_line_color
-            else:
-                color = self.kaspa_config.other_parent_line_color
+    def create_line_fade_animations(self) -> BatchStyleAnimation:
+        """Create animation fading all parent lines."""
+        return BatchStyleAnimation(self.get_line_fade_targets())
 
-            animations.append(
-                line.animate.set_style(
-                    stroke_color=color,
-                    stroke_width=self.kaspa_config.line_stroke_width,
-                    stroke_opacity=self.kaspa_config.line_stroke_opacity
-                )
-            )
-        return animations
+    def create_line_reset_animations(self) -> BatchStyleAnimation:
+        """Create animation resetting all parent lines, respecting selected parent color."""
+        return BatchStyleAnimation(self.get_line_reset_targets())
+
+    def get_line_reset_targets(self) -> list[StyleTarget]:
+        """Style targets resetting all parent lines, respecting selected parent color."""
+        return [(line, self.get_line_reset_style(line)) for line in self.parent_lines]
+
+    def get_line_reset_style(self, line: ParentLine) -> dict:
+        """Neutral style for one parent line, respecting selected parent color."""
+        # Lines remember whether they point at the selected parent
+        if line.is_selected:
+            color = self.kaspa_config.selected_parent_line_color
+        else:
+            color = self.kaspa_config.other_parent_line_color
+
+        return dict(
+            stroke_color=color,
+            stroke_width=self.kaspa_config.line_stroke_width,
+            stroke_opacity=self.kaspa_config.line_stroke_opacity
+        )
 
     def create_directional_line_flash(self) -> list:
         """Create flashing line copies with child-to-parent direction.
@@ -8,11 +8,50 @@ __all__ = [
     "Frame2DWrapper",
     "Frame2DAnimateWrapper",
     "TranscriptManager",
-    "BaseBlockConfig"
+    "BaseBlockConfig",
+    "BlockHasher",
+    "BatchStyleAnimation",
+    "ParentLineBatchUpdate",
+    "batch_line_updates",
+    "FlashLinePool",
+    "HistorySummary",
+    "XOrderedHistory",
+    "history_cutoff_x",
+    "LabelCache",
+    "label_cache",
+    "BlockPrototypeCache",
+    "block_prototypes",
+    "clone_leaf",
+    "SpriteCache",
+    "SpriteLayer",
+    "BakedLayerRenderer",
+    "get_animated_mobjects",
+    "DAGLineLayer",
+    "HUDCamera",
+    "HUDSceneMixin",
+    "HUDMovingCamera",
+    "MovingCameraHUDScene",
+    "NarrationCache",
+    "narration_cache",
+    "discover_narration_strings",
+    "precompile_narrations"
     # Add other core classes as you implement them
 ]
 
 from .base_visual_block import *
 from .parent_line import *
 from .hud_2d_scene import *
-from .base_config import *
\ No newline at end of file
+from .base_config import *
+from .block_hash import *
+from .batch_style import *
+from .flash_pool import *
+from .lod import *
+from .label_cache import *
+from .block_prototype import *
+from .sprite import *
+from .baked_layer import *
+from .line_layer import *
+from .hud_camera import *
+from .moving_camera_hud_scene import *
+from .narration_cache import *
+from .narration_precompile import *
\ No newline at end of file
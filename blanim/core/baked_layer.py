@@ -0,0 +1,156 @@
+# blanim\blanim\core\baked_layer.py
+
+from __future__ import annotations
+
+__all__ = ["BakedLayerRenderer", "get_animated_mobjects"]
+
+import hashlib
+from collections import OrderedDict
+from typing import Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+from manim.renderer.cairo_renderer import CairoRenderer
+
+if TYPE_CHECKING:
+    from manim import Mobject, Scene
+
+
+def get_animated_mobjects(scene: Scene, animations: Iterable) -> list[Mobject]:
+    """Top-level scene mobjects an upcoming play changes, precisely rather than by add order.
+
+    A mobject counts as animated if any member of its family is touched by an
+    animation, has an updater, or is a foreground mobject. If the camera is
+    animated everything moves. Static mobjects drawn above (higher z_index than)
+    the animated ones and overlapping them are animated too, since the static
+    layer is composited below every animated mobject.
+    """
+    camera = scene.renderer.camera
+    camera_mobjects = [
+        getattr(camera, "_frame_center", None),
+        *getattr(camera, "get_value_trackers", list)(),
+        *getattr(camera, "get_mobjects_indicating_movement", list)(),
+    ]
+
+    animated_ids = set()
+    for animation in animations:
+        mobject = getattr(animation, "mobject", None)
+        if mobject is not None:
+            animated_ids.update(id(mob) for mob in mobject.get_family())
+    if any(mob is not None and (id(mob) in animated_ids or mob.updaters) for mob in camera_mobjects):
+        return list(scene.mobjects)
+
+    foreground = {id(mob) for mob in scene.foreground_mobjects}
+    moving, static = [], []
+    for mob in scene.mobjects:
+        family = mob.get_family()
+        if id(mob) in foreground or any(id(member) in animated_ids or member.updaters for member in family):
+            moving.append(mob)
+        else:
+            static.append(mob)
+
+    if moving and camera.use_z_index:
+        # Only static mobjects above an animated one and overlapping the animated area
+        # (as it is when the play starts) could be drawn wrongly from the baked layer
+        lowest = min(member.z_index for mob in moving for member in mob.get_family())
+        boxes = np.array([_bounding_box(mob) for mob in moving if mob.has_points() or mob.submobjects])
+        if len(boxes):
+            x_min, y_min = boxes[:, 0].min(), boxes[:, 1].min()
+            x_max, y_max = boxes[:, 2].max(), boxes[:, 3].max()
+            for mob in static:
+                if max(member.z_index for member in mob.get_family()) <= lowest:
+                    continue
+                left, bottom, right, top = _bounding_box(mob)
+                if left <= x_max and right >= x_min and bottom <= y_max and top >= y_min:
+                    moving.append(mob)
+    return moving
+
+
+def _bounding_box(mob: Mobject) -> tuple[float, float, float, float]:
+    points = mob.get_all_points()
+    if len(points) == 0:
+        center = mob.get_center()
+        return center[0], center[1], center[0], center[1]
+    return points[:, 0].min(), points[:, 1].min(), points[:, 0].max(), points[:, 1].max()
+
+
+class BakedLayerRenderer(CairoRenderer):
+    """Cairo renderer that reuses the static frame of a play across plays.
+
+    Manim renders the mobjects a play does not animate into a static image once
+    per play and composites the animated ones over it every frame. This renderer
+    keeps those images between plays, keyed by the camera frame (center, zoom,
+    orientation) and a fingerprint of every static mobject's points and style, so
+    consecutive plays over an unchanged DAG skip re-rendering it entirely. Moving
+    the camera or changing any baked mobject changes the key, which invalidates
+    the cached layer automatically.
+
+    Only active while the scene's ``baked_layer_enabled`` is set (see
+    HUD2DScene.bake_static_layer); otherwise it behaves exactly like CairoRenderer.
+
+    Attributes:
+        cache_size: Number of static layers kept (e.g. camera positions revisited)
+    """
+
+    def __init__(self, *args, cache_size: int = 4, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_size = cache_size
+        self._layers: OrderedDict[bytes, np.ndarray] = OrderedDict()
+
+    def save_static_frame_data(self, scene: Scene, static_mobjects: Iterable[Mobject]) -> Optional[np.ndarray]:
+        if not getattr(scene, "baked_layer_enabled", False):
+            return super().save_static_frame_data(scene, static_mobjects)
+
+        static_mobjects = list(static_mobjects)
+        if not static_mobjects:
+            self.static_image = None
+            return None
+
+        key = self._layer_key(static_mobjects)
+        image = self._layers.get(key)
+        if image is not None:
+            self._layers.move_to_end(key)
+            self.static_image = image
+            return image
+
+        image = super().save_static_frame_data(scene, static_mobjects)
+        # Frames are not drawn while skipping, the pixel array would be stale
+        if image is not None and not self.skip_animations:
+            self._layers[key] = image
+            if len(self._layers) > self.cache_size:
+                self._layers.popitem(last=False)
+        return image
+
+    @property
+    def baked_layer_count(self) -> int:
+        """Number of static layers currently cached."""
+        return len(self._layers)
+
+    def clear_baked_layers(self) -> None:
+        """Drop every cached static layer."""
+        self._layers.clear()
+
+    def _layer_key(self, static_mobjects: list[Mobject]) -> bytes:
+        camera = self.camera
+        h = hashlib.blake2b(digest_size=16)
+
+        frame_center = getattr(camera, "_frame_center", None)
+        view = [*(frame_center.get_center() if frame_center is not None else camera.frame_center)]
+        for getter in ("get_zoom", "get_phi", "get_theta", "get_gamma"):
+            if hasattr(camera, getter):
+                view.append(getattr(camera, getter)())
+        view.extend([camera.frame_width, camera.frame_height, camera.pixel_width, camera.pixel_height])
+        h.update(np.array(view, dtype=float).tobytes())
+
+        for mob in static_mobjects:
+            h.update(id(mob).to_bytes(8, "little"))
+            h.update(mob.points.tobytes())
+            for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+                array = getattr(mob, attr, None)
+                if array is not None:
+                    h.update(np.asarray(array).tobytes())
+            h.update(repr((
+                mob.z_index,
+                getattr(mob, "stroke_width", None),
+                id(getattr(mob, "pixel_array", None)),
+            )).encode())
+        return h.digest()
@@ -25,6 +25,7 @@ class BaseBlockConfig:
     label_font_size: int = 24
     label_color: ParsableManimColor = WHITE
     label_opacity: float = 1.0
+    label_font: str = ""  # Font family for labels, "" uses Manim's default
 
     # Animation timing
     create_run_time: float = 2.0
@@ -12,14 +12,18 @@ from manim import (
     Text,
     WHITE,
     Transform,
-    BLACK,
     Create,
     AnimationGroup,
     VGroup
 )
 
+from .batch_style import BatchStyleAnimation
+from .label_cache import label_cache
+from .block_prototype import block_prototypes
+
 if TYPE_CHECKING:
     from ..core.base_config import BaseBlockConfig
+    from .batch_style import StyleTarget
 
 class BaseVisualBlock(VGroup):
     """Base class for blockchain block visualization.
@@ -45,40 +49,23 @@ class BaseVisualBlock(VGroup):
         self._label_text = label_text
 
         #####Square#####
-        self.square = Square(
-            fill_color=config.block_color,
-            fill_opacity=config.fill_opacity,
-            stroke_color=config.stroke_color,
-            stroke_width=config.stroke_width,
-            stroke_opacity=config.stroke_opacity,
-            side_length=config.side_length,
-        )
-
+        # Square and background are cloned from per-config templates
+        self.square, self.background_rect = block_prototypes.create(config)
         self.square.move_to((position[0], position[1], 0))
 
-        self.background_rect = Square(
-            side_length=config.side_length,
-            fill_color=BLACK,
-            fill_opacity=0.9,  # Allows slight line visibility
-            stroke_width=0,
-        )
-
         # Position background BEHIND square
         self.background_rect.move_to(self.square.get_center())
 
         #####Label (Primer Pattern)#####
-        # Create invisible primer with 5-character capacity
-        self.label = Text(
-            "00000",  # 5 0's for default capacity
-            font_size=1,
-            color=BLACK,
-        )
+        # Invisible primer with 5-character capacity, copied from one shared template
+        self.label = label_cache.get_primer()
         self.label.move_to(self.square.get_center())
 
         # Add to VGroup
         self.add(self.background_rect, self.square, self.label)
 
         self.parent_lines = []
+        # Lines from children pointing at this block, registered when the child creates them
         self.child_lines = []
 
         # Set z_index at the end
@@ -90,10 +77,12 @@ class BaseVisualBlock(VGroup):
         if not text or text.isspace():
             text = "\u200B"  # Zero-width space maintains position #TODO verify(this does not appear to maintain position)
 
-        new_label = Text(
+        # Copy of a cached label, only the first occurrence of a text is laid out
+        new_label = label_cache.get(
             text,
             font_size=self.config.label_font_size,
-            color=self.config.label_color
+            color=self.config.label_color,
+            font=self.config.label_font,
         )
         new_label.move_to(self.square.get_center())
         return new_label
@@ -114,6 +103,14 @@ class BaseVisualBlock(VGroup):
 
         return AnimationGroup(create_anim, bgsquare_anim, label_transform)
 
+    def create_instantly(self) -> list:
+        """Apply the end state of create_with_lines without animating.
+
+        Returns the block and its parent lines, ready to be added to the scene.
+        """
+        self.label.become(self._get_label(self._label_text))
+        return [self, *self.parent_lines]
+
     def change_label(self, text: str):
 
         run_time = self.config.label_change_run_time
@@ -142,12 +139,66 @@ class BaseVisualBlock(VGroup):
 
     def create_highlight_animation(self, color=None, stroke_width=None):
         """Returns animation for highlighting this block's stroke."""
+        return BatchStyleAnimation(self.get_highlight_targets(color, stroke_width))
+
+    ####################
+    # Style Targets
+    ####################
+    # Style changes are expressed as (mobject, style) targets so callers can merge
+    # the targets of many blocks into one BatchStyleAnimation (or apply them instantly).
+
+    def get_highlight_targets(self, color=None, stroke_width=None) -> list[StyleTarget]:
+        """Style targets for highlighting this block's stroke."""
         if color is None:
             color = self.config.highlight_color
         if stroke_width is None:
             stroke_width = self.config.highlight_stroke_width
-
-        return self.square.animate.set_stroke(color, width=stroke_width)
+        return [(self.square, {"stroke_color": color, "stroke_width": stroke_width})]
+
+    def get_fade_targets(self) -> list[StyleTarget]:
+        """Style targets fading this block (square and label) to fade_opacity."""
+        fade_opacity = self.config.fade_opacity
+        return [
+            (self.square, {"fill_opacity": fade_opacity, "stroke_opacity": fade_opacity}),
+            (self.label, {"fill_opacity": fade_opacity}),
+        ]
+
+    def get_reset_targets(self) -> list[StyleTarget]:
+        """Style targets returning this block to its neutral config style."""
+        return [
+            (self.square, {
+                "fill_color": self.config.block_color,
+                "fill_opacity": self.config.fill_opacity,
+                "stroke_color": self.config.stroke_color,
+                "stroke_width": self.config.stroke_width,
+                "stroke_opacity": self.config.stroke_opacity,
+            }),
+            (self.label, {"fill_opacity": self.config.label_opacity}),
+        ]
+
+    def get_line_fade_targets(self) -> list[StyleTarget]:
+        """Style targets fading all parent lines to fade_opacity."""
+        return [(line, {"stroke_opacity": self.config.fade_opacity}) for line in self.parent_lines]
+
+    def create_fade_animation(self) -> BatchStyleAnimation:
+        """Returns animation fading this block to fade_opacity."""
+        return BatchStyleAnimation(self.get_fade_targets())
+
+    def create_reset_animation(self) -> BatchStyleAnimation:
+        """Returns animation resetting this block to its neutral config style."""
+        return BatchStyleAnimation(self.get_reset_targets())
+
+    def apply_fade(self) -> None:
+        """Instantly apply the faded style (no-animation counterpart of create_fade_animation)."""
+        BatchStyleAnimation.apply(self.get_fade_targets())
+
+    def apply_highlight(self) -> None:
+        """Instantly apply the highlight stroke (no-animation counterpart of create_highlight_animation)."""
+        BatchStyleAnimation.apply(self.get_highlight_targets())
+
+    def apply_reset(self) -> None:
+        """Instantly reset to the neutral style (no-animation counterpart of create_reset_animation)."""
+        BatchStyleAnimation.apply(self.get_reset_targets())
 
     def create_unhighlight_animation(self):
         """Returns animation to reset stroke to original config."""
@@ -173,6 +224,21 @@ class BaseVisualBlock(VGroup):
 
         return pulse_stroke
 
+    def get_sprite_key(self) -> tuple:
+        """Everything that changes how the block looks, blocks with equal keys share a sprite."""
+        return (
+            self._label_text,
+            self.square.width,
+            self.square.fill_rgbas.tobytes(),
+            self.square.stroke_rgbas.tobytes(),
+            self.square.get_stroke_width(),
+            self.background_rect.fill_rgbas.tobytes(),
+            self.config.label_font_size,
+            self.config.label_font,
+            self.label.get_fill_color().to_hex(),
+            self.label.get_fill_opacity(),
+        )
+
     ####################
     # Override Functions
     ####################
@@ -0,0 +1,163 @@
+# blanim\blanim\core\batch_style.py
+
+from __future__ import annotations
+
+__all__ = ["BatchStyleAnimation", "StyleTarget"]
+
+from typing import Iterable, Tuple, TYPE_CHECKING
+
+import numpy as np
+from manim import Animation, Group, ManimColor, VMobject
+
+if TYPE_CHECKING:
+    from manim import Scene
+
+# (mobject, style) pairs, style keys: fill_color, fill_opacity, stroke_color, stroke_opacity, stroke_width
+StyleTarget = Tuple[VMobject, dict]
+
+_STYLE_KEYS = {"fill_color", "fill_opacity", "stroke_color", "stroke_opacity", "stroke_width"}
+
+
+def remove_wrapper_group(scene: Scene, wrapper: Group) -> None:
+    """Take an animation's wrapper Group out of the scene once its play has finished.
+
+    Scene.play adds every animated mobject that is not in the scene yet, which
+    includes the Group batch animations wrap their targets in. The Group is
+    removed again; targets that were only in the scene through it are added
+    on their own, as Scene.play would have done for them.
+    """
+    if wrapper not in scene.mobjects:
+        return
+    scene.remove(wrapper)
+    on_scene = {id(mob) for mob in scene.get_mobject_family_members()}
+    missing = [mob for mob in wrapper.submobjects if id(mob) not in on_scene]
+    if missing:
+        scene.add(*missing)
+
+
+class BatchStyleAnimation(Animation):
+    """Interpolate the fill/stroke style of many mobjects in a single animation.
+
+    Replaces one ``mob.animate.set_fill(...)`` / ``set_stroke(...)`` per mobject
+    (each deep-copying its mobject to build a target) with one animation that
+    captures all start colors, opacities and widths into NumPy arrays when it
+    begins and interpolates them together every frame.
+
+    Styles apply to every family member with points, like ``set_style``.
+    Members whose fill is fully transparent keep it (e.g. invisible label
+    primer glyphs), so fading a label never reveals hidden glyphs.
+
+    Parameters
+    ----------
+    targets : Iterable[StyleTarget]
+        (mobject, style) pairs. Style keys: ``fill_color``, ``fill_opacity``,
+        ``stroke_color``, ``stroke_opacity``, ``stroke_width``. If a mobject
+        appears more than once, later styles are merged over earlier ones.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        self.play(BatchStyleAnimation(
+            [(block.square, {"fill_opacity": 0.1, "stroke_opacity": 0.1}) for block in blocks]
+        ))
+    """
+
+    def __init__(self, targets: Iterable[StyleTarget], **kwargs):
+        self.styles: dict[int, tuple[VMobject, dict]] = {}
+        for mobject, style in targets:
+            unknown = set(style) - _STYLE_KEYS
+            if unknown:
+                raise ValueError(f"Unsupported style keys for BatchStyleAnimation: {sorted(unknown)}")
+            if id(mobject) in self.styles:
+                self.styles[id(mobject)][1].update(style)
+            else:
+                self.styles[id(mobject)] = (mobject, dict(style))
+
+        kwargs.setdefault("suspend_mobject_updating", False)
+        super().__init__(Group(*(mob for mob, _ in self.styles.values())), **kwargs)
+
+        self._members: list[VMobject] = []
+        self._fill_slices: list[tuple[int, int]] = []
+        self._stroke_slices: list[tuple[int, int]] = []
+        self._fill_start = self._fill_end = np.zeros((0, 4))
+        self._stroke_start = self._stroke_end = np.zeros((0, 4))
+        self._width_start = self._width_end = np.zeros(0)
+
+    @staticmethod
+    def apply(targets: Iterable[StyleTarget]) -> None:
+        """Set the final style of targets instantly, without an animation."""
+        animation = BatchStyleAnimation(targets)
+        animation._capture()
+        animation._set_alpha(1.0)
+
+    def begin(self) -> None:
+        # Start values are read once here, no starting mobject copy is made
+        self._capture()
+        self.interpolate(0)
+
+    def clean_up_from_scene(self, scene: Scene) -> None:
+        super().clean_up_from_scene(scene)
+        remove_wrapper_group(scene, self.mobject)
+
+    def _capture(self) -> None:
+        members, fill_start, fill_end, stroke_start, stroke_end, widths = [], [], [], [], [], []
+        fill_slices, stroke_slices = [], []
+        fill_rows = stroke_rows = 0
+
+        for mobject, style in self.styles.values():
+            fill_rgb = None if style.get("fill_color") is None else ManimColor(style["fill_color"]).to_rgb()
+            stroke_rgb = None if style.get("stroke_color") is None else ManimColor(style["stroke_color"]).to_rgb()
+
+            for member in mobject.family_members_with_points():
+                if not isinstance(member, VMobject):
+                    continue
+                fill = np.array(member.fill_rgbas, dtype=float)
+                target_fill = fill.copy()
+                if fill[:, 3].max(initial=0) > 0:
+                    if fill_rgb is not None:
+                        target_fill[:, :3] = fill_rgb
+                    if style.get("fill_opacity") is not None:
+                        target_fill[:, 3] = style["fill_opacity"]
+
+                stroke = np.array(member.stroke_rgbas, dtype=float)
+                target_stroke = stroke.copy()
+                if stroke_rgb is not None:
+                    target_stroke[:, :3] = stroke_rgb
+                if style.get("stroke_opacity") is not None:
+                    target_stroke[:, 3] = style["stroke_opacity"]
+
+                width = member.get_stroke_width()
+                members.append(member)
+                fill_slices.append((fill_rows, fill_rows + len(fill)))
+                stroke_slices.append((stroke_rows, stroke_rows + len(stroke)))
+                fill_rows += len(fill)
+                stroke_rows += len(stroke)
+                fill_start.append(fill)
+                fill_end.append(target_fill)
+                stroke_start.append(stroke)
+                stroke_end.append(target_stroke)
+                widths.append((width, style.get("stroke_width", width)))
+
+        self._members = members
+        self._fill_slices = fill_slices
+        self._stroke_slices = stroke_slices
+        if members:
+            self._fill_start, self._fill_end = np.vstack(fill_start), np.vstack(fill_end)
+            self._stroke_start, self._stroke_end = np.vstack(stroke_start), np.vstack(stroke_end)
+            self._width_start, self._width_end = np.array(widths, dtype=float).T
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self._set_alpha(self.rate_func(alpha))
+
+    def _set_alpha(self, t: float) -> None:
+        if not self._members:
+            return
+        fill = self._fill_start + t * (self._fill_end - self._fill_start)
+        stroke = self._stroke_start + t * (self._stroke_end - self._stroke_start)
+        widths = self._width_start + t * (self._width_end - self._width_start)
+
+        for member, (f0, f1), (s0, s1), width in zip(self._members, self._fill_slices, self._stroke_slices, widths):
+            member.fill_rgbas = fill[f0:f1]
+            member.stroke_rgbas = stroke[s0:s1]
+            member.stroke_width = width
@@ -0,0 +1,112 @@
+# blanim\blanim\core\block_prototype.py
+
+from __future__ import annotations
+
+__all__ = ["BlockPrototypeCache", "block_prototypes", "clone_leaf"]
+
+from typing import Tuple, TYPE_CHECKING
+
+import numpy as np
+from manim import Square, BLACK, ManimColor, VMobject
+
+if TYPE_CHECKING:
+    from .base_config import BaseBlockConfig
+
+# Config values that shape the block square and its background
+PrototypeKey = Tuple[str, float, str, float, float, float]
+
+
+def clone_leaf(template: VMobject) -> VMobject:
+    """Copy a mobject without submobjects using plain array copies instead of deepcopy.
+
+    Point and color arrays are copied with NumPy, lists and dicts are copied
+    shallowly, everything else (colors, enums, numbers) is shared. Updaters and
+    the animation target are not carried over.
+    """
+    if template.submobjects:
+        raise ValueError("clone_leaf only copies mobjects without submobjects")
+    clone = template.__class__.__new__(template.__class__)
+    state = {}
+    for key, value in template.__dict__.items():
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+        elif isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        state[key] = value
+    clone.__dict__.update(state)
+    clone.submobjects = []
+    clone.updaters = []
+    clone.target = None
+    clone.point_hash = None
+    return clone
+
+
+class BlockPrototypeCache:
+    """Per-config templates of the block square and its background.
+
+    Every block of a DAG shares one config, yet each used to run the full
+    ``Square`` constructor (style resolution, point generation) twice. The cache
+    builds both squares once per distinct style and creates blocks by cloning
+    the templates with array copies (see clone_leaf), centered at the origin.
+
+    The key is the config's current square style values rather than the config
+    object, so ``apply_config`` changes select (or build) a matching template
+    automatically.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        square, background = block_prototypes.create(config)
+        square.move_to((x, y, 0))
+    """
+
+    def __init__(self):
+        self._templates: dict[PrototypeKey, tuple[Square, Square]] = {}
+
+    @staticmethod
+    def key(config: BaseBlockConfig) -> PrototypeKey:
+        """Cache key of the square style of a config."""
+        return (
+            ManimColor(config.block_color).to_hex(),
+            float(config.fill_opacity),
+            ManimColor(config.stroke_color).to_hex(),
+            float(config.stroke_width),
+            float(config.stroke_opacity),
+            float(config.side_length),
+        )
+
+    def create(self, config: BaseBlockConfig) -> tuple[Square, Square]:
+        """Return a new (square, background_rect) pair styled by config, centered at the origin."""
+        key = self.key(config)
+        templates = self._templates.get(key)
+        if templates is None:
+            square = Square(
+                fill_color=config.block_color,
+                fill_opacity=config.fill_opacity,
+                stroke_color=config.stroke_color,
+                stroke_width=config.stroke_width,
+                stroke_opacity=config.stroke_opacity,
+                side_length=config.side_length,
+            )
+            background_rect = Square(
+                side_length=config.side_length,
+                fill_color=BLACK,
+                fill_opacity=0.9,  # Allows slight line visibility
+                stroke_width=0,
+            )
+            templates = self._templates[key] = (square, background_rect)
+        return clone_leaf(templates[0]), clone_leaf(templates[1])
+
+    def clear(self) -> None:
+        """Drop all templates."""
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+# Shared by all visual blocks
+block_prototypes = BlockPrototypeCache()
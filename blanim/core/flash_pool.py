@@ -0,0 +1,135 @@
+# blanim\blanim\core\flash_pool.py
+
+from __future__ import annotations
+
+__all__ = ["FlashLinePool"]
+
+from typing import Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+from manim import VMobject, ParsableManimColor, CapStyleType
+from manim.utils.rate_functions import smooth
+
+if TYPE_CHECKING:
+    from manim import Scene, Line
+
+
+class FlashLinePool:
+    """Reusable overlays flashing along lines (child to parent), like a cycling ShowPassingFlash.
+
+    ``cycle_animation(ShowPassingFlash(line.copy()))`` deep-copies every line twice
+    (the copy and the animation's starting mobject) and runs one updater per copy.
+    The pool instead keeps overlay mobjects between highlights and reassigns their
+    points, and a single updater computes the flashing segment of every line with
+    NumPy each frame, reading the current endpoints of the source lines (so flashes
+    follow moving lines). The other overlays carry a no-op updater, so code that
+    decides what is moving per mobject (e.g. the baked static layer) redraws them too.
+
+    With ``combined=True`` all flashing segments are drawn by one VMobject with one
+    subpath per line, so the renderer handles a single mobject however many lines flash.
+    Every segment then shares the style of the first flash() call.
+
+    Attributes:
+        scene: Scene the overlays are added to
+        combined: Draw all segments as subpaths of a single overlay
+        time_width: Length of the flashing segment, as a proportion of the line
+        overlays: Overlays currently in the scene
+
+    Examples
+    --------
+    .. code-block:: python
+
+        pool = FlashLinePool(self)
+        pool.flash(lines, color=YELLOW, width=4, cycle_time=1)
+        self.wait(2)
+        pool.release_all()
+    """
+
+    def __init__(self, scene: Scene, combined: bool = False, time_width: float = 0.5):
+        self.scene = scene
+        self.combined = combined
+        self.time_width = time_width
+        self.overlays: list[VMobject] = []
+        self._free: list[VMobject] = []
+        self._sources: list[Line] = []
+        self._cycle_time = 1.0
+        self._elapsed = 0.0
+
+    def flash(
+            self,
+            lines: Iterable[Line],
+            color: ParsableManimColor,
+            width: float,
+            cycle_time: float
+    ) -> list[VMobject]:
+        """Start flashing lines and return the overlays that were added to the scene."""
+        flashing = {id(line) for line in self._sources}
+        lines = [line for line in dict.fromkeys(lines) if id(line) not in flashing]
+        if not lines:
+            return []
+
+        if not self._sources:
+            self._elapsed = 0.0
+            self._cycle_time = cycle_time
+        self._sources.extend(lines)
+
+        if self.combined:
+            if not self.overlays:
+                overlay = self._acquire(color, width, max(line.z_index for line in lines))
+                overlay.add_updater(self._update)
+                self.overlays.append(overlay)
+                self.scene.add(overlay)
+            else:
+                self.overlays[0].set_z_index(max(self.overlays[0].z_index, *(line.z_index for line in lines)))
+            added = self.overlays[:1]
+        else:
+            added = [self._acquire(color, width, line.z_index) for line in lines]
+            for overlay in added:
+                overlay.add_updater(self._update if not self.overlays and overlay is added[0] else _moved_by_pool)
+            self.overlays.extend(added)
+            self.scene.add(*added)
+
+        self._update(None, 0)
+        return added
+
+    def release_all(self) -> None:
+        """Remove all overlays from the scene and keep them for the next flash()."""
+        if self.overlays:
+            self.scene.remove(*self.overlays)
+        for overlay in self.overlays:
+            overlay.clear_updaters()
+        self._free.extend(self.overlays)
+        self.overlays = []
+        self._sources = []
+
+    def _acquire(self, color: ParsableManimColor, width: float, z_index: float) -> VMobject:
+        overlay = self._free.pop() if self._free else VMobject(cap_style=CapStyleType.ROUND)
+        overlay.set_fill(opacity=0)
+        overlay.set_stroke(color=color, width=width, opacity=1)
+        overlay.set_z_index(z_index)
+        return overlay
+
+    def _segment_points(self, alpha: float) -> np.ndarray:
+        """Bezier points (n, 4, 3) of the flashing segment of every source line."""
+        # Same bounds as ShowPassingFlash with its default smooth rate function
+        upper = min(smooth(alpha) * (1 + self.time_width), 1.0)
+        lower = max(upper - self.time_width, 0.0)
+
+        starts = np.array([line.points[0] for line in self._sources], dtype=float)
+        ends = np.array([line.points[-1] for line in self._sources], dtype=float)
+        t = lower + (upper - lower) * np.linspace(0, 1, 4)
+        return starts[:, None, :] + t[None, :, None] * (ends - starts)[:, None, :]
+
+    def _update(self, _mobject: Optional[VMobject], dt: float) -> None:
+        self._elapsed += dt
+        points = self._segment_points((self._elapsed / self._cycle_time) % 1)
+        if self.combined:
+            self.overlays[0].points = points.reshape(-1, 3)
+        else:
+            for overlay, overlay_points in zip(self.overlays, points):
+                overlay.points = overlay_points
+
+
+def _moved_by_pool(_mobject: VMobject) -> None:
+    # Marks an overlay as moving, its points are written by the pool's single updater
+    pass
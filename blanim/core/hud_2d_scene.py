@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 __all__ = [
+    "HUDSceneMixin",
     "HUD2DScene",
     "UniversalNarrationManager",
     "Frame2DWrapper",
@@ -9,258 +10,134 @@ __all__ = [
     # Add any other scene-related classes/functions you export
 ]
 
-from typing import Literal, Type, Union, Any, Optional
+from typing import Literal, Type, Union, Any, Optional, Callable, Sequence
 
-from manim import Scene, logger, AnimationGroup, ThreeDScene, WHITE, UP, DOWN, Text, MathTex, Tex, BLACK, Mobject, \
-    DEGREES, Transform
-
-
-#####START everything related to HUD2DScene#####
-
-class HUD2DScene(ThreeDScene):
-    """A 2D scene with heads-up display (HUD) support using ThreeDScene's fixed-in-frame system.
-
-    This scene extends :class:`~.ThreeDScene` but configures the camera for orthographic 2D viewing
-    (looking straight down the Z-axis). It provides access to :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects`
-    for creating HUD elements that remain fixed in the camera frame regardless of camera movements.
-
-    The scene includes an integrated :class:`UniversalNarrationManager` that provides convenient
-    methods for managing dual HUD text elements (upper narration and lower caption) using the
-    primer pattern. This eliminates the need for manual primer creation and management.
-
-    **Design Rationale**: This scene provides a performant 2D moving camera with HUD support by
-    leveraging :class:`~.ThreeDScene`'s fixed-in-frame filtering system. The :class:`Frame2DWrapper`
-    provides a MovingCameraScene-compatible API for 2D camera movements without requiring 3D
-    functionality. This is the permanent solution for blanim/common, which exclusively uses 2D scenes.
-
-    .. warning::
-        **Camera Movement API**: This scene provides TWO camera movement APIs:
-
-        **Recommended (blanim/common)**: :class:`Frame2DWrapper` API
-            Use ``self.camera.frame.animate.shift()``, ``self.camera.frame.animate.scale()``, etc.
-            This is the tested and recommended approach for 2D camera movements in blanim/common.
-
-        **Alternative**: :class:`~.ThreeDScene` API
-            Use ``self.move_camera(frame_center=...)``. This is the underlying 3D camera API
-            but is NOT recommended for blanim/common since 3D functionality is never used.
-
-        The :class:`Frame2DWrapper` mimics :class:`~.MovingCameraScene`'s frame API while
-        maintaining access to :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects` for HUD elements.
-
-    .. warning::
-        **Camera Orientation**: Do not modify the camera orientation after setup. This scene is
-        designed exclusively for 2D use with a fixed top-down view. Changing ``phi``, ``theta``,
-        or ``gamma`` values is untested and not supported.
-
-    Examples
-    --------
-
-    **Using Frame2DWrapper API (Recommended)**:
-
-    .. code-block:: python
-
-        class FrameWrapperExample(HUD2DScene):
-            def construct(self):
-                # Create scene content
-                square = Square(color=BLUE)
-                self.add(square)
-
-                # Use convenience methods for HUD text
-                self.narrate(r"Main Title")  # Upper narration
-                self.caption(r"Subtitle text")  # Lower caption
-
-                # Camera movement using Frame2DWrapper - HUD stays fixed
-                self.play(self.camera.frame.animate.shift(RIGHT * 2), run_time=2)
-
-                # Can also use scale, move_to, etc.
-                self.play(self.camera.frame.animate.scale(0.5))
-
-                # Clear HUD elements
-                self.clear_narrate()
-                self.clear_caption()
-
-    **Using ThreeDScene API (Alternative)**:
-
-    .. code-block:: python
-
-        class ThreeDAPIExample(HUD2DScene):
-            def construct(self):
-                square = Square(color=BLUE)
-                self.add(square)
-
-                self.narrate(r"Using 3D camera API")
-
-                # Alternative: use ThreeDScene's move_camera
-                self.move_camera(frame_center=RIGHT * 2, run_time=2)
-
-    **Temporary Narration with Auto-Clear**:
-
-    .. code-block:: python
-
-        class TemporaryNarrationExample(HUD2DScene):
-            def construct(self):
-                square = Square()
-                self.add(square)
-
-                # Display narration for 2 seconds, then auto-clear
-                self.narrate_and_clear(r"This appears briefly", display_time=2.0)
-
-                # Display caption for 3 seconds, then auto-clear
-                self.narrate_and_clear(r"Lower caption", display_time=3.0, upper=False)
-
-    **Manual Primer Pattern (Advanced)**:
+import numpy as np
 
-    .. code-block:: python
-
-        class ManualPrimerExample(HUD2DScene):
-            def construct(self):
-                # Access the narration manager directly
-                narration = self.narration.get_narration(r"Custom Title")
-                self.play(Transform(self.narration.current_narration_text, narration))
-
-                caption = self.narration.get_caption(r"Custom Subtitle")
-                self.play(Transform(self.narration.current_caption_text, caption))
-
-                # Camera movement
-                self.play(self.camera.frame.animate.shift(LEFT * 2), run_time=2)
-
-    **Custom Primer Configuration**:
-
-    .. code-block:: python
-
-        class CustomPrimerExample(HUD2DScene):
-            def setup(self):
-                super().setup()
-                # Customize narration manager settings after initialization
-                self.narration.max_narration_chars = 150  # Larger capacity
-                self.narration.max_caption_chars = 200
-                self.narration.set_narration_font_size(48)  # Larger font
-                self.narration.set_caption_font_size(32)
-
-            def construct(self):
-                self.narrate(r"Large Title Text")
-                self.caption(r"Large Caption Text")
-
-    See Also
-    --------
-    :class:`~.ThreeDScene` : Parent class providing fixed-in-frame functionality
-    :class:`Frame2DWrapper` : Wrapper providing MovingCameraScene-compatible frame API (recommended)
-    :class:`UniversalNarrationManager` : Integrated HUD text manager with primer pattern
-    :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects` : Method for adding HUD elements
-    :meth:`~.ThreeDScene.move_camera` : Alternative 3D camera API (not recommended for blanim/common)
-    :class:`~.MovingCameraScene` : Manim's 2D camera scene (Frame2DWrapper mimics its API)
+from manim import Scene, logger, AnimationGroup, ThreeDScene, WHITE, UP, DOWN, Text, MathTex, Tex, BLACK, Mobject, \
+    DEGREES, Transform, config, RendererType, Camera, ManimColor
 
-    Notes
-    -----
-    **Camera Configuration:**
-        - Camera is set to orthographic 2D view (phi=0, theta=-90°) in :meth:`setup`
-        - :class:`Frame2DWrapper` provides MovingCameraScene-compatible API for 2D movements
-        - **Recommended API**: ``self.camera.frame.animate.shift()``, ``.scale()``, ``.move_to()``, etc.
-        - **Alternative API**: ``self.move_camera(frame_center=...)`` (not recommended for blanim/common)
+from .baked_layer import BakedLayerRenderer, get_animated_mobjects
+from .hud_camera import HUDCamera, CachedRenderOrderMixin
+from .narration_cache import narration_cache
+from .narration_precompile import discover_narration_strings, precompile_narrations
 
-    **HUD System:**
-        - Integrated :class:`UniversalNarrationManager` handles primer creation automatically
-        - Uses :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects` for HUD elements
-        - **Spaces do NOT count** toward primer character capacity
-        - **Default capacity**: 100 chars for narration, 100 chars for caption
-        - **Only Transform works**: Do not use ReplacementTransform or other animations
 
-    **Text Configuration:**
-        - **Default text type**: Tex (supports Text and MathTex via ``narration_text_type``)
-        - **Raw strings required**: Use ``r"..."`` for Tex/MathTex to avoid Python escape sequences
-        - **Plain text**: Raw strings optional if no backslashes present
+#####START everything related to HUD2DScene#####
 
-    **Implementation Details:**
-        - **Renderer agnostic**: Cairo/OpenGL choice is irrelevant for 2D-only usage
-        - **Permanent solution**: This is the stable implementation for blanim/common 2D scenes
-        - **No 3D usage**: blanim/common never uses 3D features, only 2D camera movements
+class HUDSceneMixin:
+    """Narration, caption, transcript and play infrastructure shared by the HUD scene backends.
 
-    Attributes
-    ----------
-    narration : UniversalNarrationManager
-        Integrated narration manager for HUD text elements. Automatically initialized
-        in :meth:`setup` with default settings. Provides access to primer mobjects
-        and text generation methods.
-    transcript : TranscriptManager
-        Integrated transcript manager for writing scene descriptions to a text file.
-        Automatically initialized in :meth:`setup`.
-    narration_text_type : Literal["Tex", "MathTex", "Text"]
-        Class attribute specifying the text type for narration and caption.
-        Defaults to ``"Tex"``. Can be overridden in subclasses to use ``"MathTex"``
-        or ``"Text"`` instead.
+    Combined with a manim scene class providing ``add_fixed_in_frame_mobjects``
+    and a ``camera.frame`` (see :class:`HUD2DScene` and :class:`~.MovingCameraHUDScene`).
+    The backend's ``__init__`` must leave ``camera_class`` to :attr:`hud_camera_class`
+    and its :meth:`setup` must call :meth:`_setup_hud` once the camera is ready.
     """
     narration_text_type: Literal["Tex", "MathTex", "Text"] = "Tex"
+    hud_camera_class: Type[Camera] = HUDCamera
+    # Pre-pass compiling narration texts in parallel before construct, see precompile_narration
+    narration_precompile: bool = False
+    narration_strings: Sequence[str] = ()
+    caption_strings: Sequence[str] = ()
 
     def __init__(self, **kwargs: Any) -> None:
-        """Initialize the HUD2DScene.
-
-        Parameters
-        ----------
-        **kwargs
-            Keyword arguments passed to :class:`~.ThreeDScene`
-
-        Notes
-        -----
-        The narration manager is initialized to None here and will be created
-        in :meth:`setup` to ensure the rendering infrastructure is ready.
-        """
+        # Camera caching the z-sorted render order, see CachedRenderOrderMixin
+        kwargs.setdefault("camera_class", self.hud_camera_class)
+        # Cairo renderer that can keep the static layer between plays, see bake_static_layer
+        if kwargs.get("renderer") is None and config.renderer == RendererType.CAIRO:
+            kwargs["renderer"] = BakedLayerRenderer(
+                camera_class=kwargs["camera_class"],
+                skip_animations=kwargs.get("skip_animations", False),
+            )
         super().__init__(**kwargs)
 
+        self.baked_layer_enabled = False
         self.narration: Optional[UniversalNarrationManager] = None # manim warns against overriding init
         self.transcript: Optional[TranscriptManager] = None # manim warns against overriding init
+        self._play_hooks: list[tuple[Optional[Callable[[list], None]], Optional[Callable[[], None]]]] = []
 
-    def setup(self) -> None:
-        """Set up the scene with 2D orthographic camera orientation.
+    def _setup_hud(self) -> None:
+        """Create the narration and transcript managers (called from the backend's setup)."""
+        # Initialize universal narration manager with dual text support
+        self.narration = UniversalNarrationManager(
+            self,
+            text_type=self.narration_text_type
+        )
 
-        This method is called automatically before :meth:`construct`. It configures
-        the camera to look straight down the Z-axis, providing a 2D view while
-        maintaining access to 3D scene features like fixed-in-frame mobjects.
+        self.transcript = TranscriptManager(self)
 
-        .. warning::
-            Do not override this method or modify camera orientation after setup.
-            This scene is designed exclusively for 2D use.
+        if self.narration_precompile:
+            self.precompile_narration()
+
+    def precompile_narration(
+            self,
+            narrations: Optional[Sequence[str]] = None,
+            captions: Optional[Sequence[str]] = None,
+            max_workers: Optional[int] = None
+    ) -> int:
+        """Compile narration and caption texts concurrently before they are displayed.
+
+        Runs automatically at the end of setup when the class attribute
+        ``narration_precompile`` is True. Without arguments the texts are
+        ``narration_strings``/``caption_strings`` plus the string literals passed to
+        :meth:`narrate`, :meth:`caption` and :meth:`narrate_and_clear` in the scene's
+        source. Each text is built in a process pool (one LaTeX and dvisvgm run per
+        text for Tex/MathTex) and stored in :data:`~.narration_cache`, so the plays
+        in :meth:`construct` only load them.
+
+        Parameters
+        ----------
+        narrations
+            Upper narration texts; discovered as described above if None.
+        captions
+            Lower caption texts; discovered as described above if None.
+        max_workers
+            Process pool size, defaults to the number of CPUs.
+
+        Returns
+        -------
+        int
+            Number of texts that were not cached yet and got compiled.
 
         Examples
         --------
         .. code-block:: python
 
-            class MyScene(HUD2DScene):
-                def construct(self):
-                    # setup() has already been called automatically
-                    self.narrate(r"Scene is ready")
-
-        See Also
-        --------
-        :meth:`construct` : Main method for defining scene content
-        :class:`UniversalNarrationManager` : The narration manager created here
-        :class:`Frame2DWrapper` : The frame wrapper created here
-        :class:`TranscriptManager` : The transcript manager created here
+            class TextHeavyScene(HUD2DScene):
+                narration_precompile = True
+                caption_strings = [f"Block {i}" for i in range(20)]
 
-        Notes
-        -----
-        Sets camera orientation to ``phi=0, theta=-90 * DEGREES`` for top-down 2D view.
-        Creates :class:`Frame2DWrapper` to provide MovingCameraScene-compatible API for 2D camera movements.
-        Creates the :class:`UniversalNarrationManager` instance with default settings.
-        Creates the :class:`TranscriptManager` instance for transcript output.
+                def construct(self):
+                    self.narrate(r"Found by scanning construct")
+                    for i in range(20):
+                        self.caption(f"Block {i}")
         """
-        super().setup()
-
-#        # Enable z-index sorting on the camera
-#        self.camera.use_z_index = True
-
-        # Set camera to orthographic 2D view (looking straight down)
-        self.set_camera_orientation(phi=0, theta=-90 * DEGREES)
-
-        # Create 2D frame wrapper for MovingCameraScene API compatibility
-        self.camera.frame = Frame2DWrapper(self.camera)
+        if narrations is None or captions is None:
+            found_narrations, found_captions = discover_narration_strings(type(self))
+            if narrations is None:
+                narrations = [*self.narration_strings, *found_narrations]
+            if captions is None:
+                captions = [*self.caption_strings, *found_captions]
+
+        manager = self.narration
+        narration_color = ManimColor(manager.narration_color).to_hex()
+        caption_color = ManimColor(manager.caption_color).to_hex()
+        jobs = [
+            *((manager.text_class, text, manager.narration_font_size, narration_color) for text in narrations),
+            *((manager.text_class, text, manager.caption_font_size, caption_color) for text in captions),
+            (manager.text_class, ".....", manager.narration_font_size, ManimColor(BLACK).to_hex()),
+            (manager.text_class, ".....", manager.caption_font_size, ManimColor(BLACK).to_hex()),
+            (manager.text_class, "0" * manager.get_primer_capacity("narration"), 1, ManimColor(BLACK).to_hex()),
+            (manager.text_class, "0" * manager.get_primer_capacity("caption"), 1, ManimColor(BLACK).to_hex()),
+        ]
+        return precompile_narrations(jobs, max_workers)
 
-        # Initialize universal narration manager with dual text support
-        self.narration = UniversalNarrationManager(
-            self,
-            text_type=self.narration_text_type
-        )
+    def get_frame_center_mobject(self) -> Mobject:
+        """Mobject whose position is the camera center, for custom camera animations.
 
-        self.transcript = TranscriptManager(self)
+        Defaults to the camera's frame (MovingCamera); scenes with another camera override it.
+        """
+        return self.camera.frame
 
     def tear_down(self) -> None:
         """Clean up scene resources and write transcript file.
@@ -335,6 +212,8 @@ class HUD2DScene(ThreeDScene):
         Notes
         -----
         - Automatically converts :class:`Frame2DAnimateWrapper` to :class:`~.AnimationGroup`
+        - Camera moves that change nothing are dropped; if nothing is left the play
+          is skipped (no frames are rendered and no time passes)
         - All other animations are passed through unchanged
         - This override is transparent to users
         """
@@ -346,7 +225,98 @@ class HUD2DScene(ThreeDScene):
                     processed_args.append(built)
             else:
                 processed_args.append(arg)
-        return super().play(*processed_args, **kwargs)
+        if args and not processed_args:
+            # Only camera moves that change nothing, skip the play entirely
+            return None
+
+        for before, _ in self._play_hooks:
+            if before is not None:
+                before(processed_args)
+        result = super().play(*processed_args, **kwargs)
+        for _, after in self._play_hooks:
+            if after is not None:
+                after()
+        return result
+
+    def bake_static_layer(self, enabled: bool = True) -> None:
+        """Render mobjects a play does not animate once and reuse them across plays.
+
+        While enabled, each play only treats the mobjects it actually animates (or
+        that have updaters, or sit above them in z_index) as moving. Everything
+        else is rendered once into a background pixel array that is cached by
+        camera frame and zoom, and the moving mobjects are composited over it
+        every frame. Moving the camera or changing a baked mobject invalidates
+        the cached layer automatically.
+
+        Parameters
+        ----------
+        enabled
+            Turn baking on (default) or off.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            class LargeDAG(HUD2DScene):
+                def construct(self):
+                    self.bake_static_layer()
+                    dag = KaspaDAG(scene=self)
+                    ...
+
+        Notes
+        -----
+        Only the Cairo renderer supports baking; with OpenGL this is a no-op.
+        """
+        self.baked_layer_enabled = enabled
+        if not enabled and isinstance(self.renderer, BakedLayerRenderer):
+            self.renderer.clear_baked_layers()
+
+    def add(self, *mobjects: Mobject):
+        """Add mobjects, invalidating the camera's cached render order."""
+        self._invalidate_render_order()
+        return super().add(*mobjects)
+
+    def remove(self, *mobjects: Mobject):
+        """Remove mobjects, invalidating the camera's cached render order."""
+        self._invalidate_render_order()
+        return super().remove(*mobjects)
+
+    def begin_animations(self) -> None:
+        """Begin the animations of a play, then rebuild the render order once for all its frames."""
+        super().begin_animations()
+        self._invalidate_render_order()
+
+    def _invalidate_render_order(self) -> None:
+        camera = self.renderer.camera
+        if isinstance(camera, CachedRenderOrderMixin):
+            camera.invalidate_render_order()
+
+    def get_moving_mobjects(self, *animations):
+        """Mobjects a play changes, only those animated (not everything added after them) when baking."""
+        if not self.baked_layer_enabled:
+            return super().get_moving_mobjects(*animations)
+        return get_animated_mobjects(self, animations)
+
+    def add_play_hooks(
+            self,
+            before: Optional[Callable[[list], None]] = None,
+            after: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Register callbacks run around every :meth:`play` (and therefore every ``wait``).
+
+        Parameters
+        ----------
+        before
+            Called with the list of animations (builders not yet built) before they start.
+        after
+            Called once the play has finished.
+
+        Notes
+        -----
+        Used by managers that swap mobjects in and out of the scene depending on
+        whether they are animated (e.g. :class:`~.SpriteLayer`).
+        """
+        self._play_hooks.append((before, after))
 
     def narrate(self, text: str, run_time: float = 0.5, **kwargs: Any) -> None:
         r"""Update upper narration text with animation.
@@ -768,6 +738,250 @@ class HUD2DScene(ThreeDScene):
             self.wait(display_time)
             self.clear_caption(run_time=fade_time, **kwargs)
 
+
+class HUD2DScene(HUDSceneMixin, ThreeDScene):
+    """A 2D scene with heads-up display (HUD) support using ThreeDScene's fixed-in-frame system.
+
+    This scene extends :class:`~.ThreeDScene` but configures the camera for orthographic 2D viewing
+    (looking straight down the Z-axis). It provides access to :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects`
+    for creating HUD elements that remain fixed in the camera frame regardless of camera movements.
+
+    The scene includes an integrated :class:`UniversalNarrationManager` that provides convenient
+    methods for managing dual HUD text elements (upper narration and lower caption) using the
+    primer pattern. This eliminates the need for manual primer creation and management.
+
+    **Design Rationale**: This scene provides a performant 2D moving camera with HUD support by
+    leveraging :class:`~.ThreeDScene`'s fixed-in-frame filtering system. The :class:`Frame2DWrapper`
+    provides a MovingCameraScene-compatible API for 2D camera movements without requiring 3D
+    functionality. This is the permanent solution for blanim/common, which exclusively uses 2D scenes.
+
+    .. warning::
+        **Camera Movement API**: This scene provides TWO camera movement APIs:
+
+        **Recommended (blanim/common)**: :class:`Frame2DWrapper` API
+            Use ``self.camera.frame.animate.shift()``, ``self.camera.frame.animate.scale()``, etc.
+            This is the tested and recommended approach for 2D camera movements in blanim/common.
+
+        **Alternative**: :class:`~.ThreeDScene` API
+            Use ``self.move_camera(frame_center=...)``. This is the underlying 3D camera API
+            but is NOT recommended for blanim/common since 3D functionality is never used.
+
+        The :class:`Frame2DWrapper` mimics :class:`~.MovingCameraScene`'s frame API while
+        maintaining access to :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects` for HUD elements.
+
+    .. warning::
+        **Camera Orientation**: Do not modify the camera orientation after setup. This scene is
+        designed exclusively for 2D use with a fixed top-down view. Changing ``phi``, ``theta``,
+        or ``gamma`` values is untested and not supported.
+
+    Examples
+    --------
+
+    **Using Frame2DWrapper API (Recommended)**:
+
+    .. code-block:: python
+
+        class FrameWrapperExample(HUD2DScene):
+            def construct(self):
+                # Create scene content
+                square = Square(color=BLUE)
+                self.add(square)
+
+                # Use convenience methods for HUD text
+                self.narrate(r"Main Title")  # Upper narration
+                self.caption(r"Subtitle text")  # Lower caption
+
+                # Camera movement using Frame2DWrapper - HUD stays fixed
+                self.play(self.camera.frame.animate.shift(RIGHT * 2), run_time=2)
+
+                # Can also use scale, move_to, etc.
+                self.play(self.camera.frame.animate.scale(0.5))
+
+                # Clear HUD elements
+                self.clear_narrate()
+                self.clear_caption()
+
+    **Using ThreeDScene API (Alternative)**:
+
+    .. code-block:: python
+
+        class ThreeDAPIExample(HUD2DScene):
+            def construct(self):
+                square = Square(color=BLUE)
+                self.add(square)
+
+                self.narrate(r"Using 3D camera API")
+
+                # Alternative: use ThreeDScene's move_camera
+                self.move_camera(frame_center=RIGHT * 2, run_time=2)
+
+    **Temporary Narration with Auto-Clear**:
+
+    .. code-block:: python
+
+        class TemporaryNarrationExample(HUD2DScene):
+            def construct(self):
+                square = Square()
+                self.add(square)
+
+                # Display narration for 2 seconds, then auto-clear
+                self.narrate_and_clear(r"This appears briefly", display_time=2.0)
+
+                # Display caption for 3 seconds, then auto-clear
+                self.narrate_and_clear(r"Lower caption", display_time=3.0, upper=False)
+
+    **Manual Primer Pattern (Advanced)**:
+
+    .. code-block:: python
+
+        class ManualPrimerExample(HUD2DScene):
+            def construct(self):
+                # Access the narration manager directly
+                narration = self.narration.get_narration(r"Custom Title")
+                self.play(Transform(self.narration.current_narration_text, narration))
+
+                caption = self.narration.get_caption(r"Custom Subtitle")
+                self.play(Transform(self.narration.current_caption_text, caption))
+
+                # Camera movement
+                self.play(self.camera.frame.animate.shift(LEFT * 2), run_time=2)
+
+    **Custom Primer Configuration**:
+
+    .. code-block:: python
+
+        class CustomPrimerExample(HUD2DScene):
+            def setup(self):
+                super().setup()
+                # Customize narration manager settings after initialization
+                self.narration.max_narration_chars = 150  # Larger capacity
+                self.narration.max_caption_chars = 200
+                self.narration.set_narration_font_size(48)  # Larger font
+                self.narration.set_caption_font_size(32)
+
+            def construct(self):
+                self.narrate(r"Large Title Text")
+                self.caption(r"Large Caption Text")
+
+    See Also
+    --------
+    :class:`~.ThreeDScene` : Parent class providing fixed-in-frame functionality
+    :class:`Frame2DWrapper` : Wrapper providing MovingCameraScene-compatible frame API (recommended)
+    :class:`UniversalNarrationManager` : Integrated HUD text manager with primer pattern
+    :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects` : Method for adding HUD elements
+    :meth:`~.ThreeDScene.move_camera` : Alternative 3D camera API (not recommended for blanim/common)
+    :class:`~.MovingCameraScene` : Manim's 2D camera scene (Frame2DWrapper mimics its API)
+    :class:`~.MovingCameraHUDScene` : Same HUD API on a MovingCamera, without the 3D projection cost
+
+    Notes
+    -----
+    **Camera Configuration:**
+        - Camera is set to orthographic 2D view (phi=0, theta=-90°) in :meth:`setup`
+        - :class:`Frame2DWrapper` provides MovingCameraScene-compatible API for 2D movements
+        - **Recommended API**: ``self.camera.frame.animate.shift()``, ``.scale()``, ``.move_to()``, etc.
+        - **Alternative API**: ``self.move_camera(frame_center=...)`` (not recommended for blanim/common)
+
+    **HUD System:**
+        - Integrated :class:`UniversalNarrationManager` handles primer creation automatically
+        - Uses :meth:`~.ThreeDScene.add_fixed_in_frame_mobjects` for HUD elements
+        - **Spaces do NOT count** toward primer character capacity
+        - **Default capacity**: the longest narration/caption string the scene uses (see
+          :class:`UniversalNarrationManager`); primers are built on first use
+        - **Only Transform works**: Do not use ReplacementTransform or other animations
+
+    **Text Configuration:**
+        - **Default text type**: Tex (supports Text and MathTex via ``narration_text_type``)
+        - **Raw strings required**: Use ``r"..."`` for Tex/MathTex to avoid Python escape sequences
+        - **Plain text**: Raw strings optional if no backslashes present
+
+    **Implementation Details:**
+        - **Renderer agnostic**: Cairo/OpenGL choice is irrelevant for 2D-only usage
+        - **Permanent solution**: This is the stable implementation for blanim/common 2D scenes
+        - **No 3D usage**: blanim/common never uses 3D features, only 2D camera movements
+
+    Attributes
+    ----------
+    narration : UniversalNarrationManager
+        Integrated narration manager for HUD text elements. Automatically initialized
+        in :meth:`setup` with default settings. Provides access to primer mobjects
+        and text generation methods.
+    transcript : TranscriptManager
+        Integrated transcript manager for writing scene descriptions to a text file.
+        Automatically initialized in :meth:`setup`.
+    narration_text_type : Literal["Tex", "MathTex", "Text"]
+        Class attribute specifying the text type for narration and caption.
+        Defaults to ``"Tex"``. Can be overridden in subclasses to use ``"MathTex"``
+        or ``"Text"`` instead.
+    """
+    narration_text_type: Literal["Tex", "MathTex", "Text"] = "Tex"
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the HUD2DScene.
+
+        Parameters
+        ----------
+        **kwargs
+            Keyword arguments passed to :class:`~.ThreeDScene`
+
+        Notes
+        -----
+        The narration manager is initialized to None here and will be created
+        in :meth:`setup` to ensure the rendering infrastructure is ready.
+        """
+        super().__init__(**kwargs)
+
+    def setup(self) -> None:
+        """Set up the scene with 2D orthographic camera orientation.
+
+        This method is called automatically before :meth:`construct`. It configures
+        the camera to look straight down the Z-axis, providing a 2D view while
+        maintaining access to 3D scene features like fixed-in-frame mobjects.
+
+        .. warning::
+            Do not override this method or modify camera orientation after setup.
+            This scene is designed exclusively for 2D use.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            class MyScene(HUD2DScene):
+                def construct(self):
+                    # setup() has already been called automatically
+                    self.narrate(r"Scene is ready")
+
+        See Also
+        --------
+        :meth:`construct` : Main method for defining scene content
+        :class:`UniversalNarrationManager` : The narration manager created here
+        :class:`Frame2DWrapper` : The frame wrapper created here
+        :class:`TranscriptManager` : The transcript manager created here
+
+        Notes
+        -----
+        Sets camera orientation to ``phi=0, theta=-90 * DEGREES`` for top-down 2D view.
+        Creates :class:`Frame2DWrapper` to provide MovingCameraScene-compatible API for 2D camera movements.
+        Creates the :class:`UniversalNarrationManager` instance with default settings.
+        Creates the :class:`TranscriptManager` instance for transcript output.
+        """
+        super().setup()
+
+#        # Enable z-index sorting on the camera
+#        self.camera.use_z_index = True
+
+        # Set camera to orthographic 2D view (looking straight down)
+        self.set_camera_orientation(phi=0, theta=-90 * DEGREES)
+
+        # Create 2D frame wrapper for MovingCameraScene API compatibility
+        self.camera.frame = Frame2DWrapper(self.camera)
+
+        self._setup_hud()
+
+    def get_frame_center_mobject(self) -> Mobject:
+        """Mobject whose position is the camera center, for custom camera animations."""
+        # noinspection PyProtectedMember
+        return self.camera._frame_center  # type: ignore[attr-defined]  # noqa: SLF001
+
 #TODO added z index to naration and caption
 #    appear to have worked, BUT may require a bg to ensure visibility when something renders below it in z space
 class UniversalNarrationManager:
@@ -790,9 +1004,9 @@ class UniversalNarrationManager:
     scene : ThreeDScene
         Reference to the scene instance
     current_narration_text : Mobject
-        Primer mobject for upper narration (invisible, BLACK, font_size=1)
+        Primer mobject for upper narration (invisible, BLACK, font_size=1), built on first access
     current_caption_text : Mobject
-        Primer mobject for lower caption (invisible, BLACK, font_size=1)
+        Primer mobject for lower caption (invisible, BLACK, font_size=1), built on first access
     narration_font_size : int
         Font size for narration text. Default: 32
     caption_font_size : int
@@ -805,19 +1019,28 @@ class UniversalNarrationManager:
         Position for narration. Default: UP
     caption_position : Vector3
         Position for caption. Default: DOWN
-    max_narration_chars : int
-        Maximum character capacity for narration (spaces excluded). Default: 100
-    max_caption_chars : int
-        Maximum character capacity for caption (spaces excluded). Default: 100
+    max_narration_chars : int or None
+        Fixed character capacity for narration (spaces excluded). Default: None, the
+        capacity is the longest narration the scene uses
+    max_caption_chars : int or None
+        Fixed character capacity for caption (spaces excluded). Default: None, the
+        capacity is the longest caption the scene uses
     text_class : Type[Union[Text, MathTex, Tex]]
         The class used for creating text mobjects
 
     Notes
     -----
-    - Creates invisible primer mobjects for Transform animations
+    - Creates invisible primer mobjects for Transform animations on first use, so
+      scenes that never narrate build no primer
+    - Primers are copies of one "0" * capacity template per capacity, shared by all
+      scenes of the process through :data:`~.narration_cache`
+    - Without a fixed capacity it is the longest string known when the primer is built
+      (``narration_strings``/``caption_strings``, literals in the scene's source, the
+      text being shown); a longer text later grows the primer, keeping what it shows
     - Primers are registered as fixed-in-frame automatically
-    - Character capacity is fixed at initialization (spaces excluded)
     - Must use Transform, not ReplacementTransform
+    - Narration, caption and clearing texts come from :data:`~.narration_cache`,
+      so repeated strings are built once per run and load from disk on re-renders
     """
 
     def __init__(
@@ -832,8 +1055,8 @@ class UniversalNarrationManager:
         self.caption_color = WHITE
         self.narration_position = UP
         self.caption_position = DOWN
-        self.max_narration_chars: int = 100
-        self.max_caption_chars: int = 100
+        self.max_narration_chars: Optional[int] = None
+        self.max_caption_chars: Optional[int] = None
 
         if text_type == "Text":
             self.text_class: Type[Union[Text, MathTex, Tex]] = Text
@@ -849,30 +1072,76 @@ class UniversalNarrationManager:
             )
             self.text_class = Tex
 
-        # Create invisible primer mobjects for narration and caption
-        # Use "0" * max_chars to ensure consistent width for primer
-        narration_primer_string = "0" * self.max_narration_chars
-        caption_primer_string = "0" * self.max_caption_chars
+        # Primers are built on first use, see _get_primer
+        self._primers: dict[str, Mobject] = {}
+        self._capacities: dict[str, int] = {}
+        self._known_strings: Optional[dict[str, list[str]]] = None
 
-        narration_primer = self.text_class(
-            narration_primer_string, color=BLACK, font_size=1
-        )
-        narration_primer.to_edge(self.narration_position)
-
-        caption_primer = self.text_class(
-            caption_primer_string, color=BLACK, font_size=1
-        )
-        caption_primer.to_edge(self.caption_position)
+    @property
+    def current_narration_text(self) -> Mobject:
+        """Primer mobject for upper narration, built on first access."""
+        return self._get_primer("narration")
 
-        # Register primers as fixed-in-frame
-        self.scene.add_fixed_in_frame_mobjects(narration_primer, caption_primer)
+    @property
+    def current_caption_text(self) -> Mobject:
+        """Primer mobject for lower caption, built on first access."""
+        return self._get_primer("caption")
+
+    def _get_primer(self, kind: Literal["narration", "caption"], text: Optional[str] = None) -> Mobject:
+        """Primer of kind, built or grown so it has capacity for text."""
+        primer = self._primers.get(kind)
+        fixed = self.max_narration_chars if kind == "narration" else self.max_caption_chars
+        needed = self._glyph_count(text) if text is not None else 0
+        if primer is not None and (fixed is not None or needed <= self._capacities[kind]):
+            return primer
+
+        capacity = self.get_primer_capacity(kind)
+        if fixed is None:
+            capacity = max(capacity, needed)
+        # Use "0" * capacity to ensure consistent width for primer
+        new_primer = narration_cache.get(self.text_class, "0" * capacity, font_size=1, color=BLACK)
+        new_primer.to_edge(self.narration_position if kind == "narration" else self.caption_position)
+        if primer is not None:
+            # Grown primer takes over what the old one shows
+            look = primer.copy()
+            new_primer.align_data(look)
+            for member, look_member in zip(new_primer.get_family(), look.get_family()):
+                member.interpolate(member, look_member, 1)
+            self.scene.remove_fixed_in_frame_mobjects(primer)
+            self.scene.remove(primer)
+
+        # Register primer as fixed-in-frame
+        self.scene.add_fixed_in_frame_mobjects(new_primer)
 
         # SET Z-INDEX HERE - after registration but before storing references
-        narration_primer.set_z_index(1000)
-        caption_primer.set_z_index(1000)
+        new_primer.set_z_index(1000)
+
+        self._primers[kind] = new_primer
+        self._capacities[kind] = capacity
+        return new_primer
+
+    def get_primer_capacity(self, kind: Literal["narration", "caption"]) -> int:
+        """Capacity a primer of kind is built with: the fixed maximum, else the longest known string."""
+        fixed = self.max_narration_chars if kind == "narration" else self.max_caption_chars
+        if fixed is not None:
+            return fixed
+        known = self._get_known_strings()[kind]
+        return max([self._glyph_count("....."), *map(self._glyph_count, known)])
+
+    def _get_known_strings(self) -> dict[str, list[str]]:
+        """Narration and caption strings declared on the scene or found in its source."""
+        if self._known_strings is None:
+            narrations, captions = discover_narration_strings(type(self.scene))
+            self._known_strings = {
+                "narration": [*getattr(self.scene, "narration_strings", ()), *narrations],
+                "caption": [*getattr(self.scene, "caption_strings", ()), *captions],
+            }
+        return self._known_strings
 
-        self.current_narration_text = narration_primer
-        self.current_caption_text = caption_primer
+    @staticmethod
+    def _glyph_count(text: str) -> int:
+        """Characters of text that count toward primer capacity (spaces excluded)."""
+        return sum(not char.isspace() for char in text)
 
     def get_narration(self, text: str) -> Mobject:
         """Create narration mobject with validation.
@@ -891,12 +1160,13 @@ class UniversalNarrationManager:
         if self.text_class in (MathTex, Tex):
             self._validate_latex_string(text, "narration")
 
-        narration = self.text_class(
+        narration = narration_cache.get(
+            self.text_class,
             text,
             font_size=self.narration_font_size,
             color=self.narration_color,
         )
-        narration.move_to(self.current_narration_text.get_center())
+        narration.move_to(self._get_primer("narration", text).get_center())
         return narration
 
     def get_caption(self, text: str) -> Mobject:
@@ -916,12 +1186,13 @@ class UniversalNarrationManager:
         if self.text_class in (MathTex, Tex):
             self._validate_latex_string(text, "caption")
 
-        caption = self.text_class(
+        caption = narration_cache.get(
+            self.text_class,
             text,
             font_size=self.caption_font_size,
             color=self.caption_color,
         )
-        caption.move_to(self.current_caption_text.get_center())
+        caption.move_to(self._get_primer("caption", text).get_center())
         return caption
 
     @staticmethod
@@ -965,7 +1236,7 @@ class UniversalNarrationManager:
         Mobject
             Invisible narration mobject (BLACK, ".....")
         """
-        empty = self.text_class(".....", color=BLACK, font_size=self.narration_font_size)
+        empty = narration_cache.get(self.text_class, ".....", font_size=self.narration_font_size, color=BLACK)
         empty.move_to(self.current_narration_text.get_center())
         return empty
 
@@ -977,7 +1248,7 @@ class UniversalNarrationManager:
         Mobject
             Invisible caption mobject (BLACK, ".....")
         """
-        empty = self.text_class(".....", color=BLACK, font_size=self.caption_font_size)
+        empty = narration_cache.get(self.text_class, ".....", font_size=self.caption_font_size, color=BLACK)
         empty.move_to(self.current_caption_text.get_center())
         return empty
 
@@ -1272,6 +1543,14 @@ class Frame2DWrapper:
         # noinspection PyProtectedMember
         return self.camera._frame_center.get_center() # type: ignore[attr-defined]  # noqa: SLF001
 
+    def get_width(self) -> float:
+        """Get the visible frame width in scene units (accounts for zoom)."""
+        return config["frame_width"] / self.camera.zoom_tracker.get_value()
+
+    def get_height(self) -> float:
+        """Get the visible frame height in scene units (accounts for zoom)."""
+        return config["frame_height"] / self.camera.zoom_tracker.get_value()
+
 class Frame2DAnimateWrapper:
     """Animation builder for chaining camera movements (user-facing).
 
@@ -1302,16 +1581,16 @@ class Frame2DAnimateWrapper:
     ----------
     frame : Frame2DWrapper
         Reference to the Frame2DWrapper being animated
-    target_center : Mobject
-        Copy of the camera's frame center for tracking target position
+    target_center : np.ndarray
+        Target position of the camera frame center
     target_zoom : float
         Target zoom value for the animation
 
     Notes
     -----
     - Method chaining is supported: each method returns ``self``
-    - All transformations are accumulated and applied together in :meth:`build`
-    - The :meth:`build` method creates an :class:`~.AnimationGroup` with all transformations
+    - All transformations are fused into one target (center, zoom) and applied together in :meth:`build`
+    - The :meth:`build` method creates an :class:`~.AnimationGroup` animating only what changes
     - This mirrors :class:`~.MovingCameraScene`'s ``camera.frame.animate`` behavior
 
     See Also
@@ -1331,8 +1610,7 @@ class Frame2DAnimateWrapper:
         """
         self.frame = frame_wrapper
         # Store initial state
-        # noinspection PyProtectedMember
-        self.target_center = self.frame.camera._frame_center.copy() # type: ignore[attr-defined]  # noqa: SLF001
+        self.target_center = np.array(self.frame.get_center(), dtype=float)
         self.target_zoom = self.frame.camera.zoom_tracker.get_value()
 
     def move_to(self, point):
@@ -1363,7 +1641,9 @@ class Frame2DAnimateWrapper:
                     # Animate camera to square
                     self.play(self.camera.frame.animate.move_to(square))
         """
-        self.target_center.move_to(point)
+        if isinstance(point, Mobject):
+            point = point.get_center()
+        self.target_center = np.array(point, dtype=float)
 
         return self
 
@@ -1392,7 +1672,7 @@ class Frame2DAnimateWrapper:
                     # Animate camera shift
                     self.play(self.camera.frame.animate.shift(RIGHT * 2 + UP))
         """
-        self.target_center.shift(vector)
+        self.target_center = self.target_center + np.asarray(vector, dtype=float)
 
         return self
 
@@ -1489,25 +1769,26 @@ class Frame2DAnimateWrapper:
 
         Returns
         -------
-        AnimationGroup
-            Animation group containing frame center and zoom animations
+        AnimationGroup or None
+            Animation group containing the frame center and/or zoom animations,
+            or None if the camera already is at the target
 
         Notes
         -----
-        - Always creates animations for both frame center and zoom, even if unchanged
+        - Only creates an animation for the frame center or zoom if it changes
         - Uses :class:`~.AnimationGroup` to synchronize transformations
         - Called automatically by Manim's animation system; users don't call this directly
         """
-        animations = [
-            # Always create animation for frame center (even if unchanged)
-            self.frame.camera._frame_center.animate.move_to( # type: ignore[attr-defined]  # noqa: SLF001
-                self.target_center.get_center()
-            ),
-            # Always create animation for zoom (even if unchanged)
-            self.frame.camera.zoom_tracker.animate.set_value(self.target_zoom),
-        ]
+        animations = []
+        if not np.allclose(self.target_center, self.frame.get_center()):
+            animations.append(
+                self.frame.camera._frame_center.animate.move_to(self.target_center) # type: ignore[attr-defined]  # noqa: SLF001
+            )
+        zoom_tracker = self.frame.camera.zoom_tracker
+        if not np.isclose(self.target_zoom, zoom_tracker.get_value()):
+            animations.append(zoom_tracker.animate.set_value(self.target_zoom))
 
-        return AnimationGroup(*animations)
+        return AnimationGroup(*animations) if animations else None
 
 class TranscriptManager:
     """Internal manager for transcript output (not directly user-facing).
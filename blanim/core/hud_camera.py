@@ -0,0 +1,84 @@
+# blanim\blanim\core\hud_camera.py
+
+from __future__ import annotations
+
+__all__ = ["HUDCamera"]
+
+import itertools as it
+from typing import Iterable
+
+from manim import ThreeDCamera, Mobject
+from manim.utils.iterables import list_difference_update, remove_list_redundancies
+
+
+class CachedRenderOrderMixin:
+    """Camera mixin caching the flattened, z-sorted list of mobjects to display.
+
+    The order is built once into stable buckets per z_index (concatenated in z
+    order) and cached per list of displayed mobjects. HUD scenes invalidate the
+    cache when mobjects are added to or removed from the scene and when a play
+    begins (animations may align submobjects), so within a play each frame
+    reuses the same ordering.
+
+    Mobjects with ``shade_in_3d`` need per-frame depth sorting and bypass the cache.
+    Call invalidate_render_order() after changing a z_index inside an updater.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._render_order: dict[tuple, list[Mobject]] = {}
+
+    def invalidate_render_order(self) -> None:
+        """Forget cached render orders, the next frame rebuilds them."""
+        self._render_order.clear()
+
+    def get_mobjects_to_display(
+            self,
+            mobjects: Iterable[Mobject],
+            include_submobjects: bool = True,
+            excluded_mobjects: list | None = None,
+    ) -> list[Mobject]:
+        mobjects = list(mobjects)
+        key = (include_submobjects, tuple(map(id, mobjects)), tuple(map(id, excluded_mobjects or ())))
+        order = self._render_order.get(key)
+        if order is None:
+            order = self._build_render_order(mobjects, include_submobjects, excluded_mobjects)
+            if order is None:
+                return super().get_mobjects_to_display(mobjects, include_submobjects, excluded_mobjects)
+            self._render_order[key] = order
+        return list(order)
+
+    def _build_render_order(
+            self,
+            mobjects: list[Mobject],
+            include_submobjects: bool,
+            excluded_mobjects: list | None
+    ) -> list[Mobject] | None:
+        if not include_submobjects:
+            members = mobjects
+        else:
+            members = remove_list_redundancies(list(it.chain(*(m.family_members_with_points() for m in mobjects))))
+            if excluded_mobjects:
+                excluded = remove_list_redundancies(list(it.chain(*(m.get_family() for m in excluded_mobjects))))
+                members = list_difference_update(members, excluded)
+
+        if any(getattr(mob, "shade_in_3d", False) for mob in members):
+            return None
+        if not self.use_z_index:
+            return list(members)
+
+        # Stable buckets per z_index, same order as a stable sort by z_index
+        buckets: dict[float, list[Mobject]] = {}
+        for mob in members:
+            buckets.setdefault(mob.z_index, []).append(mob)
+        return [mob for z in sorted(buckets) for mob in buckets[z]]
+
+
+class HUDCamera(CachedRenderOrderMixin, ThreeDCamera):
+    """ThreeDCamera that caches the render order of the mobjects it displays.
+
+    ThreeDCamera flattens every mobject family, sorts it by z_index and then again
+    by depth on every frame. In HUD2DScene nothing is shaded in 3D and z-indices
+    do not change during a play, so the depth sort is skipped and the z order is
+    reused between frames (see CachedRenderOrderMixin).
+    """
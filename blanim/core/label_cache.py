@@ -0,0 +1,91 @@
+# blanim\blanim\core\label_cache.py
+
+from __future__ import annotations
+
+__all__ = ["LabelCache", "label_cache"]
+
+from collections import OrderedDict
+from typing import Tuple
+
+from manim import Text, BLACK, ManimColor, ParsableManimColor
+
+# (text, font_size, color hex, font)
+LabelKey = Tuple[str, float, str, str]
+
+
+class LabelCache:
+    """LRU cache of pre-built label mobjects, handing out copies.
+
+    Building a ``Text`` runs Pango layout and parses the resulting SVG, which
+    dominates block creation when hundreds of blocks are added. Labels repeat a
+    lot (block names, blue scores), so each distinct (text, font_size, color, font)
+    is built once and every request returns a copy of that template, which only
+    duplicates the already computed points.
+
+    The invisible primer every block starts from is a single shared template as
+    well, kept outside the LRU so it is never evicted.
+
+    Attributes:
+        maxsize: Number of distinct labels kept, least recently used ones are dropped first
+        hits: Requests served from the cache
+        misses: Requests that had to build a new Text
+
+    Examples
+    --------
+    .. code-block:: python
+
+        label = label_cache.get("B12", font_size=24, color=WHITE)
+        label.move_to(square.get_center())
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[LabelKey, Text] = OrderedDict()
+        self._primer: Text | None = None
+
+    def get(self, text: str, font_size: float, color: ParsableManimColor, font: str = "") -> Text:
+        """Return a new copy of the label for text in the given style."""
+        key = (text, float(font_size), ManimColor(color).to_hex(), font)
+        template = self._templates.get(key)
+        if template is None:
+            self.misses += 1
+            template = Text(text, font_size=font_size, color=color, font=font)
+            self._templates[key] = template
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        else:
+            self.hits += 1
+            self._templates.move_to_end(key)
+        return template.copy()
+
+    def get_primer(self) -> Text:
+        """Return a copy of the invisible 5-character primer blocks start their label from."""
+        if self._primer is None:
+            self._primer = Text("00000", font_size=1, color=BLACK)
+        return self._primer.copy()
+
+    def set_maxsize(self, maxsize: int) -> None:
+        """Change the capacity, dropping least recently used labels if it shrinks."""
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        while len(self._templates) > maxsize:
+            self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached label and reset the hit/miss counters."""
+        self._templates.clear()
+        self._primer = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+# Shared by all visual blocks
+label_cache = LabelCache()
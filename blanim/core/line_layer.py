@@ -0,0 +1,114 @@
+# blanim\blanim\core\line_layer.py
+
+from __future__ import annotations
+
+__all__ = ["DAGLineLayer"]
+
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+from manim import VMobject
+
+if TYPE_CHECKING:
+    from manim import Scene
+    from .parent_line import ParentLine
+
+
+class DAGLineLayer:
+    """Draws idle parent lines as subpaths of one VMobject per line style.
+
+    Every ParentLine is its own mobject with its own z-index sort entry and Cairo
+    stroke call. With the layer enabled, lines that are not animated leave the
+    scene after each play and are drawn by one merged VMobject per style class
+    (stroke color/opacity, width and z_index, so selected-parent and other lines
+    end up in separate layers), whose points are the lines' points stacked into
+    one NumPy array. Before a play, lines touched by any animation (movement
+    updates, style changes, creation) are put back into the scene as individual
+    ParentLines; once idle again they are merged with their new style.
+
+    Lines that leave the provided set (retired or collapsed blocks) or are re-added
+    to the scene by other code drop out of the merged layers on the next play.
+
+    Attributes:
+        scene: HUD2DScene the layer hooks into (see HUD2DScene.add_play_hooks)
+        layers: Merged VMobject of each style class currently drawn
+        merged: Lines currently drawn by a merged layer
+    """
+
+    def __init__(
+            self,
+            scene: Scene,
+            lines: Callable[[], Iterable[ParentLine]],
+            enabled: Callable[[], bool]
+    ):
+        self.scene = scene
+        self.layers: dict[tuple, VMobject] = {}
+        self.merged: set[ParentLine] = set()
+        self._lines = lines
+        self._enabled = enabled
+        scene.add_play_hooks(self._before_play, self._after_play)
+
+    def merge(self, lines: Optional[Iterable[ParentLine]] = None) -> None:
+        """Move idle lines (all provided lines if None) that are in the scene into the merged layers."""
+        lines = self._lines() if lines is None else lines
+        on_scene = {id(mob) for mob in self.scene.mobjects}
+        idle = [
+            line for line in lines
+            if line not in self.merged and id(line) in on_scene and not line.updaters
+        ]
+        if idle:
+            self.scene.remove(*idle)
+            self.merged.update(idle)
+        self.rebuild()
+
+    def unmerge(self, lines: Optional[Iterable[ParentLine]] = None) -> None:
+        """Put lines (all merged lines if None) back into the scene as individual mobjects."""
+        lines = list(self.merged) if lines is None else [line for line in lines if line in self.merged]
+        if lines:
+            self.merged.difference_update(lines)
+            self.scene.add(*lines)
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Regenerate the merged layers from the current points and styles of the merged lines."""
+        on_scene = {id(mob) for mob in self.scene.mobjects}
+        alive = set(self._lines())
+        self.merged = {line for line in self.merged if line in alive and id(line) not in on_scene}
+
+        groups: dict[tuple, list[ParentLine]] = {}
+        for line in self.merged:
+            key = (line.stroke_rgbas.tobytes(), line.get_stroke_width(), line.z_index)
+            groups.setdefault(key, []).append(line)
+
+        stale = [layer for key, layer in self.layers.items() if key not in groups]
+        if stale:
+            self.scene.remove(*stale)
+        layers = {}
+        for key, lines in groups.items():
+            layer = self.layers.get(key)
+            if layer is None:
+                layer = VMobject()
+                layer.match_style(lines[0])
+                layer.set_fill(opacity=0)
+                layer.set_z_index(lines[0].z_index)
+            layer.points = np.vstack([line.points for line in lines])
+            layers[key] = layer
+        self.layers = layers
+        if layers:
+            self.scene.add(*layers.values())
+
+    def _before_play(self, animations: list) -> None:
+        if not self.merged:
+            return
+        animated = set()
+        for animation in animations:
+            mobject = getattr(animation, "mobject", None)
+            if mobject is not None:
+                animated.update(id(mob) for mob in mobject.get_family())
+        self.unmerge([line for line in self.merged if id(line) in animated or line.updaters])
+
+    def _after_play(self) -> None:
+        if self._enabled():
+            self.merge()
+        elif self.merged:
+            self.unmerge()
@@ -0,0 +1,186 @@
+# blanim\blanim\core\lod.py
+
+from __future__ import annotations
+
+__all__ = ["HistorySummary", "XOrderedHistory", "history_cutoff_x"]
+
+from bisect import bisect_left, bisect_right
+from typing import Generic, Hashable, Iterable, List, TypeVar
+
+from manim import VGroup, Rectangle, GRAY, WHITE, ParsableManimColor, config
+
+from .label_cache import label_cache
+
+T = TypeVar("T", bound=Hashable)
+
+
+def history_cutoff_x(frame, frames_behind: float) -> float:
+    """X coordinate left of which mobjects are more than frames_behind frame widths behind the camera.
+
+    ``frame`` is the scene's camera frame (Frame2DWrapper or a MovingCamera frame).
+    """
+    frame_width = frame.get_width() if hasattr(frame, "get_width") else config["frame_width"]
+    return frame.get_center()[0] - frame_width / 2 - frames_behind * frame_width
+
+
+class XOrderedHistory(Generic[T]):
+    """Items kept sorted by an x coordinate, so history can be walked from the left.
+
+    Level-of-detail managers look up what lies left of the cutoff with a bisect
+    instead of scanning every block. Each item is stored with the x it was added
+    with; callers re-add items whose position changed.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        history = XOrderedHistory()
+        history.add(block, block.square.get_right()[0])
+        behind = history.before(cutoff)
+    """
+
+    def __init__(self):
+        self._items: List[T] = []
+        self._keys: List[float] = []
+        self._key_of: dict[T, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._key_of
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def add(self, item: T, x: float) -> None:
+        """Insert item at x (moving it if it is already present)."""
+        if item in self._key_of:
+            self.remove(item)
+        self._key_of[item] = x
+        if not self._keys or x >= self._keys[-1]:
+            # New history usually lands on the right
+            self._items.append(item)
+            self._keys.append(x)
+            return
+        index = bisect_right(self._keys, x)
+        self._keys.insert(index, x)
+        self._items.insert(index, item)
+
+    def add_many(self, items: Iterable[tuple[T, float]]) -> None:
+        """Insert (item, x) pairs, merging them in one pass."""
+        new: dict[T, float] = {}
+        for item, x in items:
+            if item not in self._key_of:
+                new.setdefault(item, x)
+        if len(new) <= 1:
+            for item, x in new.items():
+                self.add(item, x)
+            return
+        self._key_of.update(new)
+        pairs = sorted([*zip(self._items, self._keys), *new.items()], key=lambda pair: pair[1])
+        self._items = [item for item, _ in pairs]
+        self._keys = [x for _, x in pairs]
+
+    def remove(self, item: T) -> None:
+        """Remove item if present."""
+        x = self._key_of.pop(item, None)
+        if x is None:
+            return
+        index = bisect_left(self._keys, x)
+        while self._items[index] is not item:
+            index += 1
+        del self._items[index]
+        del self._keys[index]
+
+    def remove_many(self, items: Iterable[T]) -> None:
+        """Remove items, rebuilding only the part of the order up to the rightmost one."""
+        gone = {item for item in items if item in self._key_of}
+        if not gone:
+            return
+        end = bisect_right(self._keys, max(self._key_of.pop(item) for item in gone))
+        kept = [i for i in range(end) if self._items[i] not in gone]
+        self._items[:end] = [self._items[i] for i in kept]
+        self._keys[:end] = [self._keys[i] for i in kept]
+
+    def before(self, x: float) -> List[T]:
+        """Items left of x, from the left."""
+        return self._items[:bisect_left(self._keys, x)]
+
+    def from_x(self, x: float) -> List[T]:
+        """Items at or right of x, from the left."""
+        return self._items[bisect_left(self._keys, x):]
+
+    def first_x(self) -> float:
+        """Smallest x (the history must not be empty)."""
+        return self._keys[0]
+
+    def last_x(self) -> float:
+        """Largest x (the history must not be empty)."""
+        return self._keys[-1]
+
+
+class HistorySummary(VGroup):
+    """Lightweight stand-in for collapsed history: one strip spanning it plus a block count.
+
+    Level-of-detail managers remove blocks that are far behind the camera from the
+    scene and draw this summary in their place, so the renderer only handles two
+    mobjects for any amount of history.
+
+    Parameters
+    ----------
+    color : ParsableManimColor
+        Fill and stroke color of the strip.
+    fill_opacity : float
+        Fill opacity of the strip.
+    label_color : ParsableManimColor
+        Color of the block count.
+    font_size : float
+        Font size of the block count.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        summary = HistorySummary(color=BLUE)
+        summary.set_range(x_min=-20, x_max=-10, y_min=-1, y_max=1, count=42)
+        self.add(summary)
+    """
+
+    def __init__(
+            self,
+            color: ParsableManimColor = GRAY,
+            fill_opacity: float = 0.15,
+            label_color: ParsableManimColor = WHITE,
+            font_size: float = 24,
+    ):
+        super().__init__()
+        self.strip_color = color
+        self.strip_fill_opacity = fill_opacity
+        self.label_color = label_color
+        self.font_size = font_size
+        self.count = 0
+        self.strip = Rectangle(width=1, height=1)
+        self.label = label_cache.get("0 blocks", font_size=font_size, color=label_color)
+        self.add(self.strip, self.label)
+        self.set_z_index(0)
+
+    def set_range(self, x_min: float, x_max: float, y_min: float, y_max: float, count: int) -> HistorySummary:
+        """Cover the given area and show count collapsed blocks."""
+        width = max(x_max - x_min, 0.1)
+        height = max(y_max - y_min, 0.1)
+        center = [(x_min + x_max) / 2, (y_min + y_max) / 2, 0]
+
+        strip = Rectangle(width=width, height=height).move_to(center)
+        strip.set_fill(self.strip_color, opacity=self.strip_fill_opacity)
+        strip.set_stroke(self.strip_color, width=2, opacity=0.5)
+        self.strip.become(strip)
+
+        if count != self.count:
+            # Only rebuild the glyphs when the number changes
+            self.label.become(label_cache.get(f"{count} blocks", font_size=self.font_size, color=self.label_color))
+            self.count = count
+        self.label.next_to(self.strip, direction=[0, 1, 0], buff=0.1)
+        self.label.set_x(center[0])
+        self.set_z_index(0)
+        return self
@@ -0,0 +1,118 @@
+# blanim\blanim\core\moving_camera_hud_scene.py
+
+from __future__ import annotations
+
+__all__ = ["HUDMovingCamera", "MovingCameraHUDScene"]
+
+import itertools as it
+from typing import Iterable
+
+from manim import MovingCamera, MovingCameraScene, Mobject, config, RendererType
+from manim.utils.family import extract_mobject_family_members
+
+from .hud_2d_scene import HUDSceneMixin
+from .hud_camera import CachedRenderOrderMixin
+
+
+class HUDMovingCamera(CachedRenderOrderMixin, MovingCamera):
+    """MovingCamera that draws fixed-in-frame mobjects as a HUD over the moving world.
+
+    Fixed mobjects (and their family members) are kept in a set, so deciding whether
+    a mobject is part of the HUD is one hash lookup. Each frame the world is drawn
+    through the moving frame, then the HUD is drawn through the frame as it was
+    when the camera was created (the home frame), by swapping the frame's points
+    for the duration of the HUD pass. No 3D projection, shading or depth sort is
+    involved, and the render order is cached like HUDCamera's.
+
+    The HUD is always drawn above the world, whatever the z_index values.
+
+    Attributes:
+        fixed_in_frame_mobjects: Mobjects drawn relative to the home frame
+        home_frame_points: Frame points the HUD is drawn through
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fixed_in_frame_mobjects: set[Mobject] = set()
+        self.home_frame_points = self.frame.points.copy()
+
+    def add_fixed_in_frame_mobjects(self, *mobjects: Mobject) -> None:
+        """Draw mobjects (with their families) relative to the home frame."""
+        self.fixed_in_frame_mobjects.update(extract_mobject_family_members(mobjects))
+
+    def remove_fixed_in_frame_mobjects(self, *mobjects: Mobject) -> None:
+        """Draw mobjects (with their families) through the moving frame again."""
+        self.fixed_in_frame_mobjects.difference_update(extract_mobject_family_members(mobjects))
+
+    def capture_mobjects(self, mobjects: Iterable[Mobject], **kwargs) -> None:
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        fixed = self.fixed_in_frame_mobjects
+        if not fixed:
+            self._display(mobjects)
+            return
+
+        self._display([mob for mob in mobjects if mob not in fixed])
+        hud = [mob for mob in mobjects if mob in fixed]
+        if hud:
+            points = self.frame.points
+            self.frame.points = self.home_frame_points
+            try:
+                self._display(hud)
+            finally:
+                self.frame.points = points
+
+    def _display(self, mobjects: list[Mobject]) -> None:
+        # Same batching by type as Camera.capture_mobjects, on an already flattened list
+        for group_type, group in it.groupby(mobjects, self.type_or_raise):
+            self.display_funcs[group_type](list(group), self.pixel_array)
+
+
+class MovingCameraHUDScene(HUDSceneMixin, MovingCameraScene):
+    """Lightweight backend of :class:`~.HUD2DScene` built on :class:`~.MovingCameraScene`.
+
+    Offers the same narrate/caption/transcript API and the same ``self.camera.frame``
+    camera movements (``frame.animate.shift``, ``.scale``, ``.move_to``, ``.set``),
+    but renders through :class:`HUDMovingCamera` instead of a ThreeDCamera pinned
+    to a top-down view, so frames skip the 3D projection and depth sort.
+    ``self.camera.frame`` is MovingCamera's own frame rectangle rather than a
+    :class:`~.Frame2DWrapper`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        class MyScene(MovingCameraHUDScene):
+            def construct(self):
+                dag = KaspaDAG(scene=self)
+                self.narrate(r"Same API, 2D camera")
+                self.play(self.camera.frame.animate.shift(RIGHT * 2))
+
+    Notes
+    -----
+    - ThreeDScene methods (``move_camera``, ``set_camera_orientation``) are not available
+    - HUD elements are always drawn above the scene, regardless of z_index
+    """
+    hud_camera_class = HUDMovingCamera
+
+    def setup(self) -> None:
+        """Create the narration and transcript managers once the camera exists."""
+        super().setup()
+        self._setup_hud()
+
+    def add_fixed_in_frame_mobjects(self, *mobjects: Mobject) -> None:
+        """Add mobjects to the scene as HUD elements that ignore camera movements."""
+        if config.renderer == RendererType.CAIRO:
+            self.add(*mobjects)
+            self.renderer.camera.add_fixed_in_frame_mobjects(*mobjects)
+        elif config.renderer == RendererType.OPENGL:
+            for mob in mobjects:
+                mob.fix_in_frame()
+                self.add(mob)
+
+    def remove_fixed_in_frame_mobjects(self, *mobjects: Mobject) -> None:
+        """Let mobjects follow camera movements again (they stay in the scene)."""
+        if config.renderer == RendererType.CAIRO:
+            self.renderer.camera.remove_fixed_in_frame_mobjects(*mobjects)
+        elif config.renderer == RendererType.OPENGL:
+            for mob in mobjects:
+                mob.unfix_from_frame()
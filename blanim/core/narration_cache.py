@@ -0,0 +1,202 @@
+# blanim\blanim\core\narration_cache.py
+
+from __future__ import annotations
+
+__all__ = ["NarrationCache", "narration_cache"]
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Type
+
+import numpy as np
+from manim import VMobject, ManimColor, ParsableManimColor, Tex, MathTex, config, logger
+from manim import __version__ as manim_version
+
+from .block_prototype import clone_leaf
+
+# (text class name, text, font_size, color hex, tex template)
+NarrationKey = Tuple[str, str, float, str, str]
+
+# Bump when the on-disk layout changes, old files are then simply not found
+CACHE_FORMAT = 1
+
+
+class NarrationCache:
+    """Two-level cache of narration and caption mobjects, in memory and on disk.
+
+    Every ``narrate()``/``caption()`` builds a ``Tex``/``MathTex``/``Text``, which
+    parses an SVG and builds a styled mobject tree even when manim's own tex file
+    cache hits. Entries are keyed on (text class, text, font size, color, tex
+    template); the first request for a key builds the mobject and stores its
+    family as flat NumPy arrays (tree shape, points, fill and stroke colors,
+    stroke widths) in one ``.npz`` file. Later requests, in this run or in a
+    re-render, rebuild the tree from those arrays as plain VMobjects, which
+    Transform animates exactly like the original text.
+
+    Attributes:
+        maxsize: Number of distinct texts kept in memory, least recently used ones are dropped first
+        directory: Folder of the ``.npz`` files, ``<media_dir>/narration_cache`` if None
+        persistent: Read and write the on-disk level (memory only if False)
+        hits: Requests served from memory
+        disk_hits: Requests served from disk
+        misses: Requests that had to build the text
+
+    Examples
+    --------
+    .. code-block:: python
+
+        narration = narration_cache.get(Tex, r"Hello", font_size=40, color=WHITE)
+        narration.move_to(primer.get_center())
+    """
+
+    def __init__(self, maxsize: int = 256, directory: Optional[str | Path] = None, persistent: bool = True):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.directory = directory
+        self.persistent = persistent
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[NarrationKey, VMobject] = OrderedDict()
+        self._node = VMobject()
+
+    def get(
+            self,
+            text_class: Type[VMobject],
+            text: str,
+            font_size: float,
+            color: ParsableManimColor
+    ) -> VMobject:
+        """Return a new copy of text rendered by text_class in the given style."""
+        key = self.key(text_class, text, font_size, color)
+        template = self._templates.get(key)
+        if template is not None:
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return template.copy()
+
+        template = self._load(key)
+        if template is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            template = text_class(text, font_size=font_size, color=color)
+            self._store(key, template)
+        self._templates[key] = template
+        if len(self._templates) > self.maxsize:
+            self._templates.popitem(last=False)
+        return template.copy()
+
+    def is_cached(
+            self,
+            text_class: Type[VMobject],
+            text: str,
+            font_size: float,
+            color: ParsableManimColor
+    ) -> bool:
+        """Whether get() would be served without building the text (from memory or disk)."""
+        key = self.key(text_class, text, font_size, color)
+        return key in self._templates or (self.persistent and self._path(key).exists())
+
+    @staticmethod
+    def key(text_class: Type[VMobject], text: str, font_size: float, color: ParsableManimColor) -> NarrationKey:
+        """Cache key of a text in a style, including the tex template for Tex and MathTex."""
+        template = config.tex_template.body if issubclass(text_class, (Tex, MathTex)) else ""
+        return text_class.__name__, text, float(font_size), ManimColor(color).to_hex(), template
+
+    def get_directory(self) -> Path:
+        """Folder the on-disk level reads and writes."""
+        if self.directory is not None:
+            return Path(self.directory)
+        return Path(config.media_dir) / "narration_cache"
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop every text kept in memory (and the ``.npz`` files if disk) and reset the counters."""
+        self._templates.clear()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if disk:
+            for path in self.get_directory().glob("*.npz"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def _path(self, key: NarrationKey) -> Path:
+        digest = hashlib.blake2b(repr((CACHE_FORMAT, manim_version, key)).encode(), digest_size=16)
+        return self.get_directory() / f"{digest.hexdigest()}.npz"
+
+    def _store(self, key: NarrationKey, mobject: VMobject) -> None:
+        if not self.persistent:
+            return
+        nodes = mobject.get_family()
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp.npz")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(
+                tmp,
+                children=np.array([len(node.submobjects) for node in nodes], dtype=np.int32),
+                point_counts=np.array([len(node.points) for node in nodes], dtype=np.int32),
+                points=np.concatenate([node.points.reshape(-1, 3) for node in nodes]),
+                fill_counts=np.array([len(node.fill_rgbas) for node in nodes], dtype=np.int32),
+                fill=np.concatenate([node.fill_rgbas.reshape(-1, 4) for node in nodes]),
+                stroke_counts=np.array([len(node.stroke_rgbas) for node in nodes], dtype=np.int32),
+                stroke=np.concatenate([node.stroke_rgbas.reshape(-1, 4) for node in nodes]),
+                stroke_width=np.array([node.stroke_width for node in nodes], dtype=float),
+            )
+            os.replace(tmp, path)
+        except (OSError, AttributeError, ValueError) as e:
+            logger.debug(f"Narration cache could not write {path}: {e}")
+
+    def _load(self, key: NarrationKey) -> Optional[VMobject]:
+        if not self.persistent:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return self._build(data)
+        except (OSError, KeyError, ValueError) as e:
+            logger.debug(f"Narration cache ignoring unreadable {path}: {e}")
+            return None
+
+    def _build(self, data) -> VMobject:
+        children = data["children"]
+        points = np.split(data["points"], np.cumsum(data["point_counts"])[:-1])
+        fill = np.split(data["fill"], np.cumsum(data["fill_counts"])[:-1])
+        stroke = np.split(data["stroke"], np.cumsum(data["stroke_counts"])[:-1])
+        stroke_width = data["stroke_width"]
+
+        nodes = []
+        for i in range(len(children)):
+            node = clone_leaf(self._node)
+            node.points = points[i]
+            node.fill_rgbas = fill[i]
+            node.stroke_rgbas = stroke[i]
+            node.stroke_width = float(stroke_width[i])
+            nodes.append(node)
+
+        # Families are stored in pre-order, each node followed by its subtrees
+        next_index = 1
+        stack = [0]
+        remaining = [int(count) for count in children]
+        while stack:
+            parent = stack[-1]
+            if remaining[parent] == 0:
+                stack.pop()
+                continue
+            remaining[parent] -= 1
+            nodes[parent].submobjects.append(nodes[next_index])
+            stack.append(next_index)
+            next_index += 1
+        return nodes[0]
+
+
+# Shared by all HUD scenes
+narration_cache = NarrationCache()
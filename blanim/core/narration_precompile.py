@@ -0,0 +1,108 @@
+# blanim\blanim\core\narration_precompile.py
+
+from __future__ import annotations
+
+__all__ = ["discover_narration_strings", "precompile_narrations"]
+
+import ast
+import inspect
+import os
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional, Tuple, Type
+
+from manim import VMobject, ManimColor, TexTemplate, config, logger
+
+from .narration_cache import narration_cache
+
+# (text class, text, font_size, color hex)
+PrecompileJob = Tuple[Type[VMobject], str, float, str]
+
+# Scene methods whose first argument is displayed as narration (upper) or caption (lower)
+_NARRATION_METHODS = {"narrate": True, "caption": False, "narrate_and_clear": True}
+
+
+def discover_narration_strings(scene_class: type) -> tuple[list[str], list[str]]:
+    """Literal narration and caption strings in the source of a scene class and its user-defined bases.
+
+    Finds calls to ``narrate``, ``caption`` and ``narrate_and_clear`` (``upper=False``
+    counts as a caption) whose text is a string literal. Texts built at runtime
+    (f-strings, variables) are not found; declare those in ``narration_strings``
+    / ``caption_strings`` instead.
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        Narration strings and caption strings, in source order without duplicates.
+    """
+    narrations: dict[str, None] = {}
+    captions: dict[str, None] = {}
+    for cls in scene_class.__mro__:
+        if cls.__module__.startswith(("blanim.core", "manim", "builtins")):
+            continue
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(cls)))
+        except (OSError, TypeError, SyntaxError):
+            continue
+
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+                continue
+            upper = _NARRATION_METHODS.get(node.func.attr)
+            if upper is None:
+                continue
+            text = node.args[0] if node.args else next((kw.value for kw in node.keywords if kw.arg == "text"), None)
+            if not (isinstance(text, ast.Constant) and isinstance(text.value, str)):
+                continue
+            for kw in node.keywords:
+                if kw.arg == "upper" and isinstance(kw.value, ast.Constant):
+                    upper = bool(kw.value.value)
+            (narrations if upper else captions)[text.value] = None
+    return list(narrations), list(captions)
+
+
+def precompile_narrations(jobs: Iterable[PrecompileJob], max_workers: Optional[int] = None) -> int:
+    """Build texts concurrently in a process pool, warming manim's tex cache and the narration cache.
+
+    Each worker builds its text through a :class:`~.NarrationCache` writing to the
+    same directory as :data:`~.narration_cache`, so the LaTeX/dvisvgm (or Pango) work
+    and the SVG parse both happen in the workers; the scene then loads every
+    text from disk. Texts already cached are skipped.
+
+    Returns
+    -------
+    int
+        Number of texts compiled.
+    """
+    if not narration_cache.persistent:
+        logger.debug("Narration precompilation skipped, the narration cache is not persistent")
+        return 0
+    pending = [job for job in dict.fromkeys(jobs) if not narration_cache.is_cached(*job)]
+    if not pending:
+        return 0
+
+    if len(pending) == 1:
+        text_class, text, font_size, color = pending[0]
+        narration_cache.get(text_class, text, font_size=font_size, color=ManimColor(color))
+        return 1
+
+    context = (str(config.get_dir("tex_dir")), config.tex_template, str(narration_cache.get_directory()))
+
+    workers = min(len(pending), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_compile, job, *context) for job in pending]
+        for job, future in zip(pending, futures):
+            try:
+                future.result()
+            except Exception as e:  # noqa: BLE001 - the real render reports it again
+                logger.warning(f"Precompiling {job[1][:50]!r} failed: {e}")
+    return len(pending)
+
+
+def _compile(job: PrecompileJob, tex_dir: str, tex_template: TexTemplate, cache_dir: str) -> None:
+    # Workers may be spawned with a fresh config, carry over what text building depends on
+    config.tex_dir = tex_dir
+    config.tex_template = tex_template
+    narration_cache.directory = cache_dir
+    text_class, text, font_size, color = job
+    narration_cache.get(text_class, text, font_size=font_size, color=ManimColor(color))
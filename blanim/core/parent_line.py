@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-__all__ = ["ParentLine"]
+__all__ = ["ParentLine", "ParentLineBatchUpdate", "batch_line_updates"]
 
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
 from manim import Line, WHITE, CapStyleType, UpdateFromFunc, ParsableManimColor
-from manim import Mobject
+from manim import Mobject, Animation, AnimationGroup, Group
+from manim.animation.animation import prepare_animation
+
+from .batch_style import remove_wrapper_group
+
+if TYPE_CHECKING:
+    from manim import Scene
 
 
 class ParentLine(Line):
@@ -35,7 +44,8 @@ class ParentLine(Line):
         **Architecture Integration**
 
         - Owned by child block (created during child initialization)
-        - Should be registered with both parent and child blocks' `connected_lines` lists
+        - Registered with the child's `parent_lines` and the parent's `child_lines`,
+          so either block finds its lines without scanning its neighbours
         - Position updates triggered by DAG's `deduplicate_line_animations()` helper
         - Compatible with HUD2DScene's z-index rendering system
 
@@ -122,4 +132,160 @@ class ParentLine(Line):
             self,
             update_function=self._update_position_and_size,
             suspend_mobject_updating=False
-        )
\ No newline at end of file
+        )
+
+
+class ParentLineBatchUpdate(Animation):
+    """Keep many ParentLines attached to their blocks with one animation.
+
+    Replaces one ``UpdateFromFunc`` per line, each of which recomputes both block
+    bounding boxes and rebuilds its points every frame. When the animation begins,
+    the offset from each square's first point to its left/right edge is cached,
+    so a frame only reads one point per distinct square and writes the endpoints
+    of all lines from a single NumPy computation (including the line buff).
+
+    Blocks must only be translated while this runs (moves and shifts).
+    batch_line_updates only batches lines whose block animations are pure
+    translations and leaves the others on their per-line updates.
+
+    Parameters
+    ----------
+    lines : Iterable[ParentLine]
+        Lines to keep attached. Duplicates are ignored.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        self.play(
+            block.square.animate.shift(UP),
+            ParentLineBatchUpdate(lines_touching_block)
+        )
+    """
+
+    def __init__(self, lines: Iterable[ParentLine], **kwargs):
+        self.lines: list[ParentLine] = list(dict.fromkeys(lines))
+        kwargs.setdefault("suspend_mobject_updating", False)
+        super().__init__(Group(*self.lines), **kwargs)
+
+        self._squares: list[Mobject] = []
+        self._left_offsets = self._right_offsets = np.zeros((0, 3))
+        self._start_index = self._end_index = np.zeros(0, dtype=int)
+        self._buffs = np.zeros(0)
+
+    def begin(self) -> None:
+        # Offsets are read once here, no starting mobject copy is made
+        index_of: dict[int, int] = {}
+        squares, start_index, end_index = [], [], []
+        for line in self.lines:
+            for square, indices in ((line.this_block, start_index), (line.parent_block, end_index)):
+                if id(square) not in index_of:
+                    index_of[id(square)] = len(squares)
+                    squares.append(square)
+                indices.append(index_of[id(square)])
+
+        self._squares = squares
+        self._start_index = np.array(start_index, dtype=int)
+        self._end_index = np.array(end_index, dtype=int)
+        self._buffs = np.array([line.buff for line in self.lines], dtype=float)
+        if squares:
+            anchors = self._read_anchors()
+            self._left_offsets = np.array([square.get_left() for square in squares]) - anchors
+            self._right_offsets = np.array([square.get_right() for square in squares]) - anchors
+        self.interpolate(0)
+
+    def clean_up_from_scene(self, scene: Scene) -> None:
+        super().clean_up_from_scene(scene)
+        remove_wrapper_group(scene, self.mobject)
+
+    def _read_anchors(self) -> np.ndarray:
+        return np.array([square.points[0] for square in self._squares], dtype=float)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if not self.lines:
+            return
+        anchors = self._read_anchors()
+        starts = (anchors + self._left_offsets)[self._start_index]
+        ends = (anchors + self._right_offsets)[self._end_index]
+        deltas = ends - starts
+
+        # Same result as Line.set_points_by_ends: straight cubic, trimmed by buff at both ends
+        lengths = np.linalg.norm(deltas, axis=1)
+        trim = np.divide(self._buffs, lengths, out=np.zeros_like(lengths), where=lengths >= 2 * self._buffs)
+        trim[self._buffs == 0] = 0
+        t = trim[:, None] + (1 - 2 * trim)[:, None] * np.linspace(0, 1, 4)
+        points = starts[:, None, :] + t[:, :, None] * deltas[:, None, :]
+
+        for line, line_points, start, end in zip(self.lines, points, starts, ends):
+            line.points = line_points
+            line.start = start
+            line.end = end
+
+
+def batch_line_updates(*animations: Animation | AnimationGroup) -> list[Animation]:
+    """Flatten movement animations and merge their ParentLine updates into one batch.
+
+    Movement animations are AnimationGroups of a block animation plus one
+    ``UpdateFromFunc`` per connected line. Block animations are returned first
+    (in order), followed by a single ParentLineBatchUpdate for all distinct
+    ParentLines, so lines read the block positions of the current frame. Lines
+    in a group whose block animation is not a pure translation (scaling,
+    Indicate, reshaping) keep their own ``UpdateFromFunc``, since the batch
+    caches edge offsets when it begins. Other ``UpdateFromFunc`` animations
+    are kept, deduplicated by mobject.
+
+    Returns:
+        Flat list of animations: [block_animation, ..., line_updates]
+    """
+    block_animations = []
+    line_updates = []
+    lines: dict[int, ParentLine] = {}
+    unbatched: dict[int, UpdateFromFunc] = {}
+    seen_mobjects = set()
+    run_time = 0.0
+
+    for group in animations:
+        group = prepare_animation(group)
+        members = group.animations if isinstance(group, AnimationGroup) else [group]
+        translating = all(_is_translation(anim) for anim in members if not isinstance(anim, UpdateFromFunc))
+        for anim in members:
+            if isinstance(anim, UpdateFromFunc):
+                if isinstance(anim.mobject, ParentLine):
+                    if translating:
+                        lines.setdefault(id(anim.mobject), anim.mobject)
+                        run_time = max(run_time, anim.run_time)
+                    else:
+                        unbatched.setdefault(id(anim.mobject), anim)
+                elif id(anim.mobject) not in seen_mobjects:
+                    seen_mobjects.add(id(anim.mobject))
+                    line_updates.append(anim)
+            else:
+                block_animations.append(anim)
+
+    # A line attached to any non-translated block keeps its per-line update
+    line_updates.extend(unbatched.values())
+    batched = [line for key, line in lines.items() if key not in unbatched]
+    if batched:
+        line_updates.append(ParentLineBatchUpdate(batched, run_time=run_time))
+    return block_animations + line_updates
+
+
+def _is_translation(animation: Animation) -> bool:
+    """Whether a Transform-style animation only translates its mobject (every point by the same offset)."""
+    target = getattr(animation, "target_mobject", None)
+    if target is None:
+        return False
+    starts = animation.mobject.family_members_with_points()
+    ends = target.family_members_with_points()
+    if len(starts) != len(ends):
+        return False
+    offset = None
+    for start, end in zip(starts, ends):
+        if start.points.shape != end.points.shape:
+            return False
+        deltas = end.points - start.points
+        if offset is None:
+            offset = deltas[0] if len(deltas) else None
+        if len(deltas) and not np.allclose(deltas, offset, atol=1e-6):
+            return False
+    return True
@@ -0,0 +1,195 @@
+# blanim\blanim\core\sprite.py
+
+from __future__ import annotations
+
+__all__ = ["SpriteCache", "SpriteLayer"]
+
+import copy
+import math
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+from manim import Camera, ImageMobject
+
+if TYPE_CHECKING:
+    from manim import Scene
+    from .base_visual_block import BaseVisualBlock
+
+
+class SpriteCache:
+    """Raster images of blocks, rendered once per look and shared between blocks.
+
+    A sprite is the block's background, square and label rendered by an offscreen
+    Cairo camera into an RGBA image. Blocks with the same key (see
+    BaseVisualBlock.get_sprite_key) reuse the same pixels; every sprite handed
+    out shares the template's pixel array and only copies its corner points.
+
+    Attributes:
+        pixels_per_unit: Raster resolution, in pixels per scene unit
+        maxsize: Number of distinct sprites kept, least recently used ones are dropped first
+    """
+
+    def __init__(self, pixels_per_unit: float = 100, maxsize: int = 512):
+        self.pixels_per_unit = pixels_per_unit
+        self.maxsize = maxsize
+        self._templates: OrderedDict[tuple, ImageMobject] = OrderedDict()
+
+    def get(self, block: BaseVisualBlock, key: Optional[tuple] = None) -> ImageMobject:
+        """Return a sprite of block, centered on its square."""
+        if key is None:
+            key = block.get_sprite_key()
+        template = self._templates.get(key)
+        if template is None:
+            template = self._render(block)
+            self._templates[key] = template
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        else:
+            self._templates.move_to_end(key)
+
+        sprite = copy.copy(template)
+        sprite.points = template.points.copy()
+        sprite.submobjects = []
+        sprite.updaters = []
+        sprite.move_to(block.square.get_center())
+        sprite.set_z_index(block.square.z_index)
+        return sprite
+
+    def _render(self, block: BaseVisualBlock) -> ImageMobject:
+        # Square plus room for its stroke
+        size = block.square.width + 0.1
+        pixels = max(1, math.ceil(size * self.pixels_per_unit))
+        camera = Camera(
+            frame_center=block.square.get_center(),
+            pixel_width=pixels,
+            pixel_height=pixels,
+            frame_width=size,
+            frame_height=size,
+            background_opacity=0,
+        )
+        camera.capture_mobjects([block.background_rect, block.square, block.label])
+
+        template = ImageMobject(np.array(camera.pixel_array))
+        template.stretch_to_fit_width(size)
+        template.stretch_to_fit_height(size)
+        return template
+
+    def clear(self) -> None:
+        """Drop every cached sprite."""
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+class SpriteLayer:
+    """Draws idle blocks as cached raster sprites instead of vector paths.
+
+    The Cairo renderer rasterizes every visible block (background, square,
+    label glyphs) from its paths on every frame. In raster mode a block that is
+    not animated is replaced in the scene by an ImageMobject from the SpriteCache,
+    which is a single image blit. Before each play, blocks touched by any
+    animation (or carrying updaters, like the pulsing highlight) are swapped back
+    to vectors; after the play, idle blocks become sprites again, of their new
+    style. Sprites of blocks restyled or moved without a play (instant styles,
+    culled off-screen targets) are refreshed after the next play. Parent lines
+    always stay vectors.
+
+    Attributes:
+        scene: HUD2DScene the layer hooks into (see HUD2DScene.add_play_hooks)
+        cache: Sprite images, shared by all blocks
+        sprites: Sprite currently drawn for each rasterized block
+    """
+
+    def __init__(
+            self,
+            scene: Scene,
+            blocks: Callable[[], Iterable[BaseVisualBlock]],
+            enabled: Callable[[], bool],
+            pixels_per_unit: float = 100
+    ):
+        self.scene = scene
+        self.cache = SpriteCache(pixels_per_unit)
+        self.sprites: dict[BaseVisualBlock, ImageMobject] = {}
+        self._keys: dict[BaseVisualBlock, tuple] = {}
+        self._blocks = blocks
+        self._enabled = enabled
+        scene.add_play_hooks(self._before_play, self._after_play)
+
+    def rasterize(self, blocks: Optional[Iterable[BaseVisualBlock]] = None) -> None:
+        """Replace idle blocks (all provided blocks if None) that are in the scene with sprites."""
+        blocks = self._blocks() if blocks is None else blocks
+        on_scene = {id(mob) for mob in self.scene.mobjects}
+        removed, added = [], []
+        for block in blocks:
+            if block in self.sprites or id(block) not in on_scene:
+                continue
+            if any(mob.updaters for mob in (block, block.square, block.label)):
+                continue
+            key = block.get_sprite_key()
+            sprite = self.cache.get(block, key)
+            self.sprites[block] = sprite
+            self._keys[block] = key
+            removed.append(block)
+            added.append(sprite)
+        if removed:
+            self.scene.remove(*removed)
+            self.scene.add(*added)
+
+    def vectorize(self, blocks: Optional[Iterable[BaseVisualBlock]] = None) -> None:
+        """Swap sprites back to the vector blocks (all rasterized blocks if None)."""
+        blocks = list(self.sprites) if blocks is None else [b for b in blocks if b in self.sprites]
+        if not blocks:
+            return
+        sprites = [self.sprites.pop(block) for block in blocks]
+        for block in blocks:
+            del self._keys[block]
+        self.scene.remove(*sprites)
+        self.scene.add(*blocks)
+
+    def forget(self, block: BaseVisualBlock) -> None:
+        """Remove a block's sprite from the scene without re-adding the block (block removal)."""
+        sprite = self.sprites.pop(block, None)
+        if sprite is not None:
+            del self._keys[block]
+            self.scene.remove(sprite)
+
+    def refresh(self) -> None:
+        """Follow style and position changes that blocks received without being animated."""
+        removed, added = [], []
+        for block, sprite in self.sprites.items():
+            key = block.get_sprite_key()
+            if key != self._keys[block]:
+                removed.append(sprite)
+                sprite = self.sprites[block] = self.cache.get(block, key)
+                self._keys[block] = key
+                added.append(sprite)
+            elif not np.allclose(sprite.get_center(), block.square.get_center()):
+                sprite.move_to(block.square.get_center())
+        if removed:
+            self.scene.remove(*removed)
+            self.scene.add(*added)
+
+    def _before_play(self, animations: list) -> None:
+        if not self.sprites:
+            return
+        animated = set()
+        for animation in animations:
+            mobject = getattr(animation, "mobject", None)
+            if mobject is not None:
+                animated.update(id(mob) for mob in mobject.get_family())
+
+        self.vectorize([
+            block for block in self.sprites
+            if block.square.updaters or any(
+                id(mob) in animated for mob in (block, block.square, block.background_rect, block.label)
+            )
+        ])
+
+    def _after_play(self) -> None:
+        if self._enabled():
+            self.refresh()
+            self.rasterize()
+        elif self.sprites:
+            self.vectorize()
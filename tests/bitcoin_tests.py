@@ -800,4 +800,32 @@ class TestParentChildRelationships(HUD2DScene):
 
         text = Text("Parent-Child Tests Passed", color=GREEN).to_edge(UP)
         self.play(Write(text))
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
+
+class TestZoomedCameraFollow(HUD2DScene):
+    """Test that the camera follow margin uses the zoomed frame width."""
+
+    def construct(self):
+        # Zoom out so the frame is twice the configured width
+        self.play(self.camera.frame.animate.scale(2))
+
+        dag = BitcoinDAG(scene=self)
+        block = dag.add_block()
+        for _ in range(20):
+            block = dag.add_block(parent=block)
+
+        # The follow keeps the tip exactly one margin inside the zoomed right edge
+        frame = self.camera.frame
+        right_edge = frame.get_center()[0] + frame.get_width() / 2
+        margin = dag.config.horizontal_spacing * 2
+        assert abs(dag.rightmost_x - (right_edge - margin)) < 0.01, \
+            f"Tip at {dag.rightmost_x:.2f}, expected {right_edge - margin:.2f} for the zoomed frame"
+
+        self.caption("Camera followed with the zoomed frame width")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Zoomed Camera Follow Test Passed", color=GREEN).to_edge(UP)
+        self.add_fixed_in_frame_mobjects(text)
+        self.play(Write(text))
+        self.wait(2)
@@ -1079,3 +1079,729 @@ class ComprehensiveHighlightingExample(HUD2DScene):
         dag.reset_highlighting()
         self.wait(1)
 
+
+
+class TestStreamingWindow(HUD2DScene):
+    """Test streaming blocks into the DAG with a sliding retirement window."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+
+        self.caption("Streaming 30 seconds of blocks, keeping a 10 second window")
+        stream = dag.stream_blocks(blocks_per_second=1, network_delay_ms=350, duration_seconds=30)
+        created = dag.create_blocks_from_stream(stream, window_seconds=10)
+
+        # Only blocks inside the window (relative to the newest block) remain alive
+        newest = max(b.timestamp for b in dag.all_blocks)
+        assert all(b.timestamp >= newest - 10_000 for b in dag.all_blocks), \
+            "Blocks outside the window were not retired"
+        assert len(dag.all_blocks) <= created, "Retired blocks still registered"
+
+        # Live blocks no longer reference retired ones
+        live = set(dag.all_blocks)
+        for block in dag.all_blocks:
+            assert all(parent in live for parent in block.parents), \
+                f"{block.name} still references a retired parent"
+            assert len(block.parents) == len(block.visual_block.parent_lines), \
+                f"{block.name} parent lines out of sync with parents"
+
+        self.clear_caption()
+        text = Text("Streaming Window Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+
+class TestLoadDAGFile(HUD2DScene):
+    """Test bulk-loading a node dump with visuals for a window only."""
+
+    def construct(self):
+        import hashlib
+        import json
+        import tempfile
+        from pathlib import Path
+
+        def node_hash(i):
+            return hashlib.sha256(str(i).encode()).hexdigest()
+
+        # A simple chain with a fork every 5th block, blue scores as a node would export them
+        records = [{"hash": node_hash(0), "parents": [], "timestamp": 0, "blue_score": 0}]
+        for i in range(1, 40):
+            parents = [node_hash(i - 1)] if i % 5 else [node_hash(i - 1), node_hash(i - 2)]
+            records.append({"hash": node_hash(i), "parents": parents, "timestamp": i * 1000, "blue_score": i})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            jsonl_path = Path(tmp) / "segment.jsonl"
+            jsonl_path.write_text("\n".join(json.dumps(r) for r in records))
+
+            dag = KaspaDAG(scene=self)
+            loaded = dag.load_dag_file(str(jsonl_path), window=(30, 40))
+            assert loaded == 40, f"Expected 40 blocks, got {loaded}"
+            assert len(dag.rendered_blocks) == 10, "Only the window should have visuals"
+            assert dag.get_block_by_hash(node_hash(39)).ghostdag.blue_score == 39, "Blue score not imported"
+            assert not dag.get_block_by_hash(node_hash(39)).ghostdag.complete, "Trusted block should be incomplete"
+
+            # Verified blocks whose whole past was imported get full GHOSTDAG data
+            verified_dag = KaspaDAG(scene=self)
+            verified_dag.load_dag_file(str(jsonl_path), verify_blue_scores=True)
+            assert verified_dag.get_block_by_hash(node_hash(39)).ghostdag.complete, "Verified block should be complete"
+
+            # The binary format round-trips to the same DAG
+            binary_path = Path(tmp) / "segment.bldag"
+            write_binary(read_dag_file(jsonl_path), binary_path)
+            binary_dag = KaspaDAG(scene=self)
+            assert binary_dag.load_dag_file(str(binary_path)) == 40, "Binary load lost blocks"
+
+        self.caption("Imported 40 blocks, rendered the last 10")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Load DAG File Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestSnapshotRoundTrip(HUD2DScene):
+    """Test saving a simulated DAG and restoring it without recomputing GHOSTDAG."""
+
+    def construct(self):
+        import tempfile
+        from pathlib import Path
+
+        dag = KaspaDAG(scene=self, seed=7)
+        dag.apply_config(KaspaConfig(k=3))
+        blocks = dag.simulate_blocks(duration_seconds=8, blocks_per_second=1, network_delay_ms=1500)
+        dag.create_blocks_from_simulator_list(blocks)
+        self.wait(1)
+
+        # Same seed, same simulated timestamps
+        replay = KaspaDAG(scene=self, seed=7)
+        assert replay.simulate_blocks(8, 1, 1500) == blocks, "Seeded simulation is not reproducible"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "dag_snapshot.npz")
+            dag.save_snapshot(path)
+
+            # Clear the scene and restore the snapshot into a fresh DAG
+            for block in dag.rendered_blocks:
+                self.remove(block.visual_block, *block.visual_block.parent_lines)
+            restored = KaspaDAG(scene=self).load_snapshot(path)
+
+        assert len(restored.all_blocks) == len(dag.all_blocks), "Snapshot lost blocks"
+        assert restored.config.k == 3, "Snapshot lost config"
+        assert isinstance(restored.config.block_color, ManimColor), "Snapshot restored a color as str"
+        for original, copy in zip(dag.all_blocks, restored.all_blocks):
+            assert original.name == copy.name, "Block order changed"
+            assert original.ghostdag.blue_score == copy.ghostdag.blue_score, f"Blue score differs for {copy.name}"
+            assert [p.name for p in original.parents] == [p.name for p in copy.parents], "Parents differ"
+            original_pov = {b.name: v for b, v in original.ghostdag.local_blue_pov.items()}
+            restored_pov = {b.name: v for b, v in copy.ghostdag.local_blue_pov.items()}
+            assert original_pov == restored_pov, f"Blue POV differs for {copy.name}"
+            assert {b.name for b in original.ghostdag.blue_anticone} == \
+                   {b.name for b in copy.ghostdag.blue_anticone}, f"Blue anticone differs for {copy.name}"
+            if original.visual_block is not None:
+                assert copy.visual_block._label_text == original.visual_block._label_text, \
+                    f"Label differs for {copy.name}"
+
+        self.caption("Snapshot restored")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Snapshot Round Trip Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestDeterministicHashes(HUD2DScene):
+    """Test that seeded DAGs assign identical hashes and selected parents between runs."""
+
+    def construct(self):
+        def build(seed):
+            dag = KaspaDAG(scene=self, seed=seed)
+            dag.create_blocks_from_simulator_list(dag.simulate_blocks(6, 1, 2000))
+            result = [(b.name, b.hash, b.selected_parent.name if b.selected_parent else None)
+                      for b in dag.all_blocks]
+            for block in dag.rendered_blocks:
+                self.remove(block.visual_block, *block.visual_block.parent_lines)
+            return result
+
+        first = build(seed=42)
+        second = build(seed=42)
+        assert first == second, "Same seed produced different hashes or selected parents"
+
+        other = build(seed=43)
+        assert [h for _, h, _ in other] != [h for _, h, _ in first], "Different seeds should change hashes"
+
+        self.caption("Same seed, same DAG")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Deterministic Hashes Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestBatchedSimulatorCreation(HUD2DScene):
+    """Test batched creation: far fewer plays, same centered column layout."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self, seed=3)
+        blocks = dag.simulate_blocks(duration_seconds=30, blocks_per_second=1, network_delay_ms=1500)
+
+        plays_before = self.renderer.num_plays
+        created = dag.create_blocks_from_simulator_list(blocks, batch_size=8, batch_time_ms=5000)
+        plays = self.renderer.num_plays - plays_before
+
+        assert len(created) == len(blocks), "Batch lost blocks"
+        assert plays < len(blocks), f"Expected fewer plays than blocks, got {plays} for {len(blocks)} blocks"
+
+        # Every column is centered on genesis_y with uniform spacing
+        columns = {}
+        for block in dag.all_blocks:
+            x, y, _ = block.visual_block.square.get_center()
+            columns.setdefault(round(x, 2), []).append(y)
+        for x, ys in columns.items():
+            ys.sort()
+            assert abs((ys[0] + ys[-1]) / 2 - dag.config.genesis_y) < 0.01, f"Column {x} not centered"
+            for lower, upper in zip(ys, ys[1:]):
+                assert abs(upper - lower - dag.config.vertical_spacing) < 0.01, f"Column {x} spacing off"
+
+        self.caption(f"{len(created)} blocks in {plays} plays")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Batched Simulator Creation Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestWorkflowCompaction(HUD2DScene):
+    """Test that catch_up merges compatible queued steps and drops no-ops."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+        genesis = dag.queue_block(timestamp=0)
+        dag.next_step()
+
+        # Three siblings have no parent inside the run, so they share one play
+        siblings = [dag.queue_block(timestamp=1, parents=[genesis]) for _ in range(3)]
+        dag.queue_camera_follow()
+        # A merge block depends on the run above and starts a new play
+        merge = dag.queue_block(timestamp=2, parents=siblings)
+        # Moving a block to where it already is does nothing
+        dag.queue_move([genesis], [tuple(genesis.visual_block.square.get_center()[:2])])
+
+        plays_before = self.renderer.num_plays
+        dag.catch_up()
+        plays = self.renderer.num_plays - plays_before
+
+        assert plays == 2, f"Expected 2 plays (siblings, merge), got {plays}"
+        assert merge.actual_block is not None, "Merge block not created"
+        assert all(s.actual_block is not None for s in siblings), "Sibling not created"
+
+        self.caption("5 steps in 2 plays")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Workflow Compaction Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestViewportCulling(HUD2DScene):
+    """Test that off-screen blocks receive highlight styles instantly."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+        chain = dag.simulate_blocks(duration_seconds=20, blocks_per_second=1, network_delay_ms=0)
+        blocks = dag.create_blocks_from_simulator_list(chain, batch_size=10)
+
+        genesis = blocks[0]
+        view = dag.movement.get_viewport_bounds()
+        assert not dag.movement.is_in_view(genesis.visual_block.square, view), "Genesis should be off screen"
+
+        dag.highlight_future(blocks[-1])
+        assert abs(genesis.visual_block.square.get_fill_opacity() - dag.config.fade_opacity) < 1e-6, \
+            "Off-screen block was not faded"
+
+        dag.reset_highlighting()
+        assert abs(genesis.visual_block.square.get_fill_opacity() - dag.config.fill_opacity) < 1e-6, \
+            "Off-screen block was not reset"
+
+        self.caption("Off-screen blocks styled without animation")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Viewport Culling Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestDirtyStateHighlighting(HUD2DScene):
+    """Test that highlight/reset cycles only touch blocks with non-default style."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+        blocks = dag.create_blocks_from_simulator_list(dag.simulate_blocks(10, 1, 1500), batch_size=5)
+        highlighter = dag.relationship_highlighter
+
+        # Nothing is styled yet, so a reset has nothing to do
+        plays_before = self.renderer.num_plays
+        dag.reset_highlighting()
+        assert self.renderer.num_plays == plays_before, "Reset of a clean DAG should not play"
+
+        dag.highlight_past(blocks[-1])
+        styled = dict(highlighter.block_styles)
+        assert styled[blocks[-1]] == "pulsing", "Focused block not tracked"
+        assert len(styled) == len(dag.rendered_blocks), "Every rendered block should have a tracked style"
+
+        # Same highlight again: the reset/fade diff is empty, only the highlight wait plays
+        plays_before = self.renderer.num_plays
+        dag.highlight_past(blocks[-1])
+        assert self.renderer.num_plays - plays_before == 1, "Repeated highlight should only play the wait"
+        assert highlighter.block_styles == styled, "Tracked styles changed on identical highlight"
+
+        dag.reset_highlighting()
+        assert not highlighter.block_styles and not highlighter.line_styles, "Reset left tracked styles"
+
+        self.caption("Only changed blocks were animated")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Dirty State Highlighting Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestBatchStyleAnimation(HUD2DScene):
+    """Test that fading many blocks runs as one vectorized style animation."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+        blocks = dag.create_blocks_from_simulator_list(dag.simulate_blocks(12, 2, 1500), batch_size=6)
+
+        targets = []
+        for block in blocks:
+            targets.extend(block.visual_block.get_fade_targets())
+            targets.extend(block.visual_block.get_line_fade_targets())
+        animation = BatchStyleAnimation(targets, run_time=1, rate_func=linear)
+
+        # Halfway through, every label sits halfway between its start and faded opacity
+        label = blocks[0].visual_block.label
+        start_opacity = label.get_fill_opacity()
+        animation.begin()
+        animation.interpolate(0.5)
+        expected = (start_opacity + dag.config.fade_opacity) / 2
+        assert abs(label.get_fill_opacity() - expected) < 1e-6, "Label fade is not linear"
+        animation.interpolate(0)
+
+        plays_before = self.renderer.num_plays
+        self.play(animation)
+        assert self.renderer.num_plays - plays_before == 1, "Fade should be a single play"
+        assert animation.mobject not in self.mobjects, "Wrapper Group was left in the scene"
+        for block in blocks:
+            assert abs(block.visual_block.square.get_fill_opacity() - dag.config.fade_opacity) < 1e-6, \
+                f"Block {block.name} was not faded"
+
+        self.caption("All blocks faded in one animation")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Batch Style Animation Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestParentLineBatchUpdate(HUD2DScene):
+    """Test that moving many blocks updates all their lines with one shared animation."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+        blocks = dag.create_blocks_from_simulator_list(dag.simulate_blocks(10, 1, 1500), batch_size=5)
+
+        moved = blocks[1:6]
+        groups = [block.visual_block.animate_move_to(block.visual_block.get_center()[0], 2) for block in moved]
+        animations = dag.movement.deduplicate_line_animations(*groups)
+        batches = [anim for anim in animations if isinstance(anim, ParentLineBatchUpdate)]
+        assert len(batches) == 1, "Line updates should be merged into one batch"
+        assert not any(isinstance(anim, UpdateFromFunc) for anim in animations), "Per-line updaters remain"
+
+        self.play(*animations)
+        assert batches[0].mobject not in self.mobjects, "Wrapper Group was left in the scene"
+
+        # Every line ends where set_points_by_ends would put it
+        for line in batches[0].lines:
+            reference = Line(line.this_block.get_left(), line.parent_block.get_right(), buff=line.buff)
+            assert np.allclose(line.get_start(), reference.get_start(), atol=1e-6), "Line start is detached"
+            assert np.allclose(line.get_end(), reference.get_end(), atol=1e-6), "Line end is detached"
+
+        # Scaling is not a translation, its lines keep per-line updates
+        scaled = blocks[3].visual_block
+        animations = dag.movement.deduplicate_line_animations(
+            scaled.create_movement_animation(scaled.animate.scale(1.5))
+        )
+        assert not any(isinstance(anim, ParentLineBatchUpdate) for anim in animations), "Scaled block lines were batched"
+        self.play(*animations)
+        for line in scaled.parent_lines:
+            assert np.allclose(line.get_start(), scaled.square.get_left(), atol=line.buff + 1e-6), "Line left a scaled block"
+
+        self.caption("All lines followed their blocks")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("ParentLine Batch Update Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestChildLineRegistry(HUD2DScene):
+    """Test that every parent line is registered with its parent's child_lines."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+        blocks = dag.create_blocks_from_simulator_list(dag.simulate_blocks(10, 2, 1500), batch_size=5)
+
+        for block in dag.all_blocks:
+            for line, parent in block.get_parent_line_pairs():
+                assert line in parent.visual_block.child_lines, f"{block.name} line missing from {parent.name}"
+            for line in block.visual_block.child_lines:
+                assert line.parent_block is block.visual_block.square, f"Foreign line in {block.name} child_lines"
+
+        # Moving a block updates its parent and child lines, and nothing else
+        block = blocks[3]
+        group = block.visual_block.create_movement_animation(block.visual_block.animate.shift(UP * 0.5))
+        updated = {id(anim.mobject) for anim in group.animations if isinstance(anim, UpdateFromFunc)}
+        expected = {id(line) for line in block.visual_block.parent_lines + block.visual_block.child_lines}
+        assert updated == expected, "Movement did not update exactly the connected lines"
+        self.play(*dag.movement.deduplicate_line_animations(group))
+
+        self.caption("Child lines found without scanning children")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Child Line Registry Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestFlashLinePool(HUD2DScene):
+    """Test that flash overlays are reused between highlights instead of copied."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self)
+        blocks = dag.create_blocks_from_simulator_list(dag.simulate_blocks(10, 2, 1500), batch_size=5)
+        pool = dag.relationship_highlighter.flash_pool
+
+        dag.highlight_past(blocks[-1])
+        first_overlays = set(map(id, pool.overlays))
+        assert first_overlays, "Past highlight should flash lines"
+        self.wait(1)
+
+        dag.reset_highlighting()
+        assert not pool.overlays, "Reset left flash overlays in the scene"
+
+        # The same highlight again reuses every overlay from the pool
+        dag.highlight_past(blocks[-1])
+        assert set(map(id, pool.overlays)) == first_overlays, "Overlays were not reused"
+        self.wait(1)
+        dag.reset_highlighting()
+
+        # Combined mode draws every flashing segment with a single mobject
+        dag.apply_config({"combined_flash_overlay": True})
+        dag.highlight_anticone(blocks[5])
+        assert len(pool.overlays) <= 1, "Combined flash should use one overlay"
+        self.wait(1)
+        dag.reset_highlighting()
+
+        self.caption("Flash overlays pooled and reused")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Flash Line Pool Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestPredictiveCameraFollow(HUD2DScene):
+    """Test that batched creation follows the camera inside the creation play."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self, seed=5)
+        dag.add_block()
+
+        # A chain long enough to leave the frame, created in a single group
+        plays_before = self.renderer.num_plays
+        blocks = dag.create_blocks_batch([([i - 1] if i else [dag.genesis], None) for i in range(12)])
+        assert self.renderer.num_plays - plays_before == 1, "Camera follow should share the creation play"
+
+        # Rightmost block sits one margin inside the right edge of the frame
+        rightmost_x = blocks[-1].visual_block.square.get_center()[0]
+        right_edge = self.camera.frame.get_center()[0] + config["frame_width"] / 2
+        margin = dag.config.horizontal_spacing * 2
+        assert abs(right_edge - margin - rightmost_x) < 1e-3, "Camera did not end on the rightmost block"
+
+        # Tracked rightmost x matches a full recomputation
+        tracked = dag.movement.get_rightmost_x()
+        dag.movement.invalidate_rightmost_x()
+        assert abs(tracked - dag.movement.get_rightmost_x()) < 1e-6, "Rightmost x tracking drifted"
+
+        self.caption("Camera followed each block in one play")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Predictive Camera Follow Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestHistoryLOD(HUD2DScene):
+    """Test that history far behind the camera collapses into one summary mobject."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self, seed=6)
+        dag.apply_config({"lod_enabled": True, "lod_frames_behind": 0.5})
+        dag.add_block()
+
+        # A long chain scrolls the camera well past genesis
+        blocks = dag.create_blocks_batch([([i - 1] if i else [dag.genesis], None) for i in range(30)])
+
+        collapsed = set(dag.lod.collapsed)
+        assert dag.genesis in collapsed, "Genesis should be collapsed behind the camera"
+        assert not collapsed & set(dag.rendered_blocks), "Collapsed blocks should not be rendered"
+        assert dag.lod.summary in self.mobjects, "Summary should stand in for collapsed blocks"
+        assert dag.lod.summary.count == len(collapsed), "Summary count does not match"
+        assert blocks[-1].visual_block is not None, "Blocks in view must not be collapsed"
+
+        # Lines of the oldest rendered blocks point into the summary and must leave with it
+        boundary = [block for block in dag.rendered_blocks if any(p in collapsed for p in block.parents)]
+        assert boundary, "Expected rendered children of collapsed blocks"
+        for block in boundary:
+            for line in block.visual_block.parent_lines:
+                assert line in dag.lod.hidden_lines and line not in self.mobjects, "Line to collapsed parent still drawn"
+
+        self.caption(f"{len(collapsed)} blocks collapsed into one summary")
+        self.wait(2)
+
+        dag.rehydrate_history()
+        assert len(dag.rendered_blocks) == len(dag.all_blocks), "Rehydration should restore every block"
+        assert dag.lod.summary not in self.mobjects, "Summary should leave with the last collapsed block"
+        assert not dag.lod.hidden_lines, "Rehydration should restore every line"
+        assert all(line in self.mobjects for block in boundary for line in block.visual_block.parent_lines), \
+            "Lines to rehydrated parents should be drawn again"
+
+        self.clear_caption()
+        text = Text("History LOD Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestLabelCache(HUD2DScene):
+    """Test that repeated labels are copied from cached templates."""
+
+    def construct(self):
+        label_cache.clear()
+        dag = KaspaDAG(scene=self, seed=7)
+        dag.add_block()
+        dag.create_blocks_batch([([dag.genesis], None) for _ in range(3)])
+
+        # Every block shares one primer template, repeated label texts hit the cache
+        first = label_cache.get("B1", font_size=24, color=WHITE)
+        second = label_cache.get("B1", font_size=24, color=WHITE)
+        assert first is not second, "Cache must hand out copies"
+        assert np.allclose(first.points, second.points), "Copies should match the template"
+        assert label_cache.hits >= 1, "Repeated label did not hit the cache"
+
+        # A different style is a different entry
+        misses = label_cache.misses
+        label_cache.get("B1", font_size=24, color=YELLOW)
+        assert label_cache.misses == misses + 1, "Color should be part of the cache key"
+
+        self.caption(f"Label cache: {label_cache.hits} hits, {label_cache.misses} misses")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Label Cache Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestBlockPrototypes(HUD2DScene):
+    """Test that blocks are cloned from per-config square templates."""
+
+    def construct(self):
+        block_prototypes.clear()
+        dag = KaspaDAG(scene=self, seed=8)
+        dag.add_block()
+        blocks = dag.create_blocks_batch([([dag.genesis], None) for _ in range(3)])
+        assert len(block_prototypes) == 1, "Blocks of one config should share a template"
+
+        # Clones own their arrays and sit at their own positions
+        a, b = blocks[0].visual_block.square, blocks[1].visual_block.square
+        assert a.points is not b.points, "Clones must not share point arrays"
+        assert not np.allclose(a.get_center(), b.get_center()), "Clones were not moved into place"
+        assert np.allclose(a.fill_rgbas, b.fill_rgbas), "Clones should share the config style"
+
+        # A config change selects a new template
+        dag.apply_config({"fill_opacity": 0.6})
+        dag.add_block(parents=[blocks[0]])
+        assert len(block_prototypes) == 2, "Config change should build a new template"
+
+        self.caption("Blocks cloned from prototypes")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Block Prototype Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestSpriteMode(HUD2DScene):
+    """Test that idle blocks are drawn as sprites and animate as vectors."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self, seed=9)
+        dag.apply_config({"sprite_mode": True})
+        dag.add_block()
+        blocks = dag.create_blocks_batch([([dag.genesis], None) for _ in range(4)])
+
+        # After the creation play every idle block is a sprite
+        for block in blocks:
+            visual = block.visual_block
+            assert visual in dag.sprites.sprites, f"{block.name} should be rasterized"
+            assert visual not in self.mobjects, "Vector block should leave the scene"
+            assert dag.sprites.sprites[visual] in self.mobjects, "Sprite should be in the scene"
+
+        # Identical looking blocks share one rendered sprite image
+        assert len(dag.sprites.cache) <= len(blocks) + 1, "Sprites should be cached per look"
+
+        # Highlighting switches the involved blocks back to vectors
+        dag.highlight_past(blocks[0])
+        assert blocks[0].visual_block in self.mobjects, "Highlighted block should be drawn as a vector"
+        self.wait(1)
+        dag.reset_highlighting()
+
+        # Disabling the mode restores every vector block
+        dag.apply_config({"sprite_mode": False})
+        self.wait(0.1)
+        assert not dag.sprites.sprites, "Sprites should be gone with sprite_mode off"
+
+        self.caption("Idle blocks drawn as sprites")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Sprite Mode Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestBakedStaticLayer(HUD2DScene):
+    """Test that the static layer is baked once and reused across plays."""
+
+    def construct(self):
+        self.bake_static_layer()
+        dag = KaspaDAG(scene=self, seed=10)
+        dag.add_block()
+        blocks = dag.create_blocks_batch([([dag.genesis], None) for _ in range(3)])
+        tip = dag.add_block(parents=blocks)
+
+        # Only the animated block (and what is drawn above it) is moving
+        moving = self.get_moving_mobjects(tip.visual_block.animate.shift(UP * 0.5))
+        assert tip.visual_block in moving, "Animated block should be moving"
+        assert blocks[0].visual_block.parent_lines[0] not in moving, "Idle lines should be baked"
+
+        # Two plays over the same static content share one baked layer
+        dag.move([tip], [(tip.visual_block.get_center()[0], 1)])
+        count = self.renderer.baked_layer_count
+        assert count >= 1, "Static layer should have been baked"
+        dag.move([tip], [(tip.visual_block.get_center()[0], 0)])
+        assert self.renderer.baked_layer_count == count, "Unchanged static layer should be reused"
+
+        self.caption("Static layer baked and reused")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("Baked Static Layer Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestBakedLayerFlashLines(HUD2DScene):
+    """Test that every flash overlay keeps moving while the static layer is baked."""
+
+    def construct(self):
+        self.bake_static_layer()
+        dag = KaspaDAG(scene=self, seed=10)
+        dag.apply_config({"flash_connections": True, "combined_flash_overlay": False})
+        dag.add_block()
+        blocks = dag.create_blocks_batch([([dag.genesis], None) for _ in range(3)])
+        tip = dag.add_block(parents=blocks)
+
+        dag.highlight_past(tip)
+        overlays = dag.relationship_highlighter.flash_pool.overlays
+        assert len(overlays) >= 2, "Expected at least two flashing lines"
+
+        moving = self.get_moving_mobjects(Wait(0.1))
+        for overlay in overlays:
+            assert overlay in moving, "Flash overlay was baked into the static layer"
+
+        before = [overlay.points.copy() for overlay in overlays]
+        self.wait(0.5)
+        for overlay, points in zip(overlays, before):
+            assert not np.allclose(overlay.points, points), "Flash overlay froze"
+
+        self.caption("Flash overlays animate over the baked layer")
+        self.wait(1)
+        dag.reset_highlighting()
+
+        self.clear_caption()
+        text = Text("Baked Layer Flash Lines Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestDAGLineLayer(HUD2DScene):
+    """Test that idle lines are merged per style and split out when animated."""
+
+    def construct(self):
+        dag = KaspaDAG(scene=self, seed=11)
+        dag.apply_config({"merge_idle_lines": True})
+        dag.add_block()
+        blocks = dag.create_blocks_batch([([dag.genesis], None) for _ in range(3)])
+        tip = dag.add_block(parents=blocks)
+
+        # All lines idle: drawn by at most one layer per style class
+        layer = dag.line_layer
+        all_lines = [line for block in dag.all_blocks for line in block.visual_block.parent_lines]
+        assert layer.merged == set(all_lines), "Every idle line should be merged"
+        assert not any(line in self.mobjects for line in all_lines), "Merged lines should leave the scene"
+        assert len(layer.layers) == 2, "Selected and other parent lines are separate style classes"
+        assert sum(len(mob.points) for mob in layer.layers.values()) == sum(len(line.points) for line in all_lines)
+
+        # Moving the tip splits its lines out for the play and merges them again after
+        dag.move([tip], [(tip.visual_block.get_center()[0], 1)])
+        assert set(tip.visual_block.parent_lines) <= layer.merged, "Lines should be merged again when idle"
+
+        # Highlighted lines get their own style class
+        dag.highlight_past(tip)
+        self.wait(1)
+        dag.reset_highlighting()
+
+        self.caption("Idle lines merged per style")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("DAG Line Layer Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)
+
+class TestHUDCameraRenderOrder(HUD2DScene):
+    """Test that the render order is cached and rebuilt when the scene changes."""
+
+    def construct(self):
+        assert isinstance(self.camera, HUDCamera), "HUD2DScene should use HUDCamera"
+        dag = KaspaDAG(scene=self, seed=12)
+        dag.add_block()
+        dag.create_blocks_batch([([dag.genesis], None) for _ in range(3)])
+
+        # Same order as Manim's z-index sort, and reused while nothing changes
+        order = self.camera.get_mobjects_to_display(self.mobjects)
+        expected = sorted(
+            remove_list_redundancies([m for mob in self.mobjects for m in mob.family_members_with_points()]),
+            key=lambda m: m.z_index,
+        )
+        assert order == expected, "Render order should match a stable z-index sort"
+        assert self.camera.get_mobjects_to_display(self.mobjects) == order, "Cached order changed"
+
+        # Adding a mobject invalidates the cached order
+        marker = Dot().set_z_index(100)
+        self.add(marker)
+        assert self.camera.get_mobjects_to_display(self.mobjects)[-1] is marker, "New mobject missing from order"
+
+        self.caption("Render order cached per play")
+        self.wait(2)
+
+        self.clear_caption()
+        text = Text("HUD Camera Render Order Test Passed", color=GREEN).to_edge(UP)
+        self.play(Write(text))
+        self.wait(2)